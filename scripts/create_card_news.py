@@ -7,12 +7,11 @@
 
 import os
 import sys
+import time
 from pathlib import Path
 from dotenv import load_dotenv
-import requests
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
-import textwrap
+from PIL import Image
 
 # 프로젝트 루트 설정
 project_root = Path(__file__).parent.parent
@@ -21,6 +20,15 @@ sys.path.insert(0, str(project_root))
 # 환경 변수 로드
 load_dotenv(project_root / ".env")
 
+from src.core.config import settings
+from src.integrations.llm_cache import get_llm_cache, request_key
+from src.integrations.model_router import get_model_router
+from src.integrations.openai_client import get_openai_client
+from src.services.card_renderer import get_card_renderer
+from src.services.tts_service import TTSService, VoiceJob
+from src.services.video_service import EncodeSettings, Scene, VideoService
+from src.utils.audio_utils import assemble_audio_track, split_audio_track
+
 # 필요한 디렉토리 생성
 TEMP_DIR = project_root / "temp"
 OUTPUT_DIR = project_root / "output"
@@ -52,9 +60,8 @@ class CardNewsGenerator:
         print(f"\n🔍 1단계: 웹에서 '{keyword}' 트렌드 검색 중...")
         
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=self.openai_key)
+            # 프로세스 전역 클라이언트 (공유 커넥션 풀 재사용)
+            client = get_openai_client(self.openai_key)
             
             # GPT에게 최신 정보 요청 (실제로는 웹 API 사용해야 하지만 프로토타입에서는 GPT 사용)
             prompt = f"""
@@ -79,8 +86,12 @@ class CardNewsGenerator:
 카드는 5-7개로 구성하고, 각 카드는 핵심만 간결하게 작성하세요.
 """
             
-            response = client.chat.completions.create(
-                model="gpt-4",
+            # 작업 등급/최근 지연 시간(p95)에 맞춰 모델 선택
+            router = get_model_router()
+            route = router.route("card_news")
+            
+            request = dict(
+                model=route.model,
                 messages=[
                     {
                         "role": "system",
@@ -95,8 +106,21 @@ class CardNewsGenerator:
                 temperature=0.7
             )
             
+            # LLM_CACHE_TTL에 card_news를 켠 경우에만 같은 키워드/프롬프트의 응답을 재사용
+            cache = get_llm_cache()
+            cache_key = request_key(request)
+            content = cache.get("card_news", cache_key) if cache is not None else None
+            from_cache = content is not None
+            
+            if not from_cache:
+                started = time.monotonic()
+                response = client.chat.completions.create(**request)
+                router.record(route, time.monotonic() - started)
+                content = response.choices[0].message.content.strip()
+            else:
+                print("  ♻️  캐시된 응답 사용")
+            
             import json
-            content = response.choices[0].message.content.strip()
             
             # JSON 추출
             if '{' in content and '}' in content:
@@ -104,6 +128,10 @@ class CardNewsGenerator:
                 json_end = content.rindex('}') + 1
                 data = json.loads(content[json_start:json_end])
                 
+                # 읽을 수 있는 응답만 캐시
+                if cache is not None and not from_cache:
+                    cache.put("card_news", cache_key, content)
+                
                 print(f"✅ 트렌드 정보 수집 완료!")
                 print(f"📰 제목: {data.get('title', '')}")
                 print(f"🎴 카드: {len(data.get('cards', []))}개")
@@ -132,7 +160,7 @@ class CardNewsGenerator:
         card_type: str = "content"
     ) -> str:
         """
-        카드 이미지 생성
+        카드 이미지 파일 생성
         
         Args:
             card_data: 카드 데이터
@@ -143,177 +171,91 @@ class CardNewsGenerator:
         Returns:
             생성된 이미지 경로
         """
-        # 릴스 사이즈
-        width = 1080
-        height = 1920
+        img = self.render_card_image(card_data, total_cards, card_type)
         
-        # 배경색 (그라디언트 느낌)
-        if card_type == "title":
-            bg_color = (138, 43, 226)  # 보라색
-            text_color = (255, 255, 255)
-        elif card_type == "ending":
-            bg_color = (255, 20, 147)  # 핑크
-            text_color = (255, 255, 255)
-        else:
-            # 카드 번호에 따라 색상 변경
-            colors = [
-                (100, 149, 237),  # 블루
-                (255, 127, 80),   # 코랄
-                (72, 209, 204),   # 터콰이즈
-                (255, 215, 0),    # 골드
-                (147, 112, 219),  # 퍼플
-            ]
-            idx = (card_data.get('number', 1) - 1) % len(colors)
-            bg_color = colors[idx]
-            text_color = (255, 255, 255)
+        # 저장
+        img.save(output_path, 'JPEG', quality=100)
         
-        # 이미지 생성
-        img = Image.new('RGB', (width, height), bg_color)
-        draw = ImageDraw.Draw(img)
+        return str(output_path)
+    
+    def render_card_image(
+        self,
+        card_data: dict,
+        total_cards: int,
+        card_type: str = "content"
+    ) -> Image.Image:
+        """
+        카드 이미지를 메모리에 생성 (파일로 저장하지 않음)
         
-        try:
-            # 한글 폰트 (macOS)
-            title_font = ImageFont.truetype("/System/Library/Fonts/Supplemental/AppleGothic.ttf", 70)
-            content_font = ImageFont.truetype("/System/Library/Fonts/Supplemental/AppleGothic.ttf", 45)
-            small_font = ImageFont.truetype("/System/Library/Fonts/Supplemental/AppleGothic.ttf", 35)
-        except:
-            # 폰트 로드 실패 시 기본 폰트
-            title_font = ImageFont.load_default()
-            content_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
+        Args:
+            card_data: 카드 데이터
+            total_cards: 총 카드 수
+            card_type: 카드 타입 (title, content, ending)
         
-        # 타이틀 카드
-        if card_type == "title":
-            title = card_data.get('title', '제목')
-            
-            # 제목 중앙 정렬
-            lines = textwrap.wrap(title, width=15)
-            y = height // 2 - (len(lines) * 80)
-            
-            for line in lines:
-                bbox = draw.textbbox((0, 0), line, font=title_font)
-                text_width = bbox[2] - bbox[0]
-                x = (width - text_width) // 2
-                
-                # 텍스트 그림자
-                draw.text((x+3, y+3), line, font=title_font, fill=(0, 0, 0))
-                # 텍스트
-                draw.text((x, y), line, font=title_font, fill=text_color)
-                y += 100
+        Returns:
+            1080x1920 RGB 이미지
+        """
+        # 폰트와 배경 템플릿은 렌더러가 프로세스 단위로 캐시
+        return get_card_renderer().render(card_data, total_cards, card_type)
+    
+    def narration_texts(self, title: str, cards: list) -> list:
+        """카드 이미지 순서(타이틀, 카드들, 엔딩)대로 읽을 텍스트"""
+        texts = [title]
+        texts += [f"{card.get('title', '')}. {card.get('content', '')}" for card in cards]
+        texts.append("팔로우와 좋아요 부탁드려요!")
+        return texts
+    
+    def generate_deck_narration(self, title: str, cards: list, output_dir: Path):
+        """
+        덱 전체 내레이션을 요청 한 번으로 생성 (카드 경계는 글자별 시각 정보로 계산)
         
-        # 콘텐츠 카드
-        elif card_type == "content":
-            # 카드 번호
-            number = card_data.get('number', 1)
-            draw.text((50, 100), f"#{number}/{total_cards}", font=small_font, fill=(255, 255, 255, 200))
-            
-            # 카드 제목
-            card_title = card_data.get('title', '제목')
-            lines = textwrap.wrap(card_title, width=20)
-            y = 400
-            
-            for line in lines:
-                bbox = draw.textbbox((0, 0), line, font=title_font)
-                text_width = bbox[2] - bbox[0]
-                x = (width - text_width) // 2
-                
-                # 텍스트 그림자
-                draw.text((x+2, y+2), line, font=title_font, fill=(0, 0, 0))
-                draw.text((x, y), line, font=title_font, fill=text_color)
-                y += 90
-            
-            # 카드 내용
-            content = card_data.get('content', '')
-            content_lines = textwrap.wrap(content, width=25)
-            y += 100
-            
-            for line in content_lines[:6]:  # 최대 6줄
-                bbox = draw.textbbox((0, 0), line, font=content_font)
-                text_width = bbox[2] - bbox[0]
-                x = (width - text_width) // 2
-                
-                draw.text((x, y), line, font=content_font, fill=text_color)
-                y += 60
+        Args:
+            title: 메인 제목
+            cards: 카드 데이터 리스트
+            output_dir: 저장 디렉토리
         
-        # 엔딩 카드
-        else:
-            text = "팔로우 & 좋아요\n부탁드려요! 💖"
-            lines = text.split('\n')
-            y = height // 2 - 100
-            
-            for line in lines:
-                bbox = draw.textbbox((0, 0), line, font=title_font)
-                text_width = bbox[2] - bbox[0]
-                x = (width - text_width) // 2
-                
-                draw.text((x+2, y+2), line, font=title_font, fill=(0, 0, 0))
-                draw.text((x, y), line, font=title_font, fill=text_color)
-                y += 100
+        Returns:
+            DeckNarration (실패 시 None)
+        """
+        print(f"\n🎙️  3단계: 덱 전체 음성 한 번에 생성 중... ({len(cards) + 2}개 카드)")
         
-        # 저장
-        img.save(output_path, 'JPEG', quality=100)
+        tts = TTSService(voice="Sarah", api_key=self.elevenlabs_key)
+        narration = tts.synthesize_deck(self.narration_texts(title, cards), output_dir / "voice_deck.mp3")
         
-        return str(output_path)
+        if narration is None:
+            print("  ✗ 덱 음성 생성 실패, 카드별 생성으로 전환")
+        else:
+            print(f"✅ 덱 음성 생성 완료! (카드 경계: {', '.join(f'{t:.2f}' for t in narration.starts)}초)")
+        
+        return narration
     
-    def generate_voice_for_cards(self, cards: list, output_dir: Path) -> list:
+    def generate_voice_for_cards(self, title: str, cards: list, output_dir: Path) -> list:
         """
-        각 카드별로 음성 생성
+        타이틀 + 각 카드 + 엔딩 음성을 동시에 생성
         
         Args:
+            title: 메인 제목
             cards: 카드 데이터 리스트
             output_dir: 저장 디렉토리
         
         Returns:
-            음성 파일 경로 리스트
+            카드 이미지 순서와 같은 음성 파일 경로 리스트 (실패한 카드는 None)
         """
-        print(f"\n🎙️  3단계: 각 카드별 음성 생성 중...")
+        print(f"\n🎙️  3단계: 각 카드별 음성 생성 중... ({len(cards) + 2}개 동시 요청)")
         
-        # Sarah (밝고 귀여운) 음성 사용
-        voice_id = "EXAVITQu4vr4xnSDxMaL"
+        texts = self.narration_texts(title, cards)
+        names = ["title"] + [str(i) for i in range(1, len(cards) + 1)] + ["ending"]
+        jobs = [VoiceJob(text, output_dir / f"voice_{name}.mp3") for text, name in zip(texts, names)]
         
-        audio_files = []
+        # Sarah (밝고 귀여운) 음성 사용
+        tts = TTSService(voice="Sarah", api_key=self.elevenlabs_key)
+        audio_files = [str(path) if path else None for path in tts.synthesize_many(jobs)]
         
-        for i, card in enumerate(cards, 1):
-            try:
-                text = f"{card.get('title', '')}. {card.get('content', '')}"
-                
-                url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-                
-                headers = {
-                    "xi-api-key": self.elevenlabs_key,
-                    "Content-Type": "application/json"
-                }
-                
-                data = {
-                    "text": text,
-                    "model_id": "eleven_multilingual_v2",
-                    "voice_settings": {
-                        "stability": 0.3,
-                        "similarity_boost": 0.85,
-                        "style": 0.5,
-                        "use_speaker_boost": True
-                    }
-                }
-                
-                response = requests.post(
-                    url,
-                    json=data,
-                    headers=headers,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    audio_path = output_dir / f"voice_{i}.mp3"
-                    audio_path.write_bytes(response.content)
-                    audio_files.append(str(audio_path))
-                    print(f"  ✓ 카드 {i}/{len(cards)} 음성 생성 완료")
-                else:
-                    print(f"  ✗ 카드 {i} 음성 생성 실패")
-                    
-            except Exception as e:
-                print(f"  ✗ 카드 {i} 음성 생성 오류: {str(e)}")
+        for i, path in enumerate(audio_files):
+            if path is None:
+                print(f"  ✗ 카드 {i + 1}/{len(jobs)} 음성 생성 실패 (무음으로 대체)")
         
-        print(f"✅ 총 {len(audio_files)}개 음성 생성 완료!")
+        print(f"✅ 총 {sum(path is not None for path in audio_files)}개 음성 생성 완료!")
         
         return audio_files
     
@@ -323,17 +265,19 @@ class CardNewsGenerator:
         card_images: list,
         audio_files: list,
         title: str,
-        output_path: Path
+        output_path: Path,
+        narration=None
     ) -> str:
         """
         카드 뉴스 영상 생성 (고품질)
         
         Args:
             cards: 카드 데이터
-            card_images: 카드 이미지 경로 리스트
+            card_images: 카드 이미지 리스트 (Pillow 이미지 또는 파일 경로)
             audio_files: 음성 파일 경로 리스트
             title: 제목
             output_path: 출력 경로
+            narration: 덱 전체 내레이션 (지정하면 audio_files 대신 카드 경계에서 나눠 사용)
         
         Returns:
             생성된 영상 경로
@@ -341,93 +285,58 @@ class CardNewsGenerator:
         print(f"\n🎬 4단계: 고품질 카드 뉴스 영상 생성 중...")
         
         try:
-            import subprocess
-            
-            # 각 음성 파일의 길이 확인
-            def get_audio_duration(audio_path):
-                try:
-                    result = subprocess.run(
-                        ['ffprobe', '-v', 'error', '-show_entries',
-                         'format=duration', '-of',
-                         'default=noprint_wrappers=1:nokey=1', audio_path],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE
-                    )
-                    return float(result.stdout)
-                except:
-                    return 3.0  # 기본 3초
-            
-            # 각 카드를 음성 길이만큼 영상으로 변환
-            video_clips = []
-            
-            for i, (img_path, audio_path) in enumerate(zip(card_images, audio_files), 1):
-                duration = get_audio_duration(audio_path)
-                clip_path = TEMP_DIR / f"card_clip_{i}.mp4"
-                
-                # 이미지 + 음성을 영상 클립으로 변환 (고품질)
-                cmd = [
-                    'ffmpeg', '-y',
-                    '-loop', '1',
-                    '-i', img_path,
-                    '-i', audio_path,
-                    '-t', str(duration),
-                    '-vf', 'fps=30,format=yuv420p',
-                    '-c:v', 'libx264',
-                    '-preset', 'slow',      # 고품질 인코딩
-                    '-crf', '18',           # 높은 품질 (낮을수록 좋음, 18=매우 좋음)
-                    '-b:v', '8M',           # 비트레이트 8Mbps
-                    '-c:a', 'aac',
-                    '-b:a', '192k',         # 오디오 비트레이트
-                    '-shortest',
-                    str(clip_path)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    video_clips.append(str(clip_path))
-                    print(f"  ✓ 카드 {i}/{len(card_images)} 클립 생성 ({duration:.1f}초)")
-                else:
-                    print(f"  ✗ 카드 {i} 클립 생성 실패")
-            
-            if not video_clips:
-                print("❌ 생성된 클립이 없습니다!")
+            if not card_images:
+                print("❌ 생성된 장면이 없습니다!")
                 return None
             
-            # 모든 클립을 하나로 합치기
-            concat_file = TEMP_DIR / "card_concat.txt"
-            with open(concat_file, 'w') as f:
-                for clip_path in video_clips:
-                    f.write(f"file '{clip_path}'\n")
-            
-            print(f"\n🎥 {len(video_clips)}개 클립 합치는 중...")
+            renderer = VideoService()
+            
+            # 카드 음성을 PCM으로 디코딩해 샘플 단위로 이어붙인 하나의 트랙으로 조립
+            # (카드 길이는 영상 프레임 단위로 맞추고, AAC 인코딩은 마지막에 한 번만)
+            track_path = TEMP_DIR / f"narration_{datetime.now().strftime('%Y%m%d_%H%M%S')}.wav"
+            if narration is not None:
+                # 한 번에 합성한 덱 내레이션을 카드 경계 시각에서 나눔
+                track = split_audio_track(
+                    narration.path,
+                    narration.starts[:len(card_images)],
+                    track_path,
+                    frame_rate=renderer.fps
+                )
+            else:
+                track = assemble_audio_track(
+                    audio_files[:len(card_images)],
+                    track_path,
+                    frame_rate=renderer.fps,
+                    fallback_duration=3.0  # 디코딩 실패 시 기본 3초
+                )
             
-            cmd = [
-                'ffmpeg', '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', str(concat_file),
-                '-c', 'copy',
-                str(output_path)
-            ]
+            # 각 카드를 음성 길이만큼 노출하는 장면으로 구성
+            scenes = []
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            for i, (card_image, offset, duration) in enumerate(
+                zip(card_images, track.offsets, track.durations), 1
+            ):
+                scenes.append(Scene(image=card_image, duration=duration))
+                print(f"  ✓ 카드 {i}/{len(card_images)} 장면 구성 ({offset:.2f}초부터 {duration:.2f}초)")
             
-            if result.returncode != 0:
-                print(f"❌ 영상 합치기 실패: {result.stderr[:200]}")
-                return None
+            print(f"\n🎥 {len(scenes)}개 카드 클립을 병렬 인코딩하는 중...")
             
-            # 임시 파일 정리
-            for clip in video_clips:
-                try:
-                    os.remove(clip)
-                except:
-                    pass
+            # 카드별 클립을 ffmpeg 풀에서 병렬로 고품질 인코딩한 뒤 스트림 복사로 합치기
+            encode = EncodeSettings(
+                preset='slow',          # 고품질 인코딩
+                crf=18,                 # 높은 품질 (낮을수록 좋음, 18=매우 좋음)
+                audio_bitrate='192k'    # 오디오 비트레이트
+            )
             
             try:
-                os.remove(concat_file)
-            except:
-                pass
+                renderer.render_segments(
+                    scenes,
+                    output_path,
+                    audio_path=str(track.path),
+                    encode=encode
+                )
+            finally:
+                track.path.unlink(missing_ok=True)
             
             print(f"✅ 고품질 영상 생성 완료!")
             print(f"📁 저장 위치: {output_path}")
@@ -463,56 +372,23 @@ class CardNewsGenerator:
                 print("❌ 카드 데이터가 없습니다!")
                 return None
             
-            # 2. 카드 이미지 생성
+            # 2. 카드 이미지 생성 (메모리에서 바로 렌더러로 전달, 파일 저장 없음)
             print(f"\n🎴 2단계: 카드 이미지 생성 중... ({len(cards)}개)")
             
-            card_images = []
-            
-            # 타이틀 카드
-            title_img_path = TEMP_DIR / "card_title.jpg"
-            self.create_card_image(
-                {'title': title}, 
-                len(cards),
-                title_img_path,
-                'title'
-            )
-            card_images.append(str(title_img_path))
-            print(f"  ✓ 타이틀 카드 생성 완료")
-            
-            # 콘텐츠 카드들
-            for i, card in enumerate(cards, 1):
-                img_path = TEMP_DIR / f"card_{i}.jpg"
-                self.create_card_image(card, len(cards), img_path, 'content')
-                card_images.append(str(img_path))
-                print(f"  ✓ 카드 {i}/{len(cards)} 생성 완료")
-            
-            # 엔딩 카드
-            ending_img_path = TEMP_DIR / "card_ending.jpg"
-            self.create_card_image(
-                {'title': '감사합니다'}, 
-                len(cards),
-                ending_img_path,
-                'ending'
-            )
-            card_images.append(str(ending_img_path))
-            print(f"  ✓ 엔딩 카드 생성 완료")
+            # 타이틀 + 콘텐츠 카드들 + 엔딩 카드를 동시에 렌더링
+            card_images = get_card_renderer().render_deck(title, cards)
             
             print(f"✅ 총 {len(card_images)}개 카드 이미지 생성 완료!")
             
-            # 3. 각 카드별 음성 생성
-            # 타이틀 음성
-            title_audio = TEMP_DIR / "voice_title.mp3"
-            self.generate_single_voice(title, title_audio)
-            audio_files = [str(title_audio)]
-            
-            # 카드 음성들
-            card_audios = self.generate_voice_for_cards(cards, TEMP_DIR)
-            audio_files.extend(card_audios)
+            # 3. 음성 생성: 덱 전체를 한 번에 (실패하거나 꺼져 있으면 카드별 동시 요청)
+            narration = None
+            if settings.CARD_DECK_NARRATION:
+                narration = self.generate_deck_narration(title, cards, TEMP_DIR)
             
-            # 엔딩 음성
-            ending_audio = TEMP_DIR / "voice_ending.mp3"
-            self.generate_single_voice("팔로우와 좋아요 부탁드려요!", ending_audio)
-            audio_files.append(str(ending_audio))
+            if narration is not None:
+                audio_files = [str(narration.path)]
+            else:
+                audio_files = self.generate_voice_for_cards(title, cards, TEMP_DIR)
             
             # 4. 영상 합성
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -524,18 +400,13 @@ class CardNewsGenerator:
                 card_images,
                 audio_files,
                 title,
-                final_output
+                final_output,
+                narration=narration
             )
             
             # 임시 파일 정리
             print("\n🧹 임시 파일 정리 중...")
-            for img in card_images:
-                try:
-                    os.remove(img)
-                except:
-                    pass
-            
-            for audio in audio_files:
+            for audio in filter(None, audio_files):
                 try:
                     os.remove(audio)
                 except:
@@ -548,45 +419,6 @@ class CardNewsGenerator:
             import traceback
             traceback.print_exc()
             return None
-    
-    def generate_single_voice(self, text: str, output_path: Path) -> str:
-        """단일 음성 생성"""
-        try:
-            voice_id = "EXAVITQu4vr4xnSDxMaL"  # Sarah
-            
-            url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-            
-            headers = {
-                "xi-api-key": self.elevenlabs_key,
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "text": text,
-                "model_id": "eleven_multilingual_v2",
-                "voice_settings": {
-                    "stability": 0.3,
-                    "similarity_boost": 0.85,
-                    "style": 0.5,
-                    "use_speaker_boost": True
-                }
-            }
-            
-            response = requests.post(
-                url,
-                json=data,
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                output_path.write_bytes(response.content)
-                return str(output_path)
-            
-        except Exception as e:
-            print(f"  ✗ 음성 생성 실패: {str(e)}")
-        
-        return None
 
 
 def main():
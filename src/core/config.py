@@ -0,0 +1,104 @@
+"""
+환경 설정
+
+.env 파일과 환경 변수에서 설정 값을 읽어옵니다.
+"""
+
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class Settings(BaseSettings):
+    """애플리케이션 설정 (config/*.env.example 참고)"""
+
+    model_config = SettingsConfigDict(
+        env_file=PROJECT_ROOT / ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    # ===== 영상 설정 =====
+    VIDEO_OUTPUT_WIDTH: int = 1080
+    VIDEO_OUTPUT_HEIGHT: int = 1920
+    VIDEO_FPS: int = 30
+    VIDEO_CODEC: str = "libx264"
+    VIDEO_PRESET: str = "medium"
+    VIDEO_CRF: int = 23
+    VIDEO_STILL_PROFILE: bool = True  # 정지 장면은 정지 이미지 전용 x264 설정으로 인코딩
+    AUDIO_CODEC: str = "aac"
+    AUDIO_BITRATE: str = "128k"
+
+    # ===== 외부 API =====
+    OPENAI_API_KEY: str = ""
+    OPENAI_MODEL: str = "gpt-4-turbo-preview"  # JSON 응답 형식(response_format) 지원 모델
+    OPENAI_MAX_TOKENS: int = 1200              # 콘텐츠 생성 응답 최대 토큰 (장면/자막/해시태그 JSON)
+    OPENAI_TEMPERATURE: float = 0.7
+
+    # ===== LLM 모델 라우팅 =====
+    LLM_MODEL_TIERS: dict[str, str] = {"fast": "gpt-4o-mini"}  # 등급 → 모델 ("standard" = OPENAI_MODEL)
+    LLM_TASK_TIERS: dict[str, str] = {"reel_content": "standard", "card_news": "standard"}
+    LLM_LATENCY_BUDGETS: dict[str, float] = {"reel_content": 20.0, "card_news": 25.0}  # 작업별 p95 예산 (초)
+    LLM_TIER_FALLBACKS: dict[str, str] = {"standard": "fast"}  # p95가 예산을 넘을 때 넘어갈 등급
+    LLM_LATENCY_WINDOW: float = 300.0  # p95 계산에 쓰는 최근 기록 범위 (초)
+    UNSPLASH_ACCESS_KEY: str = ""
+
+    # ===== 공유 HTTP 클라이언트 =====
+    HTTP_MAX_CONNECTIONS: int = 100      # 전체 커넥션 풀 크기
+    HTTP_MAX_PER_HOST: int = 10          # 호스트별 동시 요청 수
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0  # 유휴 커넥션 유지 시간 (초)
+    HTTP_TIMEOUT: float = 30.0
+    HTTP2_ENABLED: bool = False          # h2 패키지 필요 (httpx[http2])
+
+    # ===== 미디어 다운로드 =====
+    MEDIA_DOWNLOAD_CONCURRENCY: int = 6  # 작업 하나에서 동시에 받는 이미지 수
+    MEDIA_MAX_IMAGE_MB: int = 15         # 이미지 하나 최대 용량
+    MEDIA_MAX_JOB_MB: int = 80           # 작업 하나의 전체 다운로드 예산
+
+    # ===== ElevenLabs TTS =====
+    ELEVENLABS_API_KEY: str = ""
+    ELEVENLABS_BASE_URL: str = "https://api.elevenlabs.io/v1"  # 테스트 시 로컬 대체 서버 주소
+    ELEVENLABS_VOICE_ID: str = "21m00Tcm4TlvDq8ikWAM"
+    ELEVENLABS_MODEL_ID: str = "eleven_multilingual_v2"
+    ELEVENLABS_MAX_CONCURRENCY: int = 4         # 동시에 진행하는 합성 요청 수
+    ELEVENLABS_REQUESTS_PER_SECOND: float = 2.0  # 요청 시작 속도 제한 (0 = 제한 없음)
+    ELEVENLABS_TIMEOUT: float = 30.0
+    ELEVENLABS_MAX_RETRIES: int = 2             # 429/5xx 응답 재시도 횟수
+    TTS_CHUNK_MAX_CHARS: int = 120              # 긴 내레이션을 나눠 합성할 조각 최대 글자 수
+    TTS_SENTENCE_GAP: float = 0.25              # 이어붙인 문장 사이 무음 (초)
+
+    # ===== 카드 뉴스 =====
+    CARD_FONT_PATH: str = "/System/Library/Fonts/Supplemental/AppleGothic.ttf"
+    CARD_DECK_NARRATION: bool = True  # 덱 내레이션을 요청 한 번으로 합성 (False = 카드별 요청)
+
+    # ===== ffmpeg 실행 풀 =====
+    FFMPEG_POOL_SIZE: int = 0   # 동시 실행 ffmpeg 수 (0 = 스레드 예산 / 4)
+    FFMPEG_THREADS: int = 0     # 전체 ffmpeg 스레드 예산 (0 = CPU 코어 수)
+
+    # ===== 파일 경로 =====
+    TEMP_DIR: Path = PROJECT_ROOT / "temp"
+    OUTPUT_DIR: Path = PROJECT_ROOT / "output"
+    MEDIA_CACHE_DIR: Path = PROJECT_ROOT / "media_cache"
+
+    # ===== Redis =====
+    REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # ===== 캐시 =====
+    SEGMENT_CACHE_MAX_MB: int = 2048  # 인코딩된 세그먼트 캐시 용량 (0 = 사용 안 함)
+    TTS_CACHE_MAX_MB: int = 512       # 합성한 TTS 음성 캐시 용량 (0 = 사용 안 함)
+    TTS_CACHE_REDIS: bool = False     # Redis로 노드 간 TTS 음성 공유
+    TTS_CACHE_REDIS_TTL: int = 30 * 24 * 3600
+    IMAGE_SEARCH_CACHE_TTL: int = 6 * 3600  # 이미지 검색 결과 재사용 시간 (초, 0 = 사용 안 함)
+    IMAGE_CACHE_MAX_MB: int = 1024          # 내려받은 이미지 캐시 용량 (0 = 사용 안 함)
+    MEDIA_CACHE_REDIS: bool = False         # Redis로 노드 간 이미지 검색 결과 공유
+    LLM_CACHE_MAX_ENTRIES: int = 256        # 프로세스 내 LLM 응답 LRU 항목 수 (0 = 사용 안 함)
+    LLM_CACHE_REDIS: bool = False           # Redis로 노드 간 LLM 응답 공유
+    # 작업별 LLM 응답 재사용 시간 (초, 없는 작업은 캐시 안 함)
+    # reel_content/card_news는 temperature 0.7 창작 생성이라 기본값은 캐시 안 함 (명시적으로 켤 때만)
+    LLM_CACHE_TTL: dict[str, int] = {}
+
+
+settings = Settings()
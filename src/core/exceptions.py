@@ -0,0 +1,28 @@
+"""
+커스텀 예외 정의
+"""
+
+
+class ContentGenerationError(Exception):
+    """콘텐츠 생성 중 발생하는 에러"""
+    pass
+
+
+class MediaDownloadError(Exception):
+    """미디어 다운로드 중 발생하는 에러"""
+    pass
+
+
+class VideoRenderError(Exception):
+    """영상 렌더링 중 발생하는 에러"""
+    pass
+
+
+class MediaProbeError(Exception):
+    """미디어 길이/해상도 확인 중 발생하는 에러"""
+    pass
+
+
+class TTSGenerationError(Exception):
+    """음성 합성 중 발생하는 에러"""
+    pass
@@ -0,0 +1,375 @@
+"""
+ElevenLabs TTS 클라이언트
+
+공유 httpx 비동기 클라이언트로 연결을 재사용하고, 동시 요청 수(세마포어)와
+요청 시작 속도(최소 간격)를 함께 제한합니다. 제한은 이벤트 루프마다 하나를
+공유하므로 같은 루프에서 클라이언트를 여러 개 만들어도 (작업/덱마다 새로 열어도)
+프로세스 전체 요청이 공급자 제한을 넘지 않습니다. 여러 문장을 한 번에 요청해도
+결과는 입력 순서대로 돌려줍니다.
+
+스트리밍 모드(`/stream` 엔드포인트)는 도착하는 조각을 바로 파일에 쓰므로 음성
+전체를 메모리에 들고 있지 않고, 첫 조각이 도착하는 즉시 다음 단계를 시작할 수
+있습니다.
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+
+from src.core.config import settings
+from src.core.exceptions import TTSGenerationError
+from src.integrations.http_client import get_async_http_client
+
+logger = logging.getLogger(__name__)
+
+# 재시도할 HTTP 상태 코드 (요청 제한, 일시적 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 스트리밍 시 다음 단계에 알릴 최소 크기 (128kbps MP3 약 1초)
+STREAM_READY_BYTES = 16 * 1024
+
+
+@dataclass
+class SynthesisRequest:
+    """음성 합성 요청 하나"""
+
+    text: str
+    voice_id: str = field(default_factory=lambda: settings.ELEVENLABS_VOICE_ID)
+    model_id: str = field(default_factory=lambda: settings.ELEVENLABS_MODEL_ID)
+    voice_settings: dict | None = None
+    previous_text: str | None = None  # 앞뒤 문맥 (문장 단위로 나눠 합성할 때 억양 연결)
+    next_text: str | None = None
+
+    def payload(self) -> dict:
+        """API 요청 본문"""
+        data = {"text": self.text, "model_id": self.model_id}
+        if self.voice_settings:
+            data["voice_settings"] = self.voice_settings
+        if self.previous_text:
+            data["previous_text"] = self.previous_text
+        if self.next_text:
+            data["next_text"] = self.next_text
+        return data
+
+
+class RateLimiter:
+    """
+    요청 시작 간격 제한기
+
+    요청마다 다음 시작 시각을 예약하므로 동시에 대기 중인 요청이 많아도
+    초당 requests_per_second개를 넘지 않고 고르게 퍼집니다.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """다음 요청 시작 시각까지 대기"""
+        if not self.interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+@dataclass
+class _ProviderLimits:
+    """이벤트 루프 하나에서 공유하는 동시 요청 수/속도 제한"""
+
+    semaphore: asyncio.Semaphore
+    rate_limiter: RateLimiter
+
+
+# 이벤트 루프 → {(동시 요청 수, 초당 요청 수): 제한}
+_loop_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def _provider_limits(max_concurrency: int, requests_per_second: float) -> _ProviderLimits:
+    """
+    현재 이벤트 루프의 공유 제한을 반환합니다.
+
+    asyncio 세마포어/잠금은 한 루프에서만 쓸 수 있으므로 루프마다 (같은 제한
+    값끼리) 하나씩 둡니다 (src/integrations/http_client.py의 비동기 클라이언트와
+    같은 방식).
+    """
+    loop = asyncio.get_running_loop()
+    limits = _loop_limits.setdefault(loop, {})
+
+    key = (max_concurrency, requests_per_second)
+    if key not in limits:
+        limits[key] = _ProviderLimits(
+            asyncio.Semaphore(max_concurrency),
+            RateLimiter(requests_per_second)
+        )
+    return limits[key]
+
+
+class ElevenLabsClient:
+    """
+    ElevenLabs 비동기 TTS 클라이언트
+
+    하나의 이벤트 루프 안에서 사용합니다 (`async with`로 열고 닫기). 연결은
+    공유 HTTP 클라이언트(src/integrations/http_client.py)의 풀을, 동시 요청 수/속도
+    제한은 같은 루프의 다른 클라이언트와 함께 씁니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int | None = None,
+        requests_per_second: float | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        http_client: httpx.AsyncClient | None = None
+    ):
+        self.api_key = api_key or settings.ELEVENLABS_API_KEY
+        self.max_concurrency = max(1, max_concurrency or settings.ELEVENLABS_MAX_CONCURRENCY)
+        self.max_retries = settings.ELEVENLABS_MAX_RETRIES if max_retries is None else max_retries
+
+        if requests_per_second is None:
+            requests_per_second = settings.ELEVENLABS_REQUESTS_PER_SECOND
+
+        limits = _provider_limits(self.max_concurrency, requests_per_second)
+        self._semaphore = limits.semaphore
+        self._rate_limiter = limits.rate_limiter
+        self.base_url = settings.ELEVENLABS_BASE_URL.rstrip("/")
+        self.timeout = timeout or settings.ELEVENLABS_TIMEOUT
+        self._headers = {"xi-api-key": self.api_key}
+        self._client = http_client or get_async_http_client()
+
+    async def __aenter__(self) -> "ElevenLabsClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """정리 (공유 커넥션 풀은 닫지 않음)"""
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    async def synthesize(self, request: SynthesisRequest) -> bytes:
+        """
+        텍스트 하나를 음성(MP3)으로 합성합니다.
+
+        Args:
+            request: 합성 요청
+
+        Returns:
+            MP3 바이트
+
+        Raises:
+            TTSGenerationError: 재시도 후에도 실패한 경우
+        """
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._rate_limiter.wait()
+
+                try:
+                    response = await self._client.post(
+                        self._url(f"/text-to-speech/{request.voice_id}"),
+                        json=request.payload(),
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    )
+                except httpx.HTTPError as e:
+                    await self._retry_or_raise(attempt, error=e)
+                    continue
+
+                if response.status_code == 200:
+                    return response.content
+
+                await self._retry_or_raise(attempt, response=response)
+
+        raise TTSGenerationError("TTS 요청 실패")
+
+    async def synthesize_with_timestamps(self, request: SynthesisRequest) -> dict:
+        """
+        글자별 시각 정보와 함께 음성을 합성합니다 (`/with-timestamps`).
+
+        Args:
+            request: 합성 요청
+
+        Returns:
+            API 응답 JSON (audio_base64, alignment.characters,
+            alignment.character_start_times_seconds, alignment.character_end_times_seconds)
+
+        Raises:
+            TTSGenerationError: 재시도 후에도 실패했거나 응답 형식이 잘못된 경우
+        """
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._rate_limiter.wait()
+
+                try:
+                    response = await self._client.post(
+                        self._url(f"/text-to-speech/{request.voice_id}/with-timestamps"),
+                        json=request.payload(),
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    )
+                except httpx.HTTPError as e:
+                    await self._retry_or_raise(attempt, error=e)
+                    continue
+
+                if response.status_code == 200:
+                    try:
+                        data = response.json()
+                    except ValueError as e:
+                        raise TTSGenerationError(f"TTS 응답 형식 오류: {e}") from e
+                    if "audio_base64" not in data or not data.get("alignment"):
+                        raise TTSGenerationError("TTS 응답에 음성/시각 정보가 없습니다")
+                    return data
+
+                await self._retry_or_raise(attempt, response=response)
+
+        raise TTSGenerationError("TTS 요청 실패")
+
+    async def stream_to_file(
+        self,
+        request: SynthesisRequest,
+        output_path: str | Path,
+        on_ready: Callable[[Path], None] | None = None,
+        ready_bytes: int = STREAM_READY_BYTES
+    ) -> Path:
+        """
+        스트리밍 엔드포인트로 합성하며 도착하는 조각을 바로 파일에 씁니다.
+
+        응답을 받기 전(상태 코드 오류, 연결 실패)에만 재시도합니다. 쓰기 도중
+        실패하면 쓰던 파일을 지우고 예외를 올립니다.
+
+        Args:
+            request: 합성 요청
+            output_path: 저장 경로
+            on_ready: ready_bytes 이상 기록되면 (또는 더 짧은 음성이 끝나면) 한 번 호출
+            ready_bytes: on_ready를 호출할 기록 크기
+
+        Returns:
+            저장 경로
+
+        Raises:
+            TTSGenerationError: 재시도 후에도 실패한 경우
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.unlink(missing_ok=True)  # 파일이 있으면 쓰기를 시작했다는 뜻으로 사용
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._rate_limiter.wait()
+
+                try:
+                    async with self._client.stream(
+                        "POST",
+                        self._url(f"/text-to-speech/{request.voice_id}/stream"),
+                        json=request.payload(),
+                        headers=self._headers,
+                        timeout=self.timeout,
+                    ) as response:
+                        if response.status_code != 200:
+                            await response.aread()
+                        else:
+                            await _write_stream(response, output_path, on_ready, ready_bytes)
+                            return output_path
+                except httpx.HTTPError as e:
+                    if output_path.exists():
+                        # 쓰기 도중 끊긴 경우는 이미 다음 단계가 읽고 있을 수 있으므로 재시도하지 않음
+                        output_path.unlink()
+                        raise TTSGenerationError(f"TTS 스트리밍 중단: {e}") from e
+                    await self._retry_or_raise(attempt, error=e)
+                    continue
+
+                await self._retry_or_raise(attempt, response=response)
+
+        raise TTSGenerationError("TTS 요청 실패")
+
+    async def _retry_or_raise(
+        self,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None
+    ) -> None:
+        """재시도할 수 있으면 대기, 아니면 TTSGenerationError"""
+        if response is not None:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                raise TTSGenerationError(
+                    f"TTS 요청 실패: {response.status_code} {response.text[:200]}"
+                )
+            delay = _retry_after(response) or _backoff(attempt)
+            logger.warning("TTS %d 응답, %.1f초 후 재시도", response.status_code, delay)
+        else:
+            if attempt == self.max_retries:
+                raise TTSGenerationError(f"TTS 요청 실패: {error}") from error
+            delay = _backoff(attempt)
+
+        await asyncio.sleep(delay)
+
+    async def synthesize_many(
+        self,
+        requests: Sequence[SynthesisRequest]
+    ) -> list[bytes | Exception]:
+        """
+        여러 요청을 동시에 합성합니다 (동시 요청 수/속도 제한 적용).
+
+        Args:
+            requests: 합성 요청 리스트
+
+        Returns:
+            입력 순서대로 정렬된 결과 (실패한 항목은 예외 객체)
+        """
+        return await asyncio.gather(
+            *(self.synthesize(request) for request in requests),
+            return_exceptions=True
+        )
+
+
+async def _write_stream(
+    response: httpx.Response,
+    output_path: Path,
+    on_ready: Callable[[Path], None] | None,
+    ready_bytes: int
+) -> None:
+    """스트리밍 응답을 조각 단위로 파일에 기록"""
+    written = 0
+    notified = on_ready is None
+
+    with open(output_path, "wb") as f:
+        async for chunk in response.aiter_bytes():
+            f.write(chunk)
+            written += len(chunk)
+
+            if not notified and written >= ready_bytes:
+                # 다음 단계가 바로 읽을 수 있도록 디스크에 내보낸 뒤 알림
+                f.flush()
+                on_ready(output_path)
+                notified = True
+
+    if not notified:
+        on_ready(output_path)
+
+
+def _backoff(attempt: int) -> float:
+    """지수 백오프 대기 시간 (초)"""
+    return min(0.5 * 2 ** attempt, 8.0)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Retry-After 헤더 (초)"""
+    try:
+        return float(response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
@@ -0,0 +1,255 @@
+"""
+공유 HTTP 클라이언트
+
+외부 API(OpenAI, ElevenLabs, Unsplash)와 이미지 CDN 호출이 모두 같은
+커넥션 풀을 쓰도록 프로세스 전역 httpx 클라이언트를 제공합니다. 연결을
+keep-alive로 재사용하므로 요청마다 TCP/TLS 핸드셰이크를 다시 하지 않고,
+호스트별 동시 연결 수를 제한해 한 공급자가 풀을 독차지하지 않게 합니다.
+
+- 동기 코드: get_http_client()
+- 비동기 코드: get_async_http_client() (이벤트 루프별 클라이언트)
+- 동기 코드에서 코루틴 실행: run_sync() (프로세스 전역 백그라운드 루프에서
+  실행하므로 호출이 끝나도 비동기 커넥션 풀이 유지됨)
+
+HTTP/2는 HTTP2_ENABLED이고 h2 패키지가 설치된 경우에만 사용합니다.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+import httpx
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """응답 본문을 다 읽거나 닫을 때 호스트 슬롯을 반납하는 스트림"""
+
+    def __init__(self, stream: httpx.SyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """비동기 버전 _ReleasingStream"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class HostLimitedTransport(httpx.HTTPTransport):
+    """호스트별 동시 요청 수를 제한하는 전송 계층 (응답을 닫을 때까지 슬롯 유지)"""
+
+    def __init__(self, max_per_host: int, **kwargs):
+        super().__init__(**kwargs)
+        self.max_per_host = max_per_host
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        semaphore.acquire()
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, _once(semaphore.release)),
+            extensions=response.extensions,
+        )
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._semaphores[host]
+
+
+class AsyncHostLimitedTransport(httpx.AsyncHTTPTransport):
+    """비동기 버전 HostLimitedTransport (이벤트 루프 하나에서만 사용)"""
+
+    def __init__(self, max_per_host: int, **kwargs):
+        super().__init__(**kwargs)
+        self.max_per_host = max_per_host
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphores.setdefault(
+            request.url.host, asyncio.Semaphore(self.max_per_host)
+        )
+        await semaphore.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncReleasingStream(response.stream, _once(semaphore.release)),
+            extensions=response.extensions,
+        )
+
+
+def http2_available() -> bool:
+    """HTTP/2 사용 여부 (설정 + h2 패키지 설치)"""
+    if not settings.HTTP2_ENABLED:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED이지만 h2 패키지가 없어 HTTP/1.1 사용 (pip install httpx[http2])")
+        return False
+    return True
+
+
+def _client_options() -> dict:
+    """공유 클라이언트 공통 옵션"""
+    return {
+        "timeout": httpx.Timeout(settings.HTTP_TIMEOUT, connect=10.0),
+        "limits": httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        "http2": http2_available(),
+    }
+
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    프로세스 전역 동기 HTTP 클라이언트를 반환합니다 (스레드 안전).
+
+    Returns:
+        httpx.Client 인스턴스
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                options = _client_options()
+                transport = HostLimitedTransport(
+                    settings.HTTP_MAX_PER_HOST,
+                    limits=options.pop("limits"),
+                    http2=options.pop("http2"),
+                )
+                _client = httpx.Client(transport=transport, follow_redirects=True, **options)
+
+    return _client
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    현재 이벤트 루프의 공유 비동기 HTTP 클라이언트를 반환합니다.
+
+    httpx 비동기 커넥션은 만든 이벤트 루프에서만 쓸 수 있으므로 루프마다
+    클라이언트를 하나씩 둡니다. 동기 코드에서는 run_sync()로 실행하면 같은
+    루프(와 커넥션 풀)를 계속 재사용합니다.
+
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    loop = asyncio.get_running_loop()
+
+    client = _async_clients.get(loop)
+    if client is None:
+        options = _client_options()
+        transport = AsyncHostLimitedTransport(
+            settings.HTTP_MAX_PER_HOST,
+            limits=options.pop("limits"),
+            http2=options.pop("http2"),
+        )
+        client = httpx.AsyncClient(transport=transport, follow_redirects=True, **options)
+        _async_clients[loop] = client
+
+    return client
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    코루틴을 프로세스 전역 백그라운드 이벤트 루프에서 실행하고 결과를 기다립니다.
+
+    asyncio.run()과 달리 루프를 매번 새로 만들지 않으므로 비동기 커넥션 풀이
+    호출 사이에 유지됩니다. 여러 스레드에서 동시에 호출해도 됩니다.
+
+    Args:
+        coro: 실행할 코루틴
+
+    Returns:
+        코루틴 결과
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 이벤트 루프 (처음 호출 시 데몬 스레드에서 시작)"""
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="http-loop", daemon=True).start()
+
+    return _loop
+
+
+def _once(func):
+    """한 번만 실행되는 함수로 감쌈 (슬롯 중복 반납 방지)"""
+    lock = threading.Lock()
+    called = False
+
+    def wrapper():
+        nonlocal called
+        with lock:
+            if called:
+                return
+            called = True
+        func()
+
+    return wrapper
@@ -0,0 +1,181 @@
+"""
+LLM 응답 캐시
+
+같은 모델/프롬프트/샘플링 설정으로 보낸 요청의 응답을 재사용합니다. 프로세스
+안의 LRU(메모리)를 먼저 보고, LLM_CACHE_REDIS면 Redis에서 다른 워커/노드가
+받은 응답도 찾습니다. 유효 시간은 작업(task)별로 정하고 (LLM_CACHE_TTL),
+TTL이 없는 작업은 캐시하지 않습니다.
+
+프롬프트는 줄마다 앞뒤/연속 공백을 정리한 뒤 해시하므로 들여쓰기만 다른
+프롬프트는 같은 키가 됩니다. 파싱/검증에 성공한 응답만 저장하세요.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from src.core.config import settings
+from src.utils.cache import content_key, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 키에 포함하는 샘플링/응답 형식 파라미터 (stream 등 결과에 영향 없는 값은 제외)
+KEY_PARAMS = ("temperature", "top_p", "max_tokens", "response_format", "seed", "presence_penalty", "frequency_penalty")
+
+REDIS_KEY_PREFIX = "reelmacro:llm:"
+LLM_CACHE_VERSION = 1
+
+
+def normalize_prompt(text: str) -> str:
+    """
+    캐시 키용 프롬프트 정규화 (줄 단위 공백 정리, 빈 줄 제거).
+
+    Args:
+        text: 프롬프트
+
+    Returns:
+        정규화한 프롬프트
+    """
+    lines = (" ".join(line.split()) for line in text.strip().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def request_key(request: dict) -> str:
+    """
+    chat.completions.create() 인자로 캐시 키를 만듭니다.
+
+    Args:
+        request: model, messages와 샘플링 파라미터
+
+    Returns:
+        캐시 키
+    """
+    messages = [
+        {"role": message["role"], "content": normalize_prompt(message.get("content") or "")}
+        for message in request["messages"]
+    ]
+    params = {name: request[name] for name in KEY_PARAMS if name in request}
+
+    return content_key(
+        f"llm-v{LLM_CACHE_VERSION}",
+        request["model"],
+        json.dumps(messages, ensure_ascii=False),
+        json.dumps(params, sort_keys=True),
+    )
+
+
+class LLMCache:
+    """
+    LLM 응답 캐시 (프로세스 LRU + 선택적 Redis)
+
+    여러 스레드에서 함께 써도 됩니다. Redis 오류는 캐시 미스로 처리합니다.
+    """
+
+    def __init__(self, max_entries: int, ttls: dict[str, int], redis_client=None):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self.redis = redis_client
+
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl(self, task: str) -> int:
+        """작업의 유효 시간 (초, 0 = 캐시 안 함)"""
+        return max(0, self.ttls.get(task, 0))
+
+    def get(self, task: str, key: str) -> str | None:
+        """
+        캐시된 응답을 조회합니다 (메모리 → Redis 순).
+
+        Args:
+            task: 작업 이름 (TTL 구분)
+            key: request_key() 결과
+
+        Returns:
+            응답 텍스트 (없거나 만료됐으면 None)
+        """
+        if not self.ttl(task):
+            return None
+
+        entry_key = f"{task}:{key}"
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(entry_key)
+                    return entry[1]
+                del self._entries[entry_key]
+
+        if self.redis is None:
+            return None
+
+        try:
+            data = self.redis.get(REDIS_KEY_PREFIX + entry_key)
+            remaining = self.redis.ttl(REDIS_KEY_PREFIX + entry_key) if data else 0
+        except Exception as e:
+            logger.warning("Redis LLM 캐시 조회 실패: %s", e)
+            return None
+        if not data:
+            return None
+
+        text = data.decode("utf-8")
+        self._remember(entry_key, text, now + (remaining if remaining > 0 else self.ttl(task)))
+        return text
+
+    def put(self, task: str, key: str, text: str) -> None:
+        """
+        응답을 저장합니다 (TTL이 없는 작업은 무시).
+
+        Args:
+            task: 작업 이름
+            key: request_key() 결과
+            text: 응답 텍스트
+        """
+        ttl = self.ttl(task)
+        if not ttl:
+            return
+
+        entry_key = f"{task}:{key}"
+        self._remember(entry_key, text, time.time() + ttl)
+
+        if self.redis is not None:
+            try:
+                self.redis.set(REDIS_KEY_PREFIX + entry_key, text.encode("utf-8"), ex=ttl)
+            except Exception as e:
+                logger.warning("Redis LLM 캐시 저장 실패: %s", e)
+
+    def _remember(self, entry_key: str, text: str, expires_at: float) -> None:
+        """메모리 LRU에 저장하고 용량을 넘으면 가장 오래 쓰지 않은 항목 삭제"""
+        with self._lock:
+            self._entries[entry_key] = (expires_at, text)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_llm_cache: LLMCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache | None:
+    """
+    프로세스 전역 LLM 응답 캐시를 반환합니다.
+
+    Returns:
+        LLMCache (LLM_CACHE_MAX_ENTRIES=0이면 None)
+    """
+    global _llm_cache
+
+    if settings.LLM_CACHE_MAX_ENTRIES <= 0:
+        return None
+
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            redis_client = get_redis_client() if settings.LLM_CACHE_REDIS else None
+            _llm_cache = LLMCache(settings.LLM_CACHE_MAX_ENTRIES, settings.LLM_CACHE_TTL, redis_client)
+
+    return _llm_cache
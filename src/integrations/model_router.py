@@ -0,0 +1,182 @@
+"""
+LLM 모델 라우터
+
+작업(task)마다 모델 등급(tier)과 지연 시간 예산을 정하고, 최근 호출의 p95가
+예산을 넘으면 더 빠른 등급으로 돌립니다. 지연 기록은 최근 LLM_LATENCY_WINDOW초
+동안만 유지하므로 느린 기록이 빠지면 원래 등급으로 돌아옵니다.
+
+- 등급 → 모델: LLM_MODEL_TIERS ("standard"는 기본값 OPENAI_MODEL)
+- 작업 → 등급: LLM_TASK_TIERS
+- 작업별 p95 예산(초): LLM_LATENCY_BUDGETS
+- 느릴 때 넘어갈 등급: LLM_TIER_FALLBACKS
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIER = "standard"
+
+# p95를 믿을 수 있는 최소 기록 수
+MIN_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """작업 하나의 호출 경로"""
+
+    task: str
+    tier: str  # 빈 문자열이면 모델을 직접 지정한 경우 (지연 기록 안 함)
+    model: str
+
+
+class ModelRouter:
+    """
+    작업별 모델 등급 라우터 (스레드 안전)
+
+    지연 시간은 (작업, 등급)별로 기록합니다. 같은 등급이라도 작업마다 응답 길이가
+    달라 지연이 다르기 때문입니다.
+    """
+
+    def __init__(
+        self,
+        tiers: dict[str, str],
+        task_tiers: dict[str, str],
+        budgets: dict[str, float],
+        fallbacks: dict[str, str],
+        window: float = 300.0,
+        min_samples: int = MIN_SAMPLES
+    ):
+        self.tiers = tiers
+        self.task_tiers = task_tiers
+        self.budgets = budgets
+        self.fallbacks = fallbacks
+        self.window = window
+        self.min_samples = min_samples
+
+        self._samples: dict[tuple[str, str], deque[tuple[float, float]]] = {}
+        self._degraded: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def route(self, task: str) -> ModelRoute:
+        """
+        작업을 처리할 모델을 고릅니다.
+
+        설정된 등급의 p95가 예산을 넘으면 대체 등급으로, 대체 등급도 넘으면 그다음
+        대체 등급으로 넘어갑니다.
+
+        Args:
+            task: 작업 이름 (reel_content, card_news 등)
+
+        Returns:
+            ModelRoute
+        """
+        tier = self.task_tiers.get(task, DEFAULT_TIER)
+        visited = {tier}
+
+        while self._over_budget(task, tier):
+            fallback = self.fallbacks.get(tier)
+            if fallback is None or fallback in visited or fallback not in self.tiers:
+                break
+            tier = fallback
+            visited.add(tier)
+
+        return ModelRoute(task, tier, self.tiers.get(tier) or self.tiers[DEFAULT_TIER])
+
+    def record(self, route: ModelRoute, seconds: float) -> None:
+        """
+        성공한 호출의 지연 시간을 기록합니다.
+
+        Args:
+            route: route()로 받은 경로
+            seconds: 요청부터 응답 완료까지 걸린 시간
+        """
+        if not route.tier:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            samples = self._samples.setdefault((route.task, route.tier), deque())
+            samples.append((now, seconds))
+            self._trim(samples, now)
+
+    def p95(self, task: str, tier: str) -> float | None:
+        """
+        최근 window초 동안의 p95 지연 시간.
+
+        Args:
+            task: 작업 이름
+            tier: 등급
+
+        Returns:
+            p95 (초, 기록이 min_samples보다 적으면 None)
+        """
+        with self._lock:
+            samples = self._samples.get((task, tier))
+            if not samples:
+                return None
+            self._trim(samples, time.monotonic())
+            values = sorted(seconds for _, seconds in samples)
+
+        if len(values) < self.min_samples:
+            return None
+        return values[math.ceil(len(values) * 0.95) - 1]
+
+    def _over_budget(self, task: str, tier: str) -> bool:
+        """등급의 p95가 작업 예산을 넘는지 (넘기 시작/회복할 때 로그)"""
+        budget = self.budgets.get(task)
+        p95 = self.p95(task, tier) if budget else None
+        over = p95 is not None and p95 > budget
+
+        key = (task, tier)
+        with self._lock:
+            changed = over != (key in self._degraded)
+            if over:
+                self._degraded.add(key)
+            else:
+                self._degraded.discard(key)
+
+        if changed and over:
+            logger.warning("%s: %s 등급 p95 %.1f초 > 예산 %.1f초, 대체 등급 사용", task, tier, p95, budget)
+        elif changed:
+            logger.info("%s: %s 등급 지연 회복", task, tier)
+
+        return over
+
+    def _trim(self, samples: deque, now: float) -> None:
+        """window보다 오래된 기록 삭제 (잠금 안에서 호출)"""
+        while samples and now - samples[0][0] > self.window:
+            samples.popleft()
+
+
+_router: ModelRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_model_router() -> ModelRouter:
+    """
+    프로세스 전역 모델 라우터를 반환합니다.
+
+    Returns:
+        ModelRouter 인스턴스
+    """
+    global _router
+
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter(
+                tiers={DEFAULT_TIER: settings.OPENAI_MODEL, **settings.LLM_MODEL_TIERS},
+                task_tiers=settings.LLM_TASK_TIERS,
+                budgets=settings.LLM_LATENCY_BUDGETS,
+                fallbacks=settings.LLM_TIER_FALLBACKS,
+                window=settings.LLM_LATENCY_WINDOW,
+            )
+
+    return _router
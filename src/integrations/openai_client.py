@@ -0,0 +1,58 @@
+"""
+OpenAI 클라이언트
+
+OpenAI SDK 클라이언트를 프로세스당 한 번만 만들고, 공유 HTTP 클라이언트의
+커넥션 풀을 쓰도록 연결합니다. 호출할 때마다 OpenAI(api_key=...)를 새로 만들면
+요청마다 TLS 연결을 새로 맺습니다.
+"""
+
+import threading
+
+from src.core.config import settings
+from src.integrations.http_client import get_async_http_client, get_http_client
+
+_clients: dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def get_openai_client(api_key: str | None = None):
+    """
+    공유 동기 OpenAI 클라이언트를 반환합니다 (API 키별로 하나).
+
+    Args:
+        api_key: API 키 (기본값: OPENAI_API_KEY 설정)
+
+    Returns:
+        openai.OpenAI 인스턴스
+    """
+    from openai import OpenAI
+
+    key = api_key or settings.OPENAI_API_KEY
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = OpenAI(api_key=key, http_client=get_http_client())
+            _clients[key] = client
+
+    return client
+
+
+def get_async_openai_client(api_key: str | None = None):
+    """
+    현재 이벤트 루프의 공유 비동기 커넥션 풀을 쓰는 OpenAI 클라이언트를 반환합니다.
+
+    SDK 객체 생성 비용은 작으므로 캐시하지 않고, 커넥션 풀만 공유합니다.
+
+    Args:
+        api_key: API 키 (기본값: OPENAI_API_KEY 설정)
+
+    Returns:
+        openai.AsyncOpenAI 인스턴스
+    """
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(
+        api_key=api_key or settings.OPENAI_API_KEY,
+        http_client=get_async_http_client()
+    )
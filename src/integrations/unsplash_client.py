@@ -0,0 +1,120 @@
+"""
+Unsplash 클라이언트
+
+공유 HTTP 커넥션 풀로 Unsplash 검색 API를 호출합니다 (동기/비동기).
+이미지는 imgix 동적 리사이즈 파라미터로 필요한 크기만큼 잘라 받습니다.
+"""
+
+import httpx
+
+from src.core.config import settings
+from src.core.exceptions import MediaDownloadError
+from src.integrations.http_client import get_async_http_client, get_http_client
+
+API_BASE_URL = "https://api.unsplash.com"
+
+# imgix 리사이즈 파라미터 (w/h 크기로 채운 뒤 정보량이 많은 영역 기준 크롭)
+RENDITION_PARAMS = {"fit": "crop", "crop": "entropy", "fm": "jpg", "q": 80}
+
+
+class UnsplashClient:
+    """Unsplash API 클라이언트"""
+
+    provider = "unsplash"  # 캐시 키용 공급자 이름
+
+    def __init__(self, access_key: str | None = None, timeout: float = 10.0):
+        self.access_key = access_key or settings.UNSPLASH_ACCESS_KEY
+        self.timeout = timeout
+
+    def search_photos(self, query: str, per_page: int = 10, orientation: str | None = "portrait") -> list[dict]:
+        """
+        사진을 검색합니다.
+
+        Args:
+            query: 검색어
+            per_page: 결과 수
+            orientation: 방향 (portrait, landscape, squarish, None)
+
+        Returns:
+            API 결과(results) 리스트
+
+        Raises:
+            MediaDownloadError: 요청 실패 시
+        """
+        try:
+            response = get_http_client().get(
+                f"{API_BASE_URL}/search/photos",
+                params=self._search_params(query, per_page, orientation),
+                headers=self._headers(),
+                timeout=self.timeout,
+            )
+        except httpx.HTTPError as e:
+            raise MediaDownloadError(f"Unsplash 검색 실패: {e}") from e
+
+        return self._results(response)
+
+    async def asearch_photos(
+        self,
+        query: str,
+        per_page: int = 10,
+        orientation: str | None = "portrait"
+    ) -> list[dict]:
+        """
+        search_photos()의 비동기 버전.
+
+        Args:
+            query: 검색어
+            per_page: 결과 수
+            orientation: 방향 (portrait, landscape, squarish, None)
+
+        Returns:
+            API 결과(results) 리스트
+
+        Raises:
+            MediaDownloadError: 요청 실패 시
+        """
+        try:
+            response = await get_async_http_client().get(
+                f"{API_BASE_URL}/search/photos",
+                params=self._search_params(query, per_page, orientation),
+                headers=self._headers(),
+                timeout=self.timeout,
+            )
+        except httpx.HTTPError as e:
+            raise MediaDownloadError(f"Unsplash 검색 실패: {e}") from e
+
+        return self._results(response)
+
+    @staticmethod
+    def rendition_url(photo: dict, width: int, height: int) -> str:
+        """
+        검색 결과 사진을 지정한 크기로 잘라 주는 URL을 만듭니다.
+
+        Args:
+            photo: search_photos() 결과 항목
+            width: 이미지 너비
+            height: 이미지 높이
+
+        Returns:
+            imgix 리사이즈 URL (raw URL이 없으면 regular URL - 로컬 리사이즈 필요)
+        """
+        urls = photo.get("urls", {})
+        if not urls.get("raw"):
+            return urls["regular"]
+        return str(httpx.URL(urls["raw"]).copy_merge_params({"w": width, "h": height, **RENDITION_PARAMS}))
+
+    def _headers(self) -> dict:
+        return {"Authorization": f"Client-ID {self.access_key}", "Accept-Version": "v1"}
+
+    @staticmethod
+    def _search_params(query: str, per_page: int, orientation: str | None) -> dict:
+        params = {"query": query, "per_page": per_page}
+        if orientation:
+            params["orientation"] = orientation
+        return params
+
+    @staticmethod
+    def _results(response: httpx.Response) -> list[dict]:
+        if response.status_code != 200:
+            raise MediaDownloadError(f"Unsplash 오류: {response.status_code}")
+        return response.json().get("results", [])
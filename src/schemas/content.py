@@ -0,0 +1,108 @@
+"""
+릴스 콘텐츠 스키마
+
+대본 생성 한 번으로 장면 대본, 장면별 이미지 검색어(영어), 음성, 자막,
+해시태그를 함께 받기 위한 구조입니다. 모델이 일부 필드를 빠뜨리거나 형식을
+조금 어겨도 쓸 수 있는 값으로 보정합니다.
+"""
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+# 선택할 수 있는 음성 (src/services/tts_service.py VOICE_IDS와 같은 이름)
+VOICE_CHOICES = {
+    "Sarah": "밝고 귀여운 여성 목소리, 뷰티/패션/일상 콘텐츠에 적합",
+    "Rachel": "차분하고 지적인 여성 목소리, 교육/뉴스 콘텐츠에 적합",
+    "Adam": "활기차고 역동적인 남성 목소리, 스포츠/동기부여 콘텐츠에 적합",
+    "Bella": "친근하고 따뜻한 여성 목소리, 브이로그/일상 콘텐츠에 적합",
+    "Antoni": "전문적인 남성 목소리, 비즈니스/기술 콘텐츠에 적합",
+}
+DEFAULT_VOICE = "Sarah"
+
+MAX_SUBTITLES = 5
+MAX_HASHTAGS = 10
+
+
+class ReelScene(BaseModel):
+    """장면 하나"""
+
+    narration: str = Field(min_length=1, description="내레이션 (한국어)")
+    image_query: str = Field(default="", description="이미지 검색어 (짧은 영어)")
+
+    @field_validator("narration", "image_query", mode="before")
+    @classmethod
+    def _strip(cls, value):
+        return value.strip() if isinstance(value, str) else value
+
+
+class ReelContent(BaseModel):
+    """릴스 한 편의 콘텐츠"""
+
+    title: str = ""
+    search_keyword: str = Field(default="", description="키워드 전체 이미지 검색어 (영어)")
+    scenes: list[ReelScene] = Field(min_length=1)
+    voice: str = DEFAULT_VOICE
+    voice_reason: str = ""
+    subtitles: list[str] = Field(default_factory=list)
+    hashtags: list[str] = Field(default_factory=list)
+
+    @field_validator("voice", mode="before")
+    @classmethod
+    def _known_voice(cls, value):
+        # 대소문자는 무시하고, 목록에 없는 음성은 기본 음성으로
+        if isinstance(value, str):
+            for name in VOICE_CHOICES:
+                if name.lower() == value.strip().lower():
+                    return name
+        return DEFAULT_VOICE
+
+    @field_validator("subtitles", mode="before")
+    @classmethod
+    def _clean_subtitles(cls, value):
+        if not isinstance(value, list):
+            return []
+        return [line.strip() for line in value if isinstance(line, str) and line.strip()]
+
+    @field_validator("hashtags", mode="before")
+    @classmethod
+    def _clean_hashtags(cls, value):
+        if isinstance(value, str):
+            value = value.split()
+        if not isinstance(value, list):
+            return []
+
+        tags = []
+        for tag in value:
+            if not isinstance(tag, str):
+                continue
+            tag = "".join(tag.split()).lstrip("#")
+            if tag and f"#{tag}" not in tags:
+                tags.append(f"#{tag}")
+        return tags[:MAX_HASHTAGS]
+
+    @model_validator(mode="after")
+    def _fill_missing(self) -> "ReelContent":
+        # 빠진 검색어/자막은 다른 필드에서 채움
+        if not self.search_keyword:
+            self.search_keyword = next(
+                (scene.image_query for scene in self.scenes if scene.image_query), ""
+            )
+        for scene in self.scenes:
+            if not scene.image_query:
+                scene.image_query = self.search_keyword
+        if not self.subtitles:
+            self.subtitles = [scene.narration for scene in self.scenes]
+        self.subtitles = self.subtitles[:MAX_SUBTITLES]
+        return self
+
+    @property
+    def narration(self) -> str:
+        """음성으로 읽을 대본 (장면마다 한 줄)"""
+        return "\n".join(scene.narration for scene in self.scenes)
+
+    @property
+    def script(self) -> str:
+        """사람이 읽는 대본 ([장면 N] 내용 - 이미지: 검색어)"""
+        return "\n".join(
+            f"[장면 {i}] {scene.narration} - 이미지: {scene.image_query}"
+            for i, scene in enumerate(self.scenes, 1)
+        )
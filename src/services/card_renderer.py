@@ -0,0 +1,238 @@
+"""
+카드 이미지 렌더러
+
+카드 뉴스 카드(타이틀/콘텐츠/엔딩)를 그립니다. 폰트는 프로세스당 한 번만
+로드하고, 변하지 않는 배경 템플릿과 엔딩 카드는 미리 그려 두었다가 복사해서
+글자 레이어만 새로 그립니다. 줄바꿈과 가운데 정렬은 픽셀 폭 기준 레이아웃
+엔진(src/utils/text_layout.py)으로 한 번에 계산합니다.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.utils.text_layout import LineBox, layout_lines, load_font, wrap_text
+
+# 릴스 사이즈
+CARD_WIDTH = 1080
+CARD_HEIGHT = 1920
+
+TEXT_COLOR = (255, 255, 255)
+SHADOW_COLOR = (0, 0, 0)
+
+TITLE_BG_COLOR = (138, 43, 226)   # 보라색
+ENDING_BG_COLOR = (255, 20, 147)  # 핑크
+
+# 콘텐츠 카드는 번호에 따라 색상 변경
+CONTENT_BG_COLORS = [
+    (100, 149, 237),  # 블루
+    (255, 127, 80),   # 코랄
+    (72, 209, 204),   # 터콰이즈
+    (255, 215, 0),    # 골드
+    (147, 112, 219),  # 퍼플
+]
+
+ENDING_TEXT = "팔로우 & 좋아요\n부탁드려요! 💖"
+
+# 글자 영역 최대 폭 (좌우 여백 90px)
+TEXT_MAX_WIDTH = 900
+
+TITLE_FONT_SIZE = 70
+CONTENT_FONT_SIZE = 45
+SMALL_FONT_SIZE = 35
+
+
+class CardRenderer:
+    """
+    카드 뉴스 카드 렌더러
+
+    배경 템플릿은 인스턴스에 캐시되며, 여러 스레드에서 동시에 render()를
+    호출해도 안전합니다.
+    """
+
+    def __init__(self, font_path: str | None = None, max_workers: int = 4):
+        self.font_path = font_path
+        self.max_workers = max_workers
+
+        self._templates: dict[str, Image.Image] = {}
+        self._templates_lock = threading.Lock()
+
+    @property
+    def title_font(self) -> ImageFont.ImageFont:
+        return load_font(TITLE_FONT_SIZE, self.font_path)
+
+    @property
+    def content_font(self) -> ImageFont.ImageFont:
+        return load_font(CONTENT_FONT_SIZE, self.font_path)
+
+    @property
+    def small_font(self) -> ImageFont.ImageFont:
+        return load_font(SMALL_FONT_SIZE, self.font_path)
+
+    def render(self, card_data: dict, total_cards: int, card_type: str = "content") -> Image.Image:
+        """
+        카드 한 장을 그립니다.
+
+        Args:
+            card_data: 카드 데이터 (title, content, number)
+            total_cards: 총 카드 수
+            card_type: 카드 타입 (title, content, ending)
+
+        Returns:
+            1080x1920 RGB 이미지 (엔딩 카드는 캐시된 이미지를 그대로 반환하므로
+            수정하지 말 것)
+        """
+        if card_type == "ending":
+            return self._template("ending")
+
+        if card_type == "title":
+            img = self._template("title").copy()
+            self._draw_title(ImageDraw.Draw(img), card_data)
+            return img
+
+        idx = (card_data.get('number', 1) - 1) % len(CONTENT_BG_COLORS)
+        img = self._template(f"content_{idx}").copy()
+        self._draw_content(ImageDraw.Draw(img), card_data, total_cards)
+        return img
+
+    def render_deck(self, title: str, cards: list[dict]) -> list[Image.Image]:
+        """
+        타이틀 + 콘텐츠 카드들 + 엔딩 카드를 동시에 그립니다.
+
+        Args:
+            title: 메인 제목
+            cards: 콘텐츠 카드 데이터 리스트
+
+        Returns:
+            카드 순서대로 정렬된 이미지 리스트
+        """
+        total = len(cards)
+        specs = [({'title': title}, 'title')]
+        specs += [(card, 'content') for card in cards]
+        specs += [({'title': '감사합니다'}, 'ending')]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda spec: self.render(spec[0], total, spec[1]), specs))
+
+    def _template(self, name: str) -> Image.Image:
+        """미리 그려 둔 배경 템플릿 (처음 요청 시 생성)"""
+        template = self._templates.get(name)
+        if template is not None:
+            return template
+
+        with self._templates_lock:
+            template = self._templates.get(name)
+            if template is None:
+                template = self._build_template(name)
+                self._templates[name] = template
+
+        return template
+
+    def _build_template(self, name: str) -> Image.Image:
+        """배경 템플릿 생성"""
+        if name == "title":
+            return Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), TITLE_BG_COLOR)
+
+        if name == "ending":
+            # 엔딩 카드는 내용이 고정이므로 글자까지 전부 미리 그림
+            img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), ENDING_BG_COLOR)
+            lines = ENDING_TEXT.split('\n')
+            boxes = layout_lines(lines, self.title_font, CARD_WIDTH, CARD_HEIGHT // 2 - 100, 100)
+            self._draw_lines(ImageDraw.Draw(img), boxes, self.title_font, shadow_offset=2)
+            return img
+
+        idx = int(name.rsplit("_", 1)[1])
+        return Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), CONTENT_BG_COLORS[idx])
+
+    def layout_title(self, card_data: dict) -> list[LineBox]:
+        """
+        타이틀 카드 글자 배치를 계산합니다.
+
+        Args:
+            card_data: 카드 데이터
+
+        Returns:
+            줄별 위치 리스트
+        """
+        lines = wrap_text(card_data.get('title', '제목'), self.title_font, TEXT_MAX_WIDTH)
+
+        # 제목 중앙 정렬
+        top = CARD_HEIGHT // 2 - (len(lines) * 80)
+        return layout_lines(lines, self.title_font, CARD_WIDTH, top, 100)
+
+    def layout_content(self, card_data: dict) -> tuple[list[LineBox], list[LineBox]]:
+        """
+        콘텐츠 카드 글자 배치를 계산합니다.
+
+        Args:
+            card_data: 카드 데이터
+
+        Returns:
+            (제목 줄 위치, 내용 줄 위치)
+        """
+        title_lines = wrap_text(card_data.get('title', '제목'), self.title_font, TEXT_MAX_WIDTH)
+        title_boxes = layout_lines(title_lines, self.title_font, CARD_WIDTH, 400, 90)
+
+        # 카드 내용 (최대 6줄)
+        content_lines = wrap_text(
+            card_data.get('content', ''),
+            self.content_font,
+            TEXT_MAX_WIDTH,
+            max_lines=6,
+            ellipsis=True
+        )
+        content_top = 400 + len(title_lines) * 90 + 100
+        content_boxes = layout_lines(content_lines, self.content_font, CARD_WIDTH, content_top, 60)
+
+        return title_boxes, content_boxes
+
+    def _draw_title(self, draw: ImageDraw.ImageDraw, card_data: dict) -> None:
+        """타이틀 카드 글자 레이어"""
+        self._draw_lines(draw, self.layout_title(card_data), self.title_font, shadow_offset=3)
+
+    def _draw_content(self, draw: ImageDraw.ImageDraw, card_data: dict, total_cards: int) -> None:
+        """콘텐츠 카드 글자 레이어"""
+        # 카드 번호
+        number = card_data.get('number', 1)
+        draw.text((50, 100), f"#{number}/{total_cards}", font=self.small_font, fill=TEXT_COLOR)
+
+        title_boxes, content_boxes = self.layout_content(card_data)
+        self._draw_lines(draw, title_boxes, self.title_font, shadow_offset=2)
+        self._draw_lines(draw, content_boxes, self.content_font)
+
+    @staticmethod
+    def _draw_lines(
+        draw: ImageDraw.ImageDraw,
+        boxes: list[LineBox],
+        font: ImageFont.ImageFont,
+        shadow_offset: int = 0
+    ) -> None:
+        """배치된 줄 그리기 (선택적으로 그림자 포함)"""
+        for box in boxes:
+            if shadow_offset:
+                draw.text(
+                    (box.x + shadow_offset, box.y + shadow_offset),
+                    box.text,
+                    font=font,
+                    fill=SHADOW_COLOR
+                )
+            draw.text((box.x, box.y), box.text, font=font, fill=TEXT_COLOR)
+
+
+_renderer: CardRenderer | None = None
+
+
+def get_card_renderer() -> CardRenderer:
+    """
+    프로세스 전역 카드 렌더러를 반환합니다 (템플릿 캐시 공유).
+
+    Returns:
+        CardRenderer 인스턴스
+    """
+    global _renderer
+
+    if _renderer is None:
+        _renderer = CardRenderer()
+
+    return _renderer
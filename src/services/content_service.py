@@ -0,0 +1,430 @@
+"""
+콘텐츠 생성 서비스
+
+릴스 한 편에 필요한 텍스트(장면 대본, 장면별 영어 이미지 검색어, 음성 선택,
+자막, 해시태그)를 구조화된 JSON 응답 한 번으로 생성합니다. 응답은
+ReelContent 스키마로 검증하고, 형식이 깨진 경우 한 번만 고쳐 달라고 다시
+요청합니다.
+
+스트리밍 모드는 응답이 도착하는 동안 "scenes" 배열의 장면 객체가 닫힐 때마다
+바로 알려 주므로, 나머지 응답을 기다리지 않고 장면별 이미지 검색/다운로드를
+시작할 수 있습니다.
+
+검증에 성공한 결과는 LLM 응답 캐시(src/integrations/llm_cache.py)에 저장해 같은
+키워드/길이/모델/샘플링 설정의 요청은 TTL 동안 API를 다시 부르지 않습니다.
+창작 생성이라 기본 설정에서는 TTL이 없어 캐시하지 않습니다 (LLM_CACHE_TTL로 켬).
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from collections.abc import Callable
+
+from pydantic import ValidationError
+
+from src.core.config import settings
+from src.core.exceptions import ContentGenerationError
+from src.integrations.llm_cache import get_llm_cache, request_key
+from src.integrations.model_router import ModelRoute, get_model_router
+from src.integrations.openai_client import get_async_openai_client, get_openai_client
+from src.schemas.content import MAX_HASHTAGS, MAX_SUBTITLES, VOICE_CHOICES, ReelContent, ReelScene
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "당신은 바이럴 인스타그램 릴스 전문 작가이자 음성 디렉터입니다. 항상 JSON 객체 하나만 출력합니다."
+
+# 형식 오류 시 다시 요청하는 횟수
+REPAIR_ATTEMPTS = 1
+
+# 작업 이름 (LLM_CACHE_TTL, LLM_TASK_TIERS 등의 키)
+TASK = "reel_content"
+
+_SCENES_START = re.compile(r'"scenes"\s*:\s*\[')
+_SCENE_SEPARATOR = re.compile(r"[\s,]*")
+
+
+def build_prompt(keyword: str, duration: int) -> str:
+    """
+    릴스 콘텐츠 생성 프롬프트를 만듭니다.
+
+    Args:
+        keyword: 키워드
+        duration: 영상 길이 (초)
+
+    Returns:
+        사용자 프롬프트
+    """
+    voices = "\n".join(f"- {name}: {description}" for name, description in VOICE_CHOICES.items())
+
+    return f"""
+다음 키워드로 {duration}초 분량의 인스타그램 릴스 콘텐츠를 만들어주세요.
+
+키워드: {keyword}
+
+요구사항:
+1. 첫 장면은 첫 3초에 시선을 사로잡는 훅(Hook)
+2. 핵심 내용 3-4개 포인트를 장면으로 구성
+3. 마지막 장면은 CTA(Call to Action)
+4. 장면마다 스톡 사진 검색에 쓸 짧은 영어 검색어 (2-4단어)
+5. 자막은 대본에서 짧고 임팩트 있는 문장 3-{MAX_SUBTITLES}개
+6. 컨셉에 가장 어울리는 음성 하나
+
+사용 가능한 음성:
+{voices}
+
+출력 형식 (JSON):
+{{
+  "title": "릴스 제목",
+  "search_keyword": "키워드 전체를 나타내는 영어 검색어",
+  "scenes": [{{"narration": "장면 내레이션 (한국어)", "image_query": "english search terms"}}],
+  "voice": "Sarah",
+  "voice_reason": "음성 선택 이유",
+  "subtitles": ["자막 문장"],
+  "hashtags": ["#해시태그"] (최대 {MAX_HASHTAGS}개)
+}}
+"""
+
+
+def parse_content(text: str) -> ReelContent:
+    """
+    모델 응답을 ReelContent로 파싱합니다.
+
+    코드 블록(```json)이나 앞뒤 설명문이 섞여 있어도 첫 번째 JSON 객체를
+    찾아 읽습니다.
+
+    Args:
+        text: 모델 응답 텍스트
+
+    Returns:
+        검증된 ReelContent
+
+    Raises:
+        ContentGenerationError: JSON 객체가 없거나 스키마 검증에 실패한 경우
+    """
+    data = _first_json_object(text)
+    if data is None:
+        raise ContentGenerationError("응답에서 JSON 객체를 찾을 수 없습니다")
+
+    try:
+        return ReelContent.model_validate(data)
+    except ValidationError as e:
+        raise ContentGenerationError(f"콘텐츠 형식 오류: {e}") from e
+
+
+class SceneStreamParser:
+    """
+    스트리밍 응답에서 완성된 장면 객체를 순서대로 꺼내는 파서
+
+    "scenes" 배열이 시작된 뒤로 닫힌 장면 객체만 읽고, 아직 덜 도착한 객체는
+    다음 조각이 올 때까지 기다립니다. 형식이 잘못된 장면은 건너뜁니다 (최종
+    응답 검증에서 다시 걸러짐).
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos: int | None = None
+        self._decoder = json.JSONDecoder()
+        self.count = 0
+
+    def feed(self, chunk: str) -> list[tuple[int, ReelScene]]:
+        """
+        응답 조각을 추가합니다.
+
+        Args:
+            chunk: 새로 도착한 응답 텍스트
+
+        Returns:
+            이번 조각으로 완성된 (장면 번호, 장면) 리스트 (번호는 0부터)
+        """
+        self._text += chunk
+
+        if self._pos is None:
+            match = _SCENES_START.search(self._text)
+            if match is None:
+                return []
+            self._pos = match.end()
+
+        scenes = []
+        while True:
+            pos = _SCENE_SEPARATOR.match(self._text, self._pos).end()
+            if pos >= len(self._text) or self._text[pos] != "{":
+                break  # 배열 끝(]) 또는 다음 객체가 아직 도착하지 않음
+
+            try:
+                data, self._pos = self._decoder.raw_decode(self._text, pos)
+            except ValueError:
+                break  # 객체가 아직 닫히지 않음
+
+            try:
+                scene = ReelScene.model_validate(data)
+            except ValidationError:
+                continue
+
+            scenes.append((self.count, scene))
+            self.count += 1
+
+        return scenes
+
+
+class ContentService:
+    """GPT를 활용한 릴스 콘텐츠 생성 서비스"""
+
+    def __init__(self, api_key: str | None = None, model: str | None = None):
+        self.api_key = api_key
+        self.model = model  # None이면 모델 라우터가 작업 등급/지연 시간으로 선택
+
+    def generate_reel_content(self, keyword: str, duration: int = 30) -> ReelContent:
+        """
+        키워드로 릴스 콘텐츠를 생성합니다.
+
+        Args:
+            keyword: 키워드
+            duration: 영상 길이 (초)
+
+        Returns:
+            ReelContent
+
+        Raises:
+            ValueError: 키워드가 비어있는 경우
+            ContentGenerationError: API 호출 실패 또는 재요청 후에도 형식이 잘못된 경우
+        """
+        messages = self._messages(keyword, duration)
+        route = self._route()
+        key = request_key(self._request(messages, route.model))
+
+        content = self._cached(key)
+        if content is not None:
+            return content
+
+        client = get_openai_client(self.api_key)
+
+        for attempt in range(REPAIR_ATTEMPTS + 1):
+            started = time.monotonic()
+            try:
+                response = client.chat.completions.create(**self._request(messages, route.model))
+            except Exception as e:
+                raise ContentGenerationError(f"콘텐츠 생성 요청 실패: {e}") from e
+            get_model_router().record(route, time.monotonic() - started)
+
+            content = self._handle_response(response, messages, attempt)
+            if content is not None:
+                self._store(key, content)
+                return content
+
+        raise ContentGenerationError("콘텐츠 생성 실패")
+
+    async def agenerate_reel_content(self, keyword: str, duration: int = 30) -> ReelContent:
+        """
+        generate_reel_content()의 비동기 버전.
+
+        Args:
+            keyword: 키워드
+            duration: 영상 길이 (초)
+
+        Returns:
+            ReelContent
+
+        Raises:
+            ValueError: 키워드가 비어있는 경우
+            ContentGenerationError: API 호출 실패 또는 재요청 후에도 형식이 잘못된 경우
+        """
+        messages = self._messages(keyword, duration)
+        route = self._route()
+        key = request_key(self._request(messages, route.model))
+
+        content = await asyncio.to_thread(self._cached, key)
+        if content is not None:
+            return content
+
+        client = get_async_openai_client(self.api_key)
+
+        for attempt in range(REPAIR_ATTEMPTS + 1):
+            started = time.monotonic()
+            try:
+                response = await client.chat.completions.create(**self._request(messages, route.model))
+            except Exception as e:
+                raise ContentGenerationError(f"콘텐츠 생성 요청 실패: {e}") from e
+            get_model_router().record(route, time.monotonic() - started)
+
+            content = self._handle_response(response, messages, attempt)
+            if content is not None:
+                await asyncio.to_thread(self._store, key, content)
+                return content
+
+        raise ContentGenerationError("콘텐츠 생성 실패")
+
+    async def astream_reel_content(
+        self,
+        keyword: str,
+        duration: int = 30,
+        on_scene: Callable[[int, ReelScene], None] | None = None
+    ) -> ReelContent:
+        """
+        스트리밍으로 릴스 콘텐츠를 생성하며 장면이 완성될 때마다 알립니다.
+
+        on_scene은 이벤트 루프 안에서 호출되므로 오래 걸리는 작업은
+        asyncio.create_task()로 넘기세요. 최종 응답의 형식이 잘못된 경우에는
+        스트리밍 없이 한 번 다시 요청합니다 (이미 알린 장면과 달라질 수 있음).
+        캐시된 결과가 있으면 모든 장면을 바로 알리고 반환합니다.
+
+        Args:
+            keyword: 키워드
+            duration: 영상 길이 (초)
+            on_scene: (장면 번호, 장면)을 받는 콜백
+
+        Returns:
+            ReelContent
+
+        Raises:
+            ValueError: 키워드가 비어있는 경우
+            ContentGenerationError: API 호출 실패 또는 재요청 후에도 형식이 잘못된 경우
+        """
+        messages = self._messages(keyword, duration)
+        route = self._route()
+        key = request_key(self._request(messages, route.model))
+
+        content = await asyncio.to_thread(self._cached, key)
+        if content is not None:
+            if on_scene is not None:
+                for index, scene in enumerate(content.scenes):
+                    on_scene(index, scene)
+            return content
+
+        client = get_async_openai_client(self.api_key)
+        parser = SceneStreamParser()
+        parts = []
+
+        started = time.monotonic()
+        try:
+            stream = await client.chat.completions.create(**self._request(messages, route.model), stream=True)
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                for index, scene in parser.feed(delta):
+                    if on_scene is not None:
+                        on_scene(index, scene)
+        except Exception as e:
+            raise ContentGenerationError(f"콘텐츠 생성 요청 실패: {e}") from e
+        get_model_router().record(route, time.monotonic() - started)
+
+        content = self._handle_text("".join(parts), messages, 0)
+
+        if content is None:
+            started = time.monotonic()
+            try:
+                response = await client.chat.completions.create(**self._request(messages, route.model))
+            except Exception as e:
+                raise ContentGenerationError(f"콘텐츠 생성 요청 실패: {e}") from e
+            get_model_router().record(route, time.monotonic() - started)
+            content = self._handle_response(response, messages, REPAIR_ATTEMPTS)
+
+        await asyncio.to_thread(self._store, key, content)
+        return content
+
+    @staticmethod
+    def _cached(key: str) -> ReelContent | None:
+        """캐시된 콘텐츠 (없거나 현재 스키마로 읽을 수 없으면 None)"""
+        cache = get_llm_cache()
+        text = cache.get(TASK, key) if cache is not None else None
+        if text is None:
+            return None
+
+        try:
+            content = ReelContent.model_validate_json(text)
+        except ValidationError:
+            return None
+
+        logger.info("콘텐츠 캐시 사용 (장면 %d개)", len(content.scenes))
+        return content
+
+    @staticmethod
+    def _store(key: str, content: ReelContent) -> None:
+        """검증된 콘텐츠를 캐시에 저장"""
+        cache = get_llm_cache()
+        if cache is not None:
+            cache.put(TASK, key, content.model_dump_json())
+
+    @staticmethod
+    def _messages(keyword: str, duration: int) -> list[dict]:
+        if not keyword or not keyword.strip():
+            raise ValueError("키워드는 필수입니다")
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_prompt(keyword.strip(), duration)},
+        ]
+
+    def _route(self) -> ModelRoute:
+        """이번 요청의 모델 (직접 지정했으면 그 모델, 아니면 라우터 선택)"""
+        if self.model:
+            return ModelRoute(TASK, "", self.model)
+        return get_model_router().route(TASK)
+
+    @staticmethod
+    def _request(messages: list[dict], model: str) -> dict:
+        return {
+            "model": model,
+            "messages": messages,
+            "response_format": {"type": "json_object"},
+            "max_tokens": settings.OPENAI_MAX_TOKENS,
+            "temperature": settings.OPENAI_TEMPERATURE,
+        }
+
+    @classmethod
+    def _handle_response(cls, response, messages: list[dict], attempt: int) -> ReelContent | None:
+        """API 응답 객체 처리 (_handle_text 참고)"""
+        usage = getattr(response, "usage", None)
+        return cls._handle_text(
+            response.choices[0].message.content or "",
+            messages,
+            attempt,
+            usage.total_tokens if usage else None
+        )
+
+    @staticmethod
+    def _handle_text(
+        text: str,
+        messages: list[dict],
+        attempt: int,
+        total_tokens: int | None = None
+    ) -> ReelContent | None:
+        """응답을 파싱하고, 실패하면 고쳐 달라는 메시지를 덧붙임 (마지막 시도면 예외)"""
+        try:
+            content = parse_content(text)
+        except ContentGenerationError as e:
+            if attempt >= REPAIR_ATTEMPTS:
+                raise
+            logger.warning("콘텐츠 형식 오류, 다시 요청: %s", str(e)[:200])
+            messages.append({"role": "assistant", "content": text})
+            messages.append({
+                "role": "user",
+                "content": f"형식이 잘못되었습니다 ({str(e)[:300]}). 요청한 JSON 형식으로만 다시 출력하세요.",
+            })
+            return None
+
+        logger.info(
+            "콘텐츠 생성 완료: 장면 %d개, 음성 %s (토큰 %s)",
+            len(content.scenes), content.voice, total_tokens or "?"
+        )
+        return content
+
+
+def _first_json_object(text: str) -> dict | None:
+    """텍스트에서 처음으로 읽을 수 있는 JSON 객체"""
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+        except ValueError:
+            start = text.find("{", start + 1)
+            continue
+        if isinstance(data, dict):
+            return data
+        start = text.find("{", start + 1)
+
+    return None
@@ -0,0 +1,710 @@
+"""
+미디어 수집 서비스
+
+장면 이미지를 동시에 내려받아 조각 단위로 디스크에 씁니다. 본문 전체를
+메모리에 올리지 않고, 이미지 하나와 작업 전체의 바이트 예산을 넘으면 바로
+중단합니다. 필요한 만큼 쓸 수 있는 이미지가 모이면 남은 다운로드는 취소합니다.
+
+작업 간 캐시는 두 단계입니다.
+
+- 검색 결과: 공급자 + 정규화한 검색어 + 방향 키로 TTL 동안 재사용 (디스크,
+  MEDIA_CACHE_REDIS면 Redis로 노드 간 공유)
+- 이미지 파일: 공급자 사진 ID + 크기 키로 디스크 LRU에 저장 (같은 디렉토리를
+  쓰는 워커끼리 공유)
+"""
+
+import asyncio
+import json
+import logging
+import re
+import shutil
+import time
+import uuid
+from collections.abc import Sequence
+from pathlib import Path
+
+import httpx
+
+from src.core.config import settings
+from src.core.exceptions import MediaDownloadError, MediaProbeError
+from src.integrations.http_client import get_async_http_client, run_sync
+from src.utils.cache import DiskLRUCache, content_key, get_redis_client
+from src.utils.media_probe import probe_image_size
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# 검색 결과 캐시 버전 (결과 형식이 바뀌면 올림)
+SEARCH_CACHE_VERSION = 1
+SEARCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+REDIS_KEY_PREFIX = "reelmacro:image_search:"
+
+# 장면 하나에 동시에 받아 볼 후보 수 (먼저 성공한 한 장만 사용)
+SCENE_CANDIDATES = 2
+
+# 검색 한 번에 요청할 최대 결과 수 (Unsplash per_page 상한)
+MAX_SEARCH_RESULTS = 30
+
+# 검색어 묶음 키에서 무시할 단어
+_QUERY_STOPWORDS = {"a", "an", "the", "of", "and", "with", "in", "on", "for", "at", "to"}
+
+
+def normalize_query(query: str) -> str:
+    """
+    검색 캐시 키용 검색어 정규화 (대소문자, 연속 공백 무시).
+
+    Args:
+        query: 검색어
+
+    Returns:
+        정규화한 검색어
+    """
+    return " ".join(query.casefold().split())
+
+
+def photo_cache_key(provider: str, photo_id: str, width: int, height: int) -> str:
+    """
+    내려받은 이미지의 캐시 키 (같은 사진이라도 요청 크기가 다르면 다른 파일).
+
+    Args:
+        provider: 공급자 이름 (unsplash 등)
+        photo_id: 공급자 사진 ID
+        width: 요청 너비
+        height: 요청 높이
+
+    Returns:
+        캐시 키
+    """
+    return content_key("image", provider, str(photo_id), f"{width}x{height}")
+
+
+class ImageSearchCache:
+    """
+    이미지 검색 결과 캐시 (디스크 + 선택적 Redis, TTL)
+
+    저장 시각을 항목 안에 기록하고 조회할 때 TTL을 확인합니다 (디스크 LRU는
+    조회 시 수정 시각을 갱신하므로 파일 시각으로는 판단하지 않음). 더 많은 결과를
+    요청하면 캐시 미스로 처리합니다. Redis 오류는 캐시 미스로 처리합니다.
+    """
+
+    def __init__(self, disk: DiskLRUCache, ttl: int, redis_client=None):
+        self.disk = disk
+        self.ttl = ttl
+        self.redis = redis_client
+
+    @staticmethod
+    def key(provider: str, query: str, orientation: str | None) -> str:
+        """
+        검색 캐시 키.
+
+        Args:
+            provider: 공급자 이름
+            query: 검색어
+            orientation: 방향
+
+        Returns:
+            캐시 키
+        """
+        return content_key(
+            f"image-search-v{SEARCH_CACHE_VERSION}",
+            provider,
+            normalize_query(query),
+            orientation or "",
+        )
+
+    def get(self, key: str, per_page: int) -> list[dict] | None:
+        """
+        캐시된 검색 결과를 조회합니다 (디스크 → Redis 순).
+
+        Args:
+            key: 캐시 키
+            per_page: 필요한 결과 수
+
+        Returns:
+            검색 결과 앞 per_page개 (없거나 만료됐거나 결과 수가 부족하면 None)
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None
+        if time.time() - entry["cached_at"] > self.ttl or entry["per_page"] < per_page:
+            return None
+        return entry["results"][:per_page]
+
+    def put(self, key: str, results: list[dict], per_page: int) -> None:
+        """
+        검색 결과를 저장합니다.
+
+        Args:
+            key: 캐시 키
+            results: API 검색 결과
+            per_page: 요청한 결과 수
+        """
+        data = json.dumps(
+            {"cached_at": time.time(), "per_page": per_page, "results": results},
+            ensure_ascii=False
+        ).encode("utf-8")
+
+        if self.redis is not None:
+            try:
+                self.redis.set(REDIS_KEY_PREFIX + key, data, ex=self.ttl)
+            except Exception as e:
+                logger.warning("Redis 검색 캐시 저장 실패: %s", e)
+
+        self.disk.put_bytes(key, data)
+
+    def _load(self, key: str) -> dict | None:
+        """디스크(없으면 Redis)에서 항목 읽기"""
+        path = self.disk.get(key)
+        if path is not None:
+            try:
+                return json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                return None
+
+        if self.redis is None:
+            return None
+
+        try:
+            data = self.redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis 검색 캐시 조회 실패: %s", e)
+            return None
+        if not data:
+            return None
+
+        self.disk.put_bytes(key, data)
+        return json.loads(data)
+
+
+_search_cache: ImageSearchCache | None = None
+_image_cache: DiskLRUCache | None = None
+
+
+def get_image_search_cache() -> ImageSearchCache | None:
+    """
+    프로세스 전역 이미지 검색 캐시를 반환합니다.
+
+    Returns:
+        MEDIA_CACHE_DIR/image_search 캐시 (IMAGE_SEARCH_CACHE_TTL=0이면 None)
+    """
+    global _search_cache
+
+    if settings.IMAGE_SEARCH_CACHE_TTL <= 0:
+        return None
+
+    if _search_cache is None:
+        disk = DiskLRUCache(
+            settings.MEDIA_CACHE_DIR / "image_search",
+            max_bytes=SEARCH_CACHE_MAX_BYTES,
+            suffix=".json"
+        )
+        redis_client = get_redis_client() if settings.MEDIA_CACHE_REDIS else None
+        _search_cache = ImageSearchCache(disk, settings.IMAGE_SEARCH_CACHE_TTL, redis_client)
+
+    return _search_cache
+
+
+def get_image_cache() -> DiskLRUCache | None:
+    """
+    프로세스 전역 이미지 파일 캐시를 반환합니다.
+
+    Returns:
+        MEDIA_CACHE_DIR/images 캐시 (IMAGE_CACHE_MAX_MB=0이면 None)
+    """
+    global _image_cache
+
+    if settings.IMAGE_CACHE_MAX_MB <= 0:
+        return None
+
+    if _image_cache is None:
+        _image_cache = DiskLRUCache(
+            settings.MEDIA_CACHE_DIR / "images",
+            max_bytes=settings.IMAGE_CACHE_MAX_MB * 1024 * 1024,
+            suffix=".jpg"
+        )
+
+    return _image_cache
+
+
+def search_photos(client, query: str, per_page: int = 10, orientation: str | None = "portrait") -> list[dict]:
+    """
+    검색 결과 캐시를 거쳐 사진을 검색합니다.
+
+    Args:
+        client: 공급자 클라이언트 (UnsplashClient 등)
+        query: 검색어
+        per_page: 결과 수
+        orientation: 방향
+
+    Returns:
+        API 검색 결과 리스트
+
+    Raises:
+        MediaDownloadError: 검색 요청 실패 시 (실패는 캐시하지 않음)
+    """
+    cache = get_image_search_cache()
+    if cache is None:
+        return client.search_photos(query, per_page=per_page, orientation=orientation)
+
+    key = cache.key(client.provider, query, orientation)
+    results = cache.get(key, per_page)
+    if results is not None:
+        logger.info("이미지 검색 캐시 사용: %s '%s'", client.provider, query)
+        return results
+
+    results = client.search_photos(query, per_page=per_page, orientation=orientation)
+    cache.put(key, results, per_page)
+    return results
+
+
+async def asearch_photos(
+    client,
+    query: str,
+    per_page: int = 10,
+    orientation: str | None = "portrait"
+) -> list[dict]:
+    """
+    search_photos()의 비동기 버전.
+
+    Args:
+        client: 공급자 클라이언트 (UnsplashClient 등)
+        query: 검색어
+        per_page: 결과 수
+        orientation: 방향
+
+    Returns:
+        API 검색 결과 리스트
+
+    Raises:
+        MediaDownloadError: 검색 요청 실패 시 (실패는 캐시하지 않음)
+    """
+    cache = get_image_search_cache()
+    if cache is None:
+        return await client.asearch_photos(query, per_page=per_page, orientation=orientation)
+
+    key = cache.key(client.provider, query, orientation)
+    results = await asyncio.to_thread(cache.get, key, per_page)
+    if results is not None:
+        logger.info("이미지 검색 캐시 사용: %s '%s'", client.provider, query)
+        return results
+
+    results = await client.asearch_photos(query, per_page=per_page, orientation=orientation)
+    await asyncio.to_thread(cache.put, key, results, per_page)
+    return results
+
+
+def query_key(query: str) -> str:
+    """
+    거의 같은 검색어를 하나로 묶는 키.
+
+    대소문자/문장부호/불용어/어순/단순 복수형 차이를 무시합니다
+    ("Cup of coffee" = "coffee cups").
+
+    Args:
+        query: 검색어
+
+    Returns:
+        정규화한 키 (단어를 정렬해 공백으로 연결)
+    """
+    words = set()
+    for word in re.findall(r"\w+", query.casefold()):
+        if word in _QUERY_STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.add(word)
+    return " ".join(sorted(words)) or normalize_query(query)
+
+
+class MediaPlanner:
+    """
+    장면별 이미지 배정기
+
+    장면마다 자기 검색어로 사진을 찾되, 거의 같은 검색어는 검색을 한 번만 하고
+    (query_key), 서로 다른 검색어의 검색은 동시에 실행합니다. 사진 ID를 기준으로
+    이미 다른 장면에 배정한 사진은 건너뛰므로 같은 사진이 두 번 나오지 않습니다.
+
+    같은 묶음의 장면이 늘어 후보가 모자라면 더 큰 per_page로 다시 검색하고, 남은
+    사진이 없어도 다른 장면이 다운로드 중인 후보가 있으면 반납을 기다렸다가 다시
+    고릅니다.
+
+    모든 장면의 다운로드는 하나의 DownloadJob(동시 다운로드 수, 작업 바이트 예산)을
+    함께 씁니다. 보충 다운로드도 같은 제한을 쓰려면 job을 넘기세요.
+
+    한 이벤트 루프 안에서 사용합니다. 장면 목록을 한 번에 알면 plan(), 스트리밍
+    대본처럼 장면이 하나씩 도착하면 schedule()을 씁니다.
+    """
+
+    def __init__(
+        self,
+        client,
+        output_dir: Path,
+        size: tuple[int, int],
+        candidates: int = 6,
+        downloader: "ImageDownloader | None" = None,
+        job: "DownloadJob | None" = None
+    ):
+        self.client = client
+        self.output_dir = output_dir
+        self.size = size
+        self.candidates = candidates
+        self.downloader = downloader or ImageDownloader()
+        self.job = job or self.downloader.new_job()
+
+        self._groups: dict[str, _SearchGroup] = {}
+        self._used: set[str] = set()
+        # 후보를 잡고 다운로드 중인 장면 수 (끝나면 남은 후보를 반납하고 알림)
+        self._downloading = 0
+        self._released = asyncio.Condition()
+
+    async def plan(self, queries: Sequence[str]) -> list[Path | None]:
+        """
+        장면 검색어 목록으로 장면별 이미지를 준비합니다.
+
+        Args:
+            queries: 장면 순서대로의 검색어
+
+        Returns:
+            장면 순서대로의 이미지 경로 (찾지 못한 장면은 None)
+        """
+        # 같은 검색어를 쓰는 장면 수만큼 후보를 처음부터 넉넉히 검색 (다시 검색하지 않도록)
+        scenes: dict[str, int] = {}
+        for query in queries:
+            if query:
+                scenes[query_key(query)] = scenes.get(query_key(query), 0) + 1
+        for query in queries:
+            if query:
+                self._search(self._group(query), scenes[query_key(query)])
+
+        return await asyncio.gather(*(self.schedule(i, query) for i, query in enumerate(queries)))
+
+    def schedule(self, index: int, query: str) -> "asyncio.Task[Path | None]":
+        """
+        장면 하나의 이미지 작업을 시작합니다 (이벤트 루프 안에서 호출).
+
+        Args:
+            index: 장면 번호 (0부터, 파일 이름에 사용)
+            query: 장면 검색어
+
+        Returns:
+            이미지 경로(찾지 못하면 None)를 돌려주는 Task
+        """
+        return asyncio.create_task(self._scene_photo(index, query))
+
+    def _group(self, query: str) -> "_SearchGroup":
+        """검색어 묶음 (같은 query_key는 공유)"""
+        key = query_key(query)
+        if key not in self._groups:
+            self._groups[key] = _SearchGroup(query)
+        return self._groups[key]
+
+    def _search(self, group: "_SearchGroup", scenes: int) -> asyncio.Task:
+        """
+        묶음의 검색 Task (장면 scenes개에 후보가 모자라면 더 큰 per_page로 다시 검색)
+
+        결과가 요청한 수보다 적었던 검색은 더 검색해도 늘지 않으므로 다시 하지 않습니다.
+        """
+        needed = min(max(self.candidates, scenes * SCENE_CANDIDATES), MAX_SEARCH_RESULTS)
+
+        if group.task is None:
+            group.per_page = needed
+        elif needed > group.per_page and not group.exhausted:
+            # 장면이 하나씩 늘 때마다 검색하지 않도록 두 배씩 키움
+            group.per_page = min(max(needed, group.per_page * 2), MAX_SEARCH_RESULTS)
+        else:
+            return group.task
+
+        group.task = asyncio.create_task(self._run_search(group.query, group.per_page))
+        return group.task
+
+    async def _run_search(self, query: str, per_page: int) -> list[dict]:
+        try:
+            return await asearch_photos(self.client, query, per_page=per_page)
+        except MediaDownloadError as e:
+            logger.warning("이미지 검색 실패 ('%s'): %s", query, e)
+            return []
+
+    async def _scene_photo(self, index: int, query: str) -> Path | None:
+        """장면 하나: 쓰지 않은 후보를 골라 동시에 받고 먼저 성공한 한 장만 남김"""
+        if not query:
+            return None
+
+        group = self._group(query)
+        group.scenes += 1
+
+        while True:
+            search = self._search(group, group.scenes)
+            photos = await asyncio.shield(search)
+            if search is not group.task:
+                continue  # 기다리는 동안 더 큰 검색이 시작됨
+
+            async with self._released:
+                # 고르기와 배정 표시 사이에 await가 없으므로 다른 장면과 겹치지 않음
+                picks = [photo for photo in photos if str(photo["id"]) not in self._used][:SCENE_CANDIDATES]
+                if picks or not self._downloading:
+                    self._used.update(str(photo["id"]) for photo in picks)
+                    break
+                # 다른 장면이 잡아 둔 후보가 반납될 때까지 기다렸다가 다시 고름
+                await self._released.wait()
+
+        if not picks:
+            logger.info("장면 %d: '%s' 검색 결과에 남은 사진 없음", index + 1, query)
+            return None
+
+        width, height = self.size
+        paths: list[Path | None] = [None] * len(picks)
+        self._downloading += 1
+
+        try:
+            paths = await self.downloader.adownload(
+                [self.client.rendition_url(photo, width, height) for photo in picks],
+                self.output_dir,
+                required=1,
+                prefix=f"scene{index + 1}",
+                cache_keys=[
+                    photo_cache_key(self.client.provider, photo["id"], width, height) for photo in picks
+                ],
+                job=self.job
+            )
+        finally:
+            chosen = self._keep_first(picks, paths)
+            self._downloading -= 1
+            async with self._released:
+                self._released.notify_all()
+
+        return chosen
+
+    def _keep_first(self, picks: list[dict], paths: list[Path | None]) -> Path | None:
+        """먼저 성공한 한 장만 남기고 나머지 후보는 뒤 장면이 쓸 수 있도록 반납"""
+        chosen = None
+        for photo, path in zip(picks, paths):
+            if path is not None and chosen is None:
+                chosen = path
+                continue
+            if path is not None:
+                path.unlink(missing_ok=True)  # 동시에 끝난 나머지 후보
+            self._used.discard(str(photo["id"]))
+
+        return chosen
+
+
+class _SearchGroup:
+    """query_key 하나로 묶인 장면들의 검색 상태 (하나의 이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.scenes = 0
+        self.per_page = 0
+        self.task: asyncio.Task | None = None
+
+    @property
+    def exhausted(self) -> bool:
+        """마지막 검색 결과가 요청한 수보다 적음 (더 검색해도 늘지 않음)"""
+        return self.task is not None and self.task.done() and len(self.task.result()) < self.per_page
+
+
+class ImageDownloader:
+    """
+    병렬 스트리밍 이미지 다운로더
+
+    동시 다운로드 수와 작업 바이트 예산은 DownloadJob 단위로 적용합니다. 여러 번
+    나눠 받는 작업(장면별 이미지 + 보충 이미지)은 new_job()으로 만든 job을 매
+    호출에 넘기고, job 없이 호출하면 그 호출 하나가 작업입니다. 캐시 키를 넘긴
+    이미지는 이미지 캐시에서 먼저 찾고 (예산에 포함하지 않음), 새로 받은 이미지는
+    캐시에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        max_image_bytes: int | None = None,
+        max_job_bytes: int | None = None,
+        min_size: tuple[int, int] = (0, 0)
+    ):
+        self.max_concurrency = max(1, max_concurrency or settings.MEDIA_DOWNLOAD_CONCURRENCY)
+        self.max_image_bytes = max_image_bytes or settings.MEDIA_MAX_IMAGE_MB * 1024 * 1024
+        self.max_job_bytes = max_job_bytes or settings.MEDIA_MAX_JOB_MB * 1024 * 1024
+        self.min_size = min_size
+        self.cache = get_image_cache()
+
+    def new_job(self) -> "DownloadJob":
+        """
+        이 다운로더 설정(MEDIA_DOWNLOAD_CONCURRENCY, MEDIA_MAX_JOB_MB)의 새 작업.
+
+        Returns:
+            DownloadJob
+        """
+        return DownloadJob(self.max_concurrency, self.max_job_bytes)
+
+    def download(
+        self,
+        urls: Sequence[str],
+        output_dir: Path,
+        required: int | None = None,
+        prefix: str = "image",
+        cache_keys: Sequence[str | None] | None = None,
+        job: "DownloadJob | None" = None
+    ) -> list[Path | None]:
+        """
+        이미지들을 동시에 내려받습니다.
+
+        Args:
+            urls: 이미지 URL 리스트
+            output_dir: 저장 디렉토리
+            required: 쓸 수 있는 이미지가 이만큼 모이면 나머지 취소 (None = 전부)
+            prefix: 파일 이름 접두사 ({prefix}_{번호}.jpg)
+            cache_keys: URL별 이미지 캐시 키 (photo_cache_key(), None = 캐시 안 함)
+            job: 함께 제한을 적용할 작업 (None = 이 호출만의 새 작업)
+
+        Returns:
+            URL 순서대로 정렬된 파일 경로 (실패/취소된 항목은 None)
+        """
+        return run_sync(self.adownload(urls, output_dir, required, prefix, cache_keys, job))
+
+    async def adownload(
+        self,
+        urls: Sequence[str],
+        output_dir: Path,
+        required: int | None = None,
+        prefix: str = "image",
+        cache_keys: Sequence[str | None] | None = None,
+        job: "DownloadJob | None" = None
+    ) -> list[Path | None]:
+        """
+        download()의 비동기 버전.
+
+        Args:
+            urls: 이미지 URL 리스트
+            output_dir: 저장 디렉토리
+            required: 쓸 수 있는 이미지가 이만큼 모이면 나머지 취소 (None = 전부)
+            prefix: 파일 이름 접두사
+            cache_keys: URL별 이미지 캐시 키 (None = 캐시 안 함)
+            job: 함께 제한을 적용할 작업 (None = 이 호출만의 새 작업)
+
+        Returns:
+            URL 순서대로 정렬된 파일 경로 (실패/취소된 항목은 None)
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        required = len(urls) if required is None else min(required, len(urls))
+
+        job = job or self.new_job()
+        results: list[Path | None] = [None] * len(urls)
+
+        async def fetch(index: int, url: str) -> None:
+            path = output_dir / f"{prefix}_{index + 1}.jpg"
+            key = cache_keys[index] if cache_keys and self.cache is not None else None
+
+            if key:
+                cached = await asyncio.to_thread(self._from_cache, key, path)
+                if cached is not None:
+                    results[index] = cached
+                    return
+
+            async with job.semaphore:
+                try:
+                    results[index] = await self._fetch(url, path, job.budget)
+                except MediaDownloadError as e:
+                    logger.warning("이미지 다운로드 실패 (%d/%d): %s", index + 1, len(urls), e)
+                    return
+
+            if key:
+                await asyncio.to_thread(self.cache.put_file, key, path)
+
+        tasks = [asyncio.create_task(fetch(i, url)) for i, url in enumerate(urls)]
+        pending = set(tasks)
+
+        while pending and sum(path is not None for path in results) < required:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+        if pending:
+            # 필요한 만큼 모였으면 늦은 다운로드는 취소 (쓰던 파일은 _fetch가 정리)
+            logger.info("이미지 %d개 확보, 남은 다운로드 %d개 취소", required, len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.info(
+            "이미지 다운로드 완료: %d/%d개 (작업 누적 %.1fMB)",
+            sum(path is not None for path in results), len(urls), job.budget.used / 1024 / 1024
+        )
+
+        return results
+
+    def _from_cache(self, key: str, path: Path) -> Path | None:
+        """캐시된 이미지를 작업 디렉토리로 복사 (없으면 None)"""
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        try:
+            shutil.copyfile(cached, path)
+        except FileNotFoundError:
+            return None  # 조회 직후 다른 워커가 정리한 경우
+        return path
+
+    async def _fetch(self, url: str, path: Path, budget: "_ByteBudget") -> Path:
+        """이미지 하나를 임시 파일로 받아 검증 후 제자리로 이동"""
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.part")
+        written = 0
+
+        try:
+            async with get_async_http_client().stream("GET", url) as response:
+                if response.status_code != 200:
+                    raise MediaDownloadError(f"HTTP {response.status_code}: {url}")
+
+                content_type = response.headers.get("content-type", "")
+                if content_type and not content_type.startswith("image/"):
+                    raise MediaDownloadError(f"이미지가 아닌 응답 ({content_type}): {url}")
+
+                declared = int(response.headers.get("content-length") or 0)
+                if declared > self.max_image_bytes:
+                    raise MediaDownloadError(f"이미지 용량 초과 ({declared} bytes): {url}")
+
+                with open(tmp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > self.max_image_bytes:
+                            raise MediaDownloadError(f"이미지 용량 초과 ({written}+ bytes): {url}")
+                        if not budget.take(len(chunk)):
+                            raise MediaDownloadError(f"작업 다운로드 예산 초과: {url}")
+                        f.write(chunk)
+
+            width, height = probe_image_size(tmp_path)
+            if width < self.min_size[0] or height < self.min_size[1]:
+                raise MediaDownloadError(f"이미지 해상도 부족 ({width}x{height}): {url}")
+
+            tmp_path.replace(path)
+            return path
+
+        except httpx.HTTPError as e:
+            raise MediaDownloadError(f"{e}: {url}") from e
+        except MediaProbeError as e:
+            raise MediaDownloadError(f"이미지를 읽을 수 없음: {url}") from e
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+class DownloadJob:
+    """
+    다운로드 작업 하나의 제한 (동시 다운로드 수 + 바이트 예산)
+
+    하나의 이벤트 루프 안에서만 사용합니다 (동기 코드는 run_sync 루프).
+    """
+
+    def __init__(self, max_concurrency: int, max_bytes: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.budget = _ByteBudget(max_bytes)
+
+
+class _ByteBudget:
+    """작업 전체 다운로드 바이트 예산 (하나의 이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.used = 0
+
+    def take(self, size: int) -> bool:
+        if self.used + size > self.limit:
+            return False
+        self.used += size
+        return True
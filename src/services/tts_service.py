@@ -0,0 +1,548 @@
+"""
+TTS 서비스
+
+카드 덱처럼 여러 문장의 음성을 한 번에 만들 때 요청을 모두 동시에 보내고
+(동시 요청 수/속도 제한은 ElevenLabsClient가 담당), 결과를 입력 순서대로
+파일에 저장합니다. 동기 코드(스크립트, 워커)에서 바로 호출할 수 있습니다.
+
+합성한 음성은 정규화한 텍스트 + 음성/모델/음성 설정을 키로 디스크(LRU)와
+선택적으로 Redis에 캐시해, 같은 문장은 다시 요청하지 않습니다. 비동기 메서드는
+캐시 조회/저장(디스크, Redis)을 스레드에서 실행해 공유 이벤트 루프를 막지 않습니다.
+
+덱 모드(synthesize_deck)는 덱 전체 내레이션을 글자별 시각 정보와 함께 한 번에
+합성하고, 카드 경계 시각을 계산해 돌려줍니다 (잘라 내기는 audio_utils).
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import re
+import shutil
+import unicodedata
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.config import settings
+from src.core.exceptions import TTSGenerationError
+from src.integrations.elevenlabs_client import ElevenLabsClient, SynthesisRequest
+from src.integrations.http_client import run_sync
+from src.utils.audio_utils import stitch_audio
+from src.utils.cache import DiskLRUCache, content_key, get_redis_client
+from src.utils.sentences import sentence_chunks
+
+logger = logging.getLogger(__name__)
+
+# 음성 이름 → ElevenLabs voice ID
+VOICE_IDS = {
+    "Sarah": "EXAVITQu4vr4xnSDxMaL",      # 밝고 귀여운 여성
+    "Rachel": "21m00Tcm4TlvDq8ikWAM",     # 차분한 여성
+    "Adam": "pNInz6obpgDQGcFmaJgB",       # 활기찬 남성
+    "Bella": "EXAVITQu4vr4xnSDxMaL",      # 친근한 여성 (Sarah와 동일)
+    "Antoni": "ErXwobaYiN019PkySvjV",     # 전문적인 남성
+}
+
+DEFAULT_VOICE_SETTINGS = {
+    "stability": 0.3,          # 낮을수록 더 밝고 귀여운 톤
+    "similarity_boost": 0.85,  # 높을수록 더 표현력 있음
+    "style": 0.5,              # 스타일 강도
+    "use_speaker_boost": True  # 목소리 강화
+}
+
+# 캐시 형식이 바뀌면 올려서 이전 항목을 무효화
+TTS_CACHE_VERSION = 2
+
+REDIS_KEY_PREFIX = "reelmaker:tts:"
+
+# 덱 모드에서 카드 텍스트 사이에 넣는 구분자 (문단 구분으로 읽혀 짧게 쉼)
+DECK_SEPARATOR = "\n\n"
+
+
+@dataclass
+class VoiceJob:
+    """파일 하나로 저장할 음성 합성 작업"""
+
+    text: str
+    output_path: Path
+
+
+@dataclass
+class DeckNarration:
+    """덱 전체를 한 번에 합성한 내레이션"""
+
+    path: Path
+    starts: list[float]  # 텍스트별 시작 시각 (초, 첫 항목은 0)
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화 (유니코드 NFC, 공백 정리).
+
+    발음에 영향을 주지 않는 차이만 없앱니다 (대소문자/문장부호는 유지).
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+class TTSCache:
+    """
+    합성 음성 캐시 (디스크 LRU + 선택적 Redis)
+
+    디스크는 노드별 캐시이고, Redis에는 음성 바이트 자체를 TTL과 함께 저장해
+    다른 노드의 워커가 만든 음성도 재사용합니다. Redis 오류는 캐시 미스로
+    처리합니다.
+    """
+
+    def __init__(self, disk: DiskLRUCache, redis_client=None, redis_ttl: int = 0):
+        self.disk = disk
+        self.redis = redis_client
+        self.redis_ttl = redis_ttl
+
+    @staticmethod
+    def key(request: SynthesisRequest) -> str:
+        """
+        합성 요청의 캐시 키.
+
+        Args:
+            request: 합성 요청
+
+        Returns:
+            캐시 키
+        """
+        return content_key(
+            f"tts-v{TTS_CACHE_VERSION}",
+            normalize_text(request.text),
+            request.voice_id,
+            request.model_id,
+            json.dumps(request.voice_settings or {}, sort_keys=True),
+            normalize_text(request.previous_text or ""),
+            normalize_text(request.next_text or ""),
+        )
+
+    def get(self, key: str) -> Path | None:
+        """
+        캐시된 음성 파일을 조회합니다 (디스크 → Redis 순).
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시 파일 경로 (없으면 None)
+        """
+        path = self.disk.get(key)
+        if path is not None or self.redis is None:
+            return path
+
+        try:
+            data = self.redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis TTS 캐시 조회 실패: %s", e)
+            return None
+
+        return self.disk.put_bytes(key, data) if data else None
+
+    def put(self, key: str, data: bytes) -> Path:
+        """
+        음성을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            data: MP3 바이트
+
+        Returns:
+            캐시 파일 경로
+        """
+        if self.redis is not None:
+            try:
+                self.redis.set(REDIS_KEY_PREFIX + key, data, ex=self.redis_ttl or None)
+            except Exception as e:
+                logger.warning("Redis TTS 캐시 저장 실패: %s", e)
+
+        return self.disk.put_bytes(key, data)
+
+    def put_file(self, key: str, source: Path) -> Path:
+        """
+        음성 파일을 캐시에 복사해 저장합니다.
+
+        Args:
+            key: 캐시 키
+            source: MP3 파일
+
+        Returns:
+            캐시 파일 경로
+        """
+        if self.redis is not None:
+            try:
+                self.redis.set(REDIS_KEY_PREFIX + key, source.read_bytes(), ex=self.redis_ttl or None)
+            except Exception as e:
+                logger.warning("Redis TTS 캐시 저장 실패: %s", e)
+
+        return self.disk.put_file(key, source)
+
+
+_tts_caches: dict[str, TTSCache] = {}
+
+
+def get_tts_cache(timestamps: bool = False) -> TTSCache | None:
+    """
+    프로세스 전역 TTS 캐시를 반환합니다.
+
+    Args:
+        timestamps: True면 덱 모드 응답(음성 + 글자별 시각, JSON) 캐시
+
+    Returns:
+        MEDIA_CACHE_DIR/tts(_timestamps) 캐시 (TTS_CACHE_MAX_MB=0이면 None)
+    """
+    if settings.TTS_CACHE_MAX_MB <= 0:
+        return None
+
+    name = "tts_timestamps" if timestamps else "tts"
+    if name not in _tts_caches:
+        disk = DiskLRUCache(
+            settings.MEDIA_CACHE_DIR / name,
+            max_bytes=settings.TTS_CACHE_MAX_MB * 1024 * 1024,
+            suffix=".json" if timestamps else ".mp3"
+        )
+        redis_client = get_redis_client() if settings.TTS_CACHE_REDIS else None
+        _tts_caches[name] = TTSCache(disk, redis_client, settings.TTS_CACHE_REDIS_TTL)
+
+    return _tts_caches[name]
+
+
+def deck_split_points(texts: list[str], alignment: dict) -> list[float]:
+    """
+    글자별 시각 정보로 텍스트별 시작 시각을 계산합니다.
+
+    경계는 앞 텍스트의 마지막 글자가 끝난 시각과 다음 텍스트의 첫 글자가 시작한
+    시각의 중간(쉼의 가운데)입니다.
+
+    Args:
+        texts: DECK_SEPARATOR로 이어 합성한 텍스트들
+        alignment: API 응답의 alignment
+
+    Returns:
+        텍스트별 시작 시각 (초, 첫 항목은 0)
+    """
+    starts = alignment["character_start_times_seconds"]
+    ends = alignment["character_end_times_seconds"]
+    joined_length = len(DECK_SEPARATOR.join(texts))
+
+    if len(starts) != joined_length:
+        # 공급자가 글자를 다르게 나눈 경우 위치 비율로 대응
+        logger.warning("시각 정보 글자 수 불일치 (%d/%d), 비율로 경계 계산", len(starts), joined_length)
+
+    def at(position: int) -> int:
+        index = round(position * len(starts) / joined_length) if len(starts) != joined_length else position
+        return min(max(index, 0), len(starts) - 1)
+
+    points = [0.0]
+    position = 0
+    for previous, text in zip(texts, texts[1:]):
+        previous_end = position + len(previous) - 1
+        position += len(previous) + len(DECK_SEPARATOR)
+        points.append((ends[at(previous_end)] + starts[at(position)]) / 2)
+
+    # 경계가 거꾸로 가지 않도록 보정
+    for i in range(1, len(points)):
+        points[i] = max(points[i], points[i - 1])
+
+    return points
+
+
+class TTSService:
+    """음성 생성 서비스"""
+
+    def __init__(
+        self,
+        voice: str = "Sarah",
+        model_id: str | None = None,
+        voice_settings: dict | None = None,
+        api_key: str | None = None
+    ):
+        self.voice_id = VOICE_IDS.get(voice, voice)
+        self.model_id = model_id or settings.ELEVENLABS_MODEL_ID
+        self.voice_settings = voice_settings or DEFAULT_VOICE_SETTINGS
+        self.api_key = api_key
+
+    def synthesize(self, text: str, output_path: Path) -> Path | None:
+        """
+        음성 하나를 생성해 파일로 저장합니다.
+
+        Args:
+            text: 읽을 텍스트
+            output_path: 저장 경로
+
+        Returns:
+            파일 경로 (실패 시 None)
+        """
+        return self.synthesize_many([VoiceJob(text, output_path)])[0]
+
+    def synthesize_stream(
+        self,
+        text: str,
+        output_path: Path,
+        on_ready: Callable[[Path], None] | None = None
+    ) -> Path | None:
+        """
+        스트리밍으로 음성 하나를 생성합니다 (조각 단위로 파일에 기록).
+
+        on_ready는 미리듣기처럼 일부만으로 시작할 수 있는 호출자용으로, 약 1초
+        분량이 기록되면 이벤트 루프 스레드에서 한 번 호출됩니다. 캐시에 있으면
+        복사 후 바로 호출합니다. 릴스 렌더링은 내레이션 전체 길이로 장면 시간을
+        정하므로 알림 없이 파일이 완성될 때까지 기다립니다.
+
+        Args:
+            text: 읽을 텍스트
+            output_path: 저장 경로
+            on_ready: 다음 단계 시작 알림 콜백
+
+        Returns:
+            파일 경로 (실패 시 None)
+        """
+        return run_sync(self.asynthesize_stream(text, output_path, on_ready))
+
+    async def asynthesize_stream(
+        self,
+        text: str,
+        output_path: Path,
+        on_ready: Callable[[Path], None] | None = None
+    ) -> Path | None:
+        """
+        synthesize_stream()의 비동기 버전.
+
+        Args:
+            text: 읽을 텍스트
+            output_path: 저장 경로
+            on_ready: 다음 단계 시작 알림 콜백
+
+        Returns:
+            파일 경로 (실패 시 None)
+        """
+        request = self._request(text)
+        cache = get_tts_cache()
+        key = TTSCache.key(request)
+
+        hit = await asyncio.to_thread(cache.get, key) if cache is not None else None
+        if hit is not None:
+            logger.info("TTS 캐시 적중: %s", output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(shutil.copyfile, hit, output_path)
+            if on_ready is not None:
+                on_ready(output_path)
+            return output_path
+
+        try:
+            async with ElevenLabsClient(api_key=self.api_key) as client:
+                await client.stream_to_file(request, output_path, on_ready=on_ready)
+        except TTSGenerationError as e:
+            logger.warning("음성 생성 실패: %s", e)
+            return None
+
+        if cache is not None:
+            await asyncio.to_thread(cache.put_file, key, output_path)
+
+        return output_path
+
+    def synthesize_long(
+        self,
+        text: str,
+        output_path: Path,
+        max_chars: int | None = None,
+        gap: float | None = None
+    ) -> Path | None:
+        """
+        긴 내레이션을 문장 조각으로 나눠 동시에 합성한 뒤 이어붙입니다.
+
+        전체 대기 시간이 내레이션 길이가 아니라 가장 느린 조각에 좌우됩니다.
+        조각마다 앞뒤 조각을 문맥으로 넘겨 억양이 끊기지 않게 합니다. 문맥이
+        억양을 바꾸므로 캐시 키에도 포함되어, 대본 일부를 고치면 고친 조각과
+        바로 앞뒤 조각은 다시 합성하고 그 밖의 조각만 캐시를 재사용합니다.
+
+        Args:
+            text: 읽을 텍스트
+            output_path: 저장 경로 (WAV)
+            max_chars: 조각 최대 글자 수 (기본값: TTS_CHUNK_MAX_CHARS)
+            gap: 조각 사이 무음 (초, 기본값: TTS_SENTENCE_GAP)
+
+        Returns:
+            파일 경로 (조각 하나라도 실패하면 None)
+        """
+        chunks = sentence_chunks(text, max_chars or settings.TTS_CHUNK_MAX_CHARS)
+        if not chunks:
+            return None
+
+        work_dir = settings.TEMP_DIR / f"tts_{uuid.uuid4().hex[:8]}"
+        jobs = [VoiceJob(chunk, work_dir / f"chunk_{i:03d}.mp3") for i, chunk in enumerate(chunks)]
+        contexts = [
+            (chunks[i - 1] if i else None, chunks[i + 1] if i + 1 < len(chunks) else None)
+            for i in range(len(chunks))
+        ]
+
+        logger.info("내레이션 %d개 조각 동시 합성 (%d자)", len(chunks), len(text))
+
+        try:
+            paths = run_sync(self.asynthesize_many(jobs, contexts))
+            if any(path is None for path in paths):
+                return None
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            stitch_audio(paths, output_path, gap=settings.TTS_SENTENCE_GAP if gap is None else gap)
+            return output_path
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def synthesize_deck(self, texts: list[str], output_path: Path) -> DeckNarration | None:
+        """
+        덱 전체 내레이션을 요청 한 번으로 합성합니다.
+
+        카드마다 따로 요청할 때 드는 연결/대기/모델 준비 시간과 요청 수를 줄입니다.
+
+        Args:
+            texts: 카드 순서대로 읽을 텍스트들
+            output_path: 내레이션 MP3 저장 경로
+
+        Returns:
+            DeckNarration (실패 시 None → 카드별 합성으로 대체)
+        """
+        return run_sync(self.asynthesize_deck(texts, output_path))
+
+    async def asynthesize_deck(self, texts: list[str], output_path: Path) -> DeckNarration | None:
+        """
+        synthesize_deck()의 비동기 버전.
+
+        Args:
+            texts: 카드 순서대로 읽을 텍스트들
+            output_path: 내레이션 MP3 저장 경로
+
+        Returns:
+            DeckNarration (실패 시 None)
+        """
+        if not texts:
+            return None
+
+        request = self._request(DECK_SEPARATOR.join(texts))
+        cache = get_tts_cache(timestamps=True)
+        key = TTSCache.key(request)
+
+        hit = await asyncio.to_thread(cache.get, key) if cache is not None else None
+        try:
+            if hit is not None:
+                logger.info("TTS 덱 캐시 적중: %s", output_path)
+                data = json.loads(hit.read_bytes())
+            else:
+                async with ElevenLabsClient(api_key=self.api_key) as client:
+                    data = await client.synthesize_with_timestamps(request)
+                if cache is not None:
+                    await asyncio.to_thread(cache.put, key, json.dumps(data).encode("utf-8"))
+
+            starts = deck_split_points(texts, data["alignment"])
+            audio = base64.b64decode(data["audio_base64"])
+        except (TTSGenerationError, KeyError, TypeError, ValueError) as e:
+            logger.warning("덱 음성 생성 실패: %s", e)
+            return None
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(audio)
+
+        return DeckNarration(path=output_path, starts=starts)
+
+    def synthesize_many(self, jobs: list[VoiceJob]) -> list[Path | None]:
+        """
+        여러 음성을 동시에 생성해 파일로 저장합니다.
+
+        Args:
+            jobs: 합성 작업 리스트
+
+        Returns:
+            작업 순서대로 정렬된 파일 경로 (실패한 항목은 None)
+        """
+        return run_sync(self.asynthesize_many(jobs))
+
+    async def asynthesize_many(
+        self,
+        jobs: list[VoiceJob],
+        contexts: list[tuple[str | None, str | None]] | None = None
+    ) -> list[Path | None]:
+        """
+        synthesize_many()의 비동기 버전 (이미 이벤트 루프 안에 있을 때).
+
+        Args:
+            jobs: 합성 작업 리스트
+            contexts: 작업별 (앞 문맥, 뒤 문맥) 텍스트
+
+        Returns:
+            작업 순서대로 정렬된 파일 경로 (실패한 항목은 None)
+        """
+        contexts = contexts or [(None, None)] * len(jobs)
+        requests = [
+            self._request(job.text, previous_text, next_text)
+            for job, (previous_text, next_text) in zip(jobs, contexts)
+        ]
+
+        cache = get_tts_cache()
+        keys = [TTSCache.key(request) for request in requests]
+
+        # 캐시에 없는 문장만, 같은 문장은 한 번만 요청
+        cached: dict[str, Path] = {}
+        pending: dict[str, SynthesisRequest] = {}
+        for key, request in zip(keys, requests):
+            if key in cached or key in pending:
+                continue
+            hit = await asyncio.to_thread(cache.get, key) if cache is not None else None
+            if hit is not None:
+                cached[key] = hit
+            else:
+                pending[key] = request
+
+        if cached:
+            logger.info("TTS 캐시 적중: %d/%d개", len(cached), len(cached) + len(pending))
+
+        results: dict[str, bytes | Exception] = {}
+        if pending:
+            async with ElevenLabsClient(api_key=self.api_key) as client:
+                synthesized = await client.synthesize_many(list(pending.values()))
+            results = dict(zip(pending, synthesized))
+
+        paths: list[Path | None] = []
+        for i, (job, key) in enumerate(zip(jobs, keys), 1):
+            result = results.get(key)
+            if isinstance(result, Exception):
+                logger.warning("음성 생성 실패 (%d/%d): %s", i, len(jobs), result)
+                paths.append(None)
+                continue
+
+            job.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            if key not in cached and cache is not None:
+                cached[key] = await asyncio.to_thread(cache.put, key, result)
+
+            if key in cached:
+                await asyncio.to_thread(shutil.copyfile, cached[key], job.output_path)
+            else:
+                job.output_path.write_bytes(result)
+            paths.append(job.output_path)
+
+        return paths
+
+    def _request(
+        self,
+        text: str,
+        previous_text: str | None = None,
+        next_text: str | None = None
+    ) -> SynthesisRequest:
+        """이 서비스의 음성/모델/설정으로 합성 요청 생성"""
+        return SynthesisRequest(
+            text=text,
+            voice_id=self.voice_id,
+            model_id=self.model_id,
+            voice_settings=self.voice_settings,
+            previous_text=previous_text,
+            next_text=next_text
+        )
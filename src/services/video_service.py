@@ -0,0 +1,873 @@
+"""
+영상 합성 서비스
+
+장면(정지 이미지 + 노출 시간)과 음성, 자막을 하나의 ffmpeg 필터그래프로 묶어
+릴스 영상을 한 번의 인코딩으로 렌더링합니다. 장면 이미지는 중간 파일 없이
+rawvideo 프레임으로 ffmpeg 표준입력에 전달됩니다.
+"""
+
+import json
+import logging
+import os
+import uuid
+from collections.abc import Iterator
+from itertools import chain, repeat
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from src.core.config import settings
+from src.core.exceptions import VideoRenderError
+from src.utils.audio_utils import assemble_audio_track
+from src.utils.cache import DiskLRUCache, content_key
+from src.utils.ffmpeg_pool import FFmpegJob, get_ffmpeg_pool
+from src.utils.frame_source import (
+    MOTION_PIXEL_FORMAT,
+    fit_frame,
+    frame_bytes,
+    load_frame,
+    rawvideo_input_args,
+)
+from src.utils.motion import Motion, crop_trajectory, motion_frames, prepare_source, to_yuv420
+from src.utils.text_layout import load_font, wrap_text
+from src.utils.video_utils import escape_filter_value, format_seconds
+
+logger = logging.getLogger(__name__)
+
+# 세그먼트 인코딩 방식이 바뀌면 올려서 기존 캐시를 무효화
+SEGMENT_CACHE_VERSION = 6
+
+# 정지 장면용 x264 설정
+# 같은 프레임이 반복되므로 움직임 탐색/B프레임/RD 최적화는 거의 효과가 없고
+# 시간만 듭니다. 첫 I프레임 화질은 CRF가 유지합니다.
+STILL_IMAGE_X264_PARAMS = "me=dia:subme=1:ref=1:trellis=0:bframes=0:rc-lookahead=10"
+STILL_IMAGE_GOP_SECONDS = 10
+
+# 장면 전환 기본 길이 (초, 경계 앞뒤로 절반씩)
+DEFAULT_TRANSITION_DURATION = 0.5
+
+# 자막 글자 크기 (SRT 자막은 PlayResY=288 기준으로 영상 높이에 맞춰 확대됨)
+SUBTITLE_FONT_SIZE = 24
+SUBTITLE_PLAY_RES_Y = 288
+SUBTITLE_MAX_LINES = 3
+
+# 자막 스타일 (작고 하단에 표시)
+DEFAULT_SUBTITLE_STYLE = (
+    "FontName=AppleSDGothicNeo-Bold,"
+    f"FontSize={SUBTITLE_FONT_SIZE},"  # 작은 크기
+    "PrimaryColour=&HFFFFFF&,"  # 흰색
+    "OutlineColour=&H000000&,"  # 검은색 테두리
+    "Outline=2,"                # 테두리 두께
+    "Shadow=1,"                 # 그림자
+    "Alignment=2,"              # 하단 중앙
+    "MarginV=50"                # 하단 여백
+)
+
+
+@dataclass
+class Scene:
+    """영상 한 장면 (정지 이미지 + 노출 시간, 선택적으로 장면별 음성)
+
+    image에는 이미지 파일 경로 또는 메모리상의 Pillow 이미지를 지정합니다.
+    motion을 지정하면 장면 동안 Ken Burns 방식으로 확대/이동합니다.
+    """
+
+    image: str | Path | Image.Image
+    duration: float
+    audio_path: str | None = None
+    motion: Motion | None = None
+
+    @property
+    def is_static(self) -> bool:
+        """장면 동안 화면이 바뀌지 않는지 여부"""
+        return self.motion is None
+
+
+@dataclass
+class EncodeSettings:
+    """최종 인코딩 설정"""
+
+    preset: str = field(default_factory=lambda: settings.VIDEO_PRESET)
+    crf: int = field(default_factory=lambda: settings.VIDEO_CRF)
+    video_bitrate: str | None = None
+    audio_bitrate: str = field(default_factory=lambda: settings.AUDIO_BITRATE)
+    still_profile: bool = field(default_factory=lambda: settings.VIDEO_STILL_PROFILE)
+
+    def video_args(self, fps: int, still: bool = False) -> list[str]:
+        """
+        비디오 인코더 인자
+
+        Args:
+            fps: 출력 프레임레이트
+            still: 정지 장면만 있는지 여부 (still_profile이 켜져 있으면 전용 설정 사용)
+        """
+        args = [
+            '-c:v', settings.VIDEO_CODEC,
+            '-preset', self.preset,
+            '-crf', str(self.crf),
+            '-pix_fmt', 'yuv420p',
+        ]
+
+        if self.video_bitrate:
+            args += ['-b:v', self.video_bitrate]
+
+        if still and self.still_profile and settings.VIDEO_CODEC == 'libx264':
+            # 긴 GOP + 반복 프레임 분석 최소화 (30fps 출력은 그대로)
+            args += [
+                '-tune', 'stillimage',
+                '-g', str(fps * STILL_IMAGE_GOP_SECONDS),
+                '-x264-params', STILL_IMAGE_X264_PARAMS,
+            ]
+
+        return args
+
+    def audio_args(self) -> list[str]:
+        """오디오 인코더 인자"""
+        return ['-c:a', settings.AUDIO_CODEC, '-b:a', self.audio_bitrate]
+
+
+@dataclass
+class _Clip:
+    """세그먼트에 들어가는 장면 구간"""
+
+    scene: Scene
+    source: bytes | np.ndarray  # 정지 장면: 출력 해상도 프레임, 움직임 장면: 확대 원본
+    digest: str                 # source 내용 해시 (캐시 키용)
+    first: int                  # 장면 내 시작 프레임
+    count: int                  # 프레임 수
+    scene_frames: int           # 장면 전체 프레임 수 (움직임 궤적 계산용)
+
+
+@dataclass
+class _Segment:
+    """세그먼트 렌더링 단위 (장면 본문 또는 두 장면 사이 전환)"""
+
+    clips: list[_Clip]          # 본문은 1개, 전환은 [이전 장면, 다음 장면]
+    start: float                # 전체 영상 기준 시작 시각 (초)
+    transition: str | None = None
+
+
+_segment_cache: DiskLRUCache | None = None
+
+
+def get_segment_cache() -> DiskLRUCache | None:
+    """
+    인코딩된 세그먼트 캐시를 반환합니다.
+
+    Returns:
+        MEDIA_CACHE_DIR/segments 디스크 캐시 (SEGMENT_CACHE_MAX_MB=0이면 None)
+    """
+    global _segment_cache
+
+    if settings.SEGMENT_CACHE_MAX_MB <= 0:
+        return None
+
+    if _segment_cache is None:
+        _segment_cache = DiskLRUCache(
+            settings.MEDIA_CACHE_DIR / "segments",
+            max_bytes=settings.SEGMENT_CACHE_MAX_MB * 1024 * 1024,
+            suffix=".mp4"
+        )
+
+    return _segment_cache
+
+
+class VideoService:
+    """
+    단일 패스 영상 렌더러
+
+    장면마다 프레임 한 장만 표준입력으로 보내고, 필터그래프에서 장면 시작 시각에
+    맞춰 타임스탬프를 배치한 뒤 fps 필터로 30fps를 채웁니다. 이어붙이기, 자막,
+    음성 합성까지 한 번에 처리하므로 x264 인코딩은 릴스당 한 번만 일어납니다.
+
+    장면이 서로 독립적인 경우(카드 뉴스 등) render_segments()로 장면별 세그먼트를
+    ffmpeg 풀에서 병렬 인코딩한 뒤 스트림 복사로 이어붙일 수 있습니다. 인코딩된
+    세그먼트는 입력 내용 해시로 캐시되어, 같은 카드는 다시 인코딩하지 않습니다.
+    장면 전환은 경계 앞뒤의 짧은 구간만 xfade로 따로 인코딩하므로 전체 영상을
+    다시 인코딩하지 않습니다.
+
+    움직임(Ken Burns) 장면은 프레임을 Python에서 잘라 모두 표준입력으로 보냅니다
+    (src/utils/motion.py).
+
+    정지 장면만 있는 영상은 정지 이미지 전용 x264 설정(-tune stillimage, 긴 GOP,
+    반복 프레임 분석 최소화)으로 인코딩합니다 (VIDEO_STILL_PROFILE).
+    """
+
+    def __init__(
+        self,
+        width: int | None = None,
+        height: int | None = None,
+        fps: int | None = None
+    ):
+        self.width = width or settings.VIDEO_OUTPUT_WIDTH
+        self.height = height or settings.VIDEO_OUTPUT_HEIGHT
+        self.fps = fps or settings.VIDEO_FPS
+
+    def render(
+        self,
+        scenes: list[Scene],
+        output_path: str | Path,
+        audio_path: str | None = None,
+        subtitles_path: str | Path | None = None,
+        encode: EncodeSettings | None = None,
+        subtitle_style: str = DEFAULT_SUBTITLE_STYLE
+    ) -> str:
+        """
+        장면 목록을 한 번의 인코딩으로 영상 파일로 렌더링합니다.
+
+        Args:
+            scenes: 장면 리스트
+            output_path: 출력 경로
+            audio_path: 전체 길이 내레이션 음성 (장면별 음성과 함께 쓸 수 없음)
+            subtitles_path: SRT 자막 파일 경로
+            encode: 인코딩 설정
+            subtitle_style: 자막 force_style 문자열
+
+        Returns:
+            생성된 영상 경로
+
+        Raises:
+            VideoRenderError: 입력이 잘못되었거나 ffmpeg 실행이 실패한 경우
+        """
+        cmd = self.build_command(
+            scenes,
+            output_path,
+            audio_path=audio_path,
+            subtitles_path=subtitles_path,
+            encode=encode,
+            subtitle_style=subtitle_style
+        )
+
+        get_ffmpeg_pool().run(cmd, stdin_chunks=self._iter_frames(scenes))
+
+        logger.info("영상 렌더링 완료: %s (%d개 장면)", output_path, len(scenes))
+
+        return str(output_path)
+
+    def wrap_subtitle(self, text: str) -> str:
+        """
+        자막 문장을 출력 해상도에서의 실제 픽셀 폭 기준으로 줄바꿈합니다.
+
+        Args:
+            text: 자막 문장
+
+        Returns:
+            줄바꿈 문자가 들어간 자막 (최대 SUBTITLE_MAX_LINES줄, 넘치면 말줄임)
+        """
+        font_px = round(SUBTITLE_FONT_SIZE * self.height / SUBTITLE_PLAY_RES_Y)
+        lines = wrap_text(
+            text,
+            load_font(font_px),
+            self.width * 0.9,
+            max_lines=SUBTITLE_MAX_LINES,
+            ellipsis=True
+        )
+        return "\n".join(lines)
+
+    def render_segments(
+        self,
+        scenes: list[Scene],
+        output_path: str | Path,
+        audio_path: str | None = None,
+        subtitles_path: str | Path | None = None,
+        encode: EncodeSettings | None = None,
+        subtitle_style: str = DEFAULT_SUBTITLE_STYLE,
+        transition: str | None = None,
+        transition_duration: float = DEFAULT_TRANSITION_DURATION
+    ) -> str:
+        """
+        장면별 세그먼트를 병렬 인코딩한 뒤 스트림 복사로 이어붙입니다.
+
+        세그먼트는 영상만 담고, 프레임 픽셀과 인코딩 설정이 같은 세그먼트는
+        캐시에서 가져옵니다. 자막은 세그먼트마다 해당 구간만 시간을 옮겨 번인합니다.
+
+        장면별 음성은 PCM으로 디코딩해 장면 길이(프레임 단위)에 맞춰 샘플 단위로
+        이어붙인 뒤, 이어붙이기 단계에서 한 번만 AAC로 인코딩합니다.
+
+        transition을 지정하면 장면 경계 앞뒤 transition_duration/2초씩만 xfade
+        전환 세그먼트로 따로 인코딩하고, 나머지 장면 본문은 장면 세그먼트로
+        인코딩(또는 캐시 재사용)해 그대로 이어붙입니다. 장면 경계 시각과 전체
+        길이는 전환이 없을 때와 같습니다.
+
+        Args:
+            scenes: 장면 리스트
+            output_path: 출력 경로
+            audio_path: 전체 길이 내레이션 음성 (이어붙일 때 한 번만 인코딩)
+            subtitles_path: SRT 자막 파일 경로
+            encode: 인코딩 설정
+            subtitle_style: 자막 force_style 문자열
+            transition: xfade 전환 효과 이름 (예: fade, slideleft, None이면 전환 없음)
+            transition_duration: 전환 길이 (초)
+
+        Returns:
+            생성된 영상 경로
+
+        Raises:
+            VideoRenderError: 세그먼트 인코딩 또는 이어붙이기 실패 시
+        """
+        if not scenes:
+            raise VideoRenderError("렌더링할 장면이 없습니다")
+
+        encode = encode or EncodeSettings()
+        sources = [self._scene_source(scene) for scene in scenes]
+        digests = [content_key(self._source_bytes(source)) for source in sources]
+
+        if transition and len(scenes) > 1:
+            segments = self._plan_transitions(scenes, sources, digests, transition, transition_duration)
+        else:
+            segments = self._plan_segments(scenes, sources, digests)
+
+        scene_audio = [scene.audio_path for scene in scenes]
+        if any(scene_audio) and not all(scene_audio):
+            raise VideoRenderError("장면별 음성은 모든 장면에 지정되어야 합니다")
+        if any(scene_audio) and audio_path:
+            raise VideoRenderError("장면별 음성과 전체 음성은 함께 사용할 수 없습니다")
+
+        # 스트림 복사로 이어붙이므로 모든 세그먼트(본문/전환)를 같은 인코더 설정으로
+        # (SPS가 하나라야 이어붙인 스트림을 디코더가 문제없이 읽음)
+        still_encode = all(scene.is_static for scene in scenes)
+
+        work_id = uuid.uuid4().hex[:8]
+        cache = get_segment_cache()
+
+        settings.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+
+        segment_paths: list[Path] = []
+        temp_paths: list[Path] = []
+
+        if all(scene_audio):
+            # 장면별 음성 → 장면 길이에 맞춘 하나의 트랙 (AAC 인코딩은 이어붙일 때 한 번)
+            track = assemble_audio_track(
+                scene_audio,
+                settings.TEMP_DIR / f"audio_{work_id}.wav",
+                durations=[count / self.fps for count in self._scene_frames(scenes)]
+            )
+            audio_path = str(track.path)
+            temp_paths.append(track.path)
+        jobs: list[FFmpegJob] = []
+        pending: list[tuple[str, Path]] = []
+
+        for i, segment in enumerate(segments):
+            key = self._segment_key(segment, encode, subtitles_path, subtitle_style, still_encode)
+
+            segment_path = settings.TEMP_DIR / f"segment_{work_id}_{i}.mp4"
+            segment_paths.append(segment_path)
+            temp_paths.append(segment_path)
+
+            # 캐시 적중: 작업 디렉토리로 링크해 인코딩 없이 이어붙이기에 사용
+            # (이어붙이기 전에 캐시 정리가 캐시 파일을 지워도 링크는 남음)
+            if cache and cache.link_to(key, segment_path):
+                continue
+
+            jobs.append(self._segment_job(
+                segment, segment_path, encode, subtitles_path, subtitle_style, still_encode
+            ))
+            pending.append((key, segment_path))
+
+        logger.info("세그먼트 캐시: %d개 적중, %d개 인코딩", len(segments) - len(jobs), len(jobs))
+
+        try:
+            get_ffmpeg_pool().run_many(jobs)
+
+            if cache:
+                # 작업 디렉토리 파일로 이어붙이므로 저장 중 정리가 일어나도 안전
+                for key, segment_path in pending:
+                    cache.put_file(key, segment_path)
+
+            self.concat_segments(segment_paths, output_path, audio_path=audio_path, encode=encode)
+        finally:
+            for segment_path in temp_paths:
+                try:
+                    os.remove(segment_path)
+                except OSError:
+                    pass
+
+        logger.info("세그먼트 렌더링 완료: %s (%d개 장면)", output_path, len(scenes))
+
+        return str(output_path)
+
+    def concat_segments(
+        self,
+        segment_paths: list[str | Path],
+        output_path: str | Path,
+        audio_path: str | None = None,
+        encode: EncodeSettings | None = None
+    ) -> str:
+        """
+        인코딩된 세그먼트를 재인코딩 없이 이어붙입니다.
+
+        Args:
+            segment_paths: 세그먼트 파일 경로 리스트 (같은 인코딩 설정이어야 함)
+            output_path: 출력 경로
+            audio_path: 함께 넣을 전체 길이 음성 (세그먼트 음성 대신 사용)
+            encode: 음성 인코딩 설정
+
+        Returns:
+            생성된 영상 경로
+        """
+        encode = encode or EncodeSettings()
+
+        concat_file = settings.TEMP_DIR / f"concat_{uuid.uuid4().hex[:8]}.txt"
+        with open(concat_file, 'w', encoding='utf-8') as f:
+            for segment_path in segment_paths:
+                escaped = str(Path(segment_path).resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', str(concat_file)]
+
+        if audio_path:
+            cmd += ['-i', audio_path, '-map', '0:v', '-map', '1:a', '-c:v', 'copy']
+            cmd += encode.audio_args() + ['-shortest']
+        else:
+            cmd += ['-c', 'copy']
+
+        cmd += ['-movflags', '+faststart', str(output_path)]
+
+        try:
+            get_ffmpeg_pool().run(cmd, threads=1)
+        finally:
+            try:
+                os.remove(concat_file)
+            except OSError:
+                pass
+
+        return str(output_path)
+
+    def build_command(
+        self,
+        scenes: list[Scene],
+        output_path: str | Path,
+        audio_path: str | None = None,
+        subtitles_path: str | Path | None = None,
+        encode: EncodeSettings | None = None,
+        subtitle_style: str = DEFAULT_SUBTITLE_STYLE,
+        subtitle_offset: float = 0.0,
+        still_encode: bool | None = None
+    ) -> list[str]:
+        """
+        단일 패스 렌더링용 ffmpeg 명령을 만듭니다.
+
+        Args:
+            render()와 동일
+            subtitle_offset: 자막 파일 기준 이 영상의 시작 시각 (세그먼트 렌더링용)
+            still_encode: 정지 장면 인코딩 설정 사용 여부 (None이면 장면이 모두
+                정지일 때 사용, 세그먼트 렌더링은 영상 전체 기준으로 지정)
+
+        Returns:
+            ffmpeg 명령 인자 리스트
+        """
+        if not scenes:
+            raise VideoRenderError("렌더링할 장면이 없습니다")
+
+        scene_audio = [scene.audio_path for scene in scenes]
+        use_scene_audio = any(scene_audio)
+
+        if use_scene_audio and not all(scene_audio):
+            raise VideoRenderError("장면별 음성은 모든 장면에 지정되어야 합니다")
+        if use_scene_audio and audio_path:
+            raise VideoRenderError("장면별 음성과 전체 음성은 함께 사용할 수 없습니다")
+
+        encode = encode or EncodeSettings()
+        still = all(scene.is_static for scene in scenes)
+
+        cmd = ['ffmpeg', '-y']
+
+        # 입력 0: 장면 프레임 (표준입력 rawvideo)
+        # 정지 장면만 있으면 장면당 한 장 + 종료 시각 표시용 한 장, 움직임이 있으면 모든 프레임(yuv420p)
+        if still:
+            cmd += rawvideo_input_args(self.width, self.height, 1)
+        else:
+            cmd += rawvideo_input_args(self.width, self.height, self.fps, MOTION_PIXEL_FORMAT)
+
+        # 입력: 음성
+        audio_inputs = scene_audio if use_scene_audio else ([audio_path] if audio_path else [])
+        for path in audio_inputs:
+            cmd += ['-i', path]
+
+        cmd += [
+            '-filter_complex',
+            self._build_filtergraph(
+                scenes, use_scene_audio, subtitles_path, subtitle_style, subtitle_offset, still
+            ),
+            '-map', '[vout]',
+        ]
+
+        if use_scene_audio:
+            cmd += ['-map', '[aout]']
+        elif audio_path:
+            cmd += ['-map', '1:a', '-shortest']
+
+        cmd += ['-r', str(self.fps)]
+        cmd += encode.video_args(self.fps, still=still if still_encode is None else still_encode)
+        if audio_inputs:
+            cmd += encode.audio_args()
+        cmd += ['-movflags', '+faststart', str(output_path)]
+
+        return cmd
+
+    def build_transition_command(
+        self,
+        transition: str,
+        duration: float,
+        output_path: str | Path,
+        subtitles_path: str | Path | None = None,
+        encode: EncodeSettings | None = None,
+        subtitle_style: str = DEFAULT_SUBTITLE_STYLE,
+        subtitle_offset: float = 0.0,
+        moving: bool = False,
+        still_encode: bool | None = None
+    ) -> list[str]:
+        """
+        두 장면 사이의 xfade 전환 세그먼트 ffmpeg 명령을 만듭니다.
+
+        정지 장면끼리는 표준입력으로 [이전 프레임, 다음 프레임, 다음 프레임(종료
+        시각 표시용)]을 받아 각각 duration초짜리 클립으로 채웁니다. moving이면
+        이전 장면 프레임들과 다음 장면 프레임들을 차례로 모두 받습니다. 두 클립은
+        전체 구간에 걸쳐 전환됩니다.
+
+        Args:
+            transition: xfade 전환 효과 이름
+            duration: 전환 세그먼트 길이 (초)
+            output_path: 출력 경로
+            subtitles_path: SRT 자막 파일 경로
+            encode: 인코딩 설정
+            subtitle_style: 자막 force_style 문자열
+            subtitle_offset: 자막 파일 기준 이 세그먼트의 시작 시각
+            moving: 움직임 장면이 포함되어 모든 프레임을 입력받는지 여부
+            still_encode: 정지 장면 인코딩 설정 사용 여부 (None이면 moving이 아닐 때
+                사용, 이어붙일 본문 세그먼트와 같은 설정이어야 함)
+
+        Returns:
+            ffmpeg 명령 인자 리스트
+        """
+        encode = encode or EncodeSettings()
+        length = format_seconds(duration)
+
+        if moving:
+            frame_count = round(duration * self.fps)
+            chains = [
+                "[0:v]format=yuv420p,setsar=1,split[va][vb]",
+                f"[va]trim=end_frame={frame_count}[vfrom]",
+                f"[vb]trim=start_frame={frame_count},setpts=PTS-STARTPTS,fps={self.fps}[vto]",
+            ]
+        else:
+            chains = [
+                f"[0:v]format=yuv420p,setsar=1,settb=AVTB,"
+                f"setpts='(if(eq(N,0),0,if(eq(N,1),{length},2*{length})))/TB',"
+                f"fps={self.fps},trim=end={format_seconds(duration * 2)},split[va][vb]",
+                f"[va]trim=end={length}[vfrom]",
+                f"[vb]trim=start={length},setpts=PTS-STARTPTS,fps={self.fps}[vto]",
+            ]
+
+        video_label = "[vx]" if subtitles_path else "[vout]"
+        chains.append(
+            f"[vfrom][vto]xfade=transition={transition}:duration={length}:offset=0{video_label}"
+        )
+        if subtitles_path:
+            chains.append(
+                f"[vx]{self._subtitle_filter(subtitles_path, subtitle_style, subtitle_offset)}[vout]"
+            )
+
+        cmd = ['ffmpeg', '-y']
+        if moving:
+            cmd += rawvideo_input_args(self.width, self.height, self.fps, MOTION_PIXEL_FORMAT)
+        else:
+            cmd += rawvideo_input_args(self.width, self.height, 1)
+        cmd += ['-filter_complex', ";".join(chains), '-map', '[vout]']
+        cmd += ['-r', str(self.fps)]
+        cmd += encode.video_args(self.fps, still=not moving if still_encode is None else still_encode)
+        cmd += ['-movflags', '+faststart', str(output_path)]
+
+        return cmd
+
+    def _iter_frames(self, scenes: list[Scene]) -> Iterator[bytes]:
+        """
+        장면 프레임을 rawvideo 바이트로 하나씩 생성
+
+        정지 장면만 있으면 장면당 한 장 + 종료 시각 표시용 한 장을, 움직임
+        장면이 있으면 출력 프레임을 모두 생성합니다.
+        """
+        if all(scene.is_static for scene in scenes):
+            frame = b""
+            for scene in scenes:
+                frame = self._scene_frame(scene)
+                yield frame
+
+            # 종료 시각 표시용 프레임 (fps 필터가 마지막 장면 길이를 채우도록)
+            yield frame
+            return
+
+        for scene, frame_count in zip(scenes, self._scene_frames(scenes)):
+            source = self._scene_source(scene)
+            yield from self._clip_frames(_Clip(scene, source, "", 0, frame_count, frame_count))
+
+    def _scene_image(self, scene: Scene) -> Image.Image:
+        """장면 원본 이미지 (파일이면 디코딩)"""
+        if isinstance(scene.image, Image.Image):
+            return scene.image
+        with Image.open(scene.image) as image:
+            image.load()
+            return image
+
+    def _scene_frame(self, scene: Scene) -> bytes:
+        """장면 이미지를 출력 해상도 rawvideo 바이트로 변환"""
+        if isinstance(scene.image, Image.Image):
+            image = fit_frame(scene.image, self.width, self.height)
+        else:
+            image = load_frame(scene.image, self.width, self.height)
+        return frame_bytes(image)
+
+    def _scene_source(self, scene: Scene) -> bytes | np.ndarray:
+        """정지 장면은 출력 프레임, 움직임 장면은 확대 원본 프레임"""
+        if scene.is_static:
+            return self._scene_frame(scene)
+        return prepare_source(self._scene_image(scene), self.width, self.height, scene.motion)
+
+    @staticmethod
+    def _source_bytes(source: bytes | np.ndarray) -> bytes:
+        """장면 원본의 바이트 표현 (캐시 키용)"""
+        if isinstance(source, np.ndarray):
+            return repr(source.shape).encode() + source.tobytes()
+        return source
+
+    def _clip_frames(self, clip: _Clip) -> Iterator[bytes]:
+        """장면 구간의 출력 프레임들 (yuv420p)"""
+        if clip.scene.is_static:
+            frame = np.frombuffer(clip.source, dtype=np.uint8).reshape(self.height, self.width, 3)
+            return repeat(to_yuv420(frame), clip.count)
+
+        height, width = clip.source.shape[:2]
+        trajectory = crop_trajectory(
+            clip.scene.motion,
+            (width, height),
+            self.width,
+            self.height,
+            clip.scene_frames,
+            np.arange(clip.first, clip.first + clip.count)
+        )
+        return motion_frames(clip.source, trajectory, self.width, self.height)
+
+    def _scene_frames(self, scenes: list[Scene]) -> list[int]:
+        """장면별 출력 프레임 수 (경계 시각을 프레임 단위로 반올림, 누적 오차 없음)"""
+        cuts = [0]
+        elapsed = 0.0
+        for scene in scenes:
+            elapsed += scene.duration
+            cuts.append(round(elapsed * self.fps))
+        return [end - start for start, end in zip(cuts, cuts[1:])]
+
+    def _plan_segments(
+        self,
+        scenes: list[Scene],
+        sources: list[bytes | np.ndarray],
+        digests: list[str]
+    ) -> list[_Segment]:
+        """장면 하나당 세그먼트 하나 (전환 없음)"""
+        segments = []
+        position = 0
+        for scene, source, digest, frame_count in zip(scenes, sources, digests, self._scene_frames(scenes)):
+            segments.append(_Segment(
+                clips=[_Clip(scene, source, digest, 0, frame_count, frame_count)],
+                start=position / self.fps
+            ))
+            position += frame_count
+        return segments
+
+    def _plan_transitions(
+        self,
+        scenes: list[Scene],
+        sources: list[bytes | np.ndarray],
+        digests: list[str],
+        transition: str,
+        transition_duration: float
+    ) -> list[_Segment]:
+        """장면 본문 세그먼트와 경계 전환 세그먼트를 번갈아 배치"""
+        scene_frames = self._scene_frames(scenes)
+
+        # 경계 앞뒤로 쓸 프레임 수 (가장 짧은 장면의 절반을 넘지 않도록)
+        half = min(round(transition_duration * self.fps / 2), min(scene_frames) // 2)
+        if half <= 0:
+            logger.warning("장면이 너무 짧아 전환 없이 렌더링합니다")
+            return self._plan_segments(scenes, sources, digests)
+
+        def clip(i: int, first: int, count: int) -> _Clip:
+            return _Clip(scenes[i], sources[i], digests[i], first, count, scene_frames[i])
+
+        segments = []
+        position = 0
+        for i in range(len(scenes)):
+            body_first = half if i > 0 else 0
+            body_end = scene_frames[i] - (half if i < len(scenes) - 1 else 0)
+
+            if body_end > body_first:
+                segments.append(_Segment(
+                    clips=[clip(i, body_first, body_end - body_first)],
+                    start=(position + body_first) / self.fps
+                ))
+
+            position += scene_frames[i]
+
+            if i < len(scenes) - 1:
+                # 경계 앞뒤 half 프레임 (각 장면 범위를 벗어난 부분은 움직임이 첫/끝 위치에 고정)
+                segments.append(_Segment(
+                    clips=[clip(i, scene_frames[i] - half, 2 * half), clip(i + 1, -half, 2 * half)],
+                    start=(position - half) / self.fps,
+                    transition=transition
+                ))
+
+        return segments
+
+    def _segment_job(
+        self,
+        segment: _Segment,
+        output_path: Path,
+        encode: EncodeSettings,
+        subtitles_path: str | Path | None,
+        subtitle_style: str,
+        still_encode: bool
+    ) -> FFmpegJob:
+        """세그먼트 하나의 인코딩 작업 (still_encode: 영상 전체 기준 정지 장면 인코딩 여부)"""
+        duration = segment.clips[0].count / self.fps
+        still = all(clip.scene.is_static for clip in segment.clips)
+
+        if segment.transition:
+            cmd = self.build_transition_command(
+                segment.transition,
+                duration,
+                output_path,
+                subtitles_path=subtitles_path,
+                encode=encode,
+                subtitle_style=subtitle_style,
+                subtitle_offset=segment.start,
+                moving=not still,
+                still_encode=still_encode
+            )
+            if still:
+                stdin_chunks = [clip.source for clip in segment.clips] + [segment.clips[-1].source]
+            else:
+                stdin_chunks = chain.from_iterable(self._clip_frames(clip) for clip in segment.clips)
+            return FFmpegJob(cmd=cmd, stdin_chunks=stdin_chunks)
+
+        clip = segment.clips[0]
+        scene = Scene(image=clip.scene.image, duration=duration, motion=clip.scene.motion)
+        cmd = self.build_command(
+            [scene],
+            output_path,
+            subtitles_path=subtitles_path,
+            encode=encode,
+            subtitle_style=subtitle_style,
+            subtitle_offset=segment.start,
+            still_encode=still_encode
+        )
+        stdin_chunks = [clip.source] * 2 if still else self._clip_frames(clip)
+        return FFmpegJob(cmd=cmd, stdin_chunks=stdin_chunks)
+
+    def _segment_key(
+        self,
+        segment: _Segment,
+        encode: EncodeSettings,
+        subtitles_path: str | Path | None,
+        subtitle_style: str,
+        still_encode: bool
+    ) -> str:
+        """세그먼트 캐시 키 (장면 원본, 구간, 움직임, 전환, 자막 구간, 인코딩 설정)"""
+        params = {
+            "version": SEGMENT_CACHE_VERSION,
+            "size": [self.width, self.height],
+            "fps": self.fps,
+            "transition": segment.transition,
+            "clips": [
+                {
+                    "source": clip.digest,
+                    "range": [clip.first, clip.count, clip.scene_frames],
+                    "motion": asdict(clip.scene.motion) if clip.scene.motion else None,
+                }
+                for clip in segment.clips
+            ],
+            "codec": settings.VIDEO_CODEC,
+            "encode": asdict(encode),
+            "still_encode": still_encode,
+        }
+
+        subtitles = b""
+        if subtitles_path:
+            subtitles = Path(subtitles_path).read_bytes()
+            params["subtitles"] = [format_seconds(segment.start), subtitle_style]
+
+        return content_key(json.dumps(params, sort_keys=True), subtitles)
+
+    def _build_filtergraph(
+        self,
+        scenes: list[Scene],
+        use_scene_audio: bool,
+        subtitles_path: str | Path | None,
+        subtitle_style: str,
+        subtitle_offset: float = 0.0,
+        still: bool = True
+    ) -> str:
+        """장면 타임스탬프 배치 → 30fps 채우기 → 자막 / 음성 이어붙이기 필터그래프 생성"""
+        video_label = "[vcat]" if subtitles_path else "[vout]"
+
+        if still:
+            chains = [self._still_video_chain(scenes, video_label)]
+        else:
+            # 모든 프레임이 출력 프레임레이트로 들어옴
+            chains = [f"[0:v]format=yuv420p,setsar=1{video_label}"]
+
+        if use_scene_audio:
+            chains += self._scene_audio_chains([scene.duration for scene in scenes], 1)
+
+        if subtitles_path:
+            chains.append(
+                f"[vcat]{self._subtitle_filter(subtitles_path, subtitle_style, subtitle_offset)}[vout]"
+            )
+
+        return ";".join(chains)
+
+    def _still_video_chain(self, scenes: list[Scene], video_label: str) -> str:
+        """장면당 한 장씩 들어온 프레임을 장면 시작 시각에 배치하고 30fps로 채우는 필터"""
+        starts = []
+        elapsed = 0.0
+        for scene in scenes:
+            starts.append(elapsed)
+            elapsed += scene.duration
+
+        # N번째 입력 프레임 → 장면 시작 시각 (마지막 N은 영상 종료 시각)
+        pts_expr = format_seconds(elapsed)
+        for index in range(len(scenes) - 1, 0, -1):
+            pts_expr = f"if(eq(N,{index}),{format_seconds(starts[index])},{pts_expr})"
+        pts_expr = f"if(eq(N,0),0,{pts_expr})"
+
+        return (
+            f"[0:v]format=yuv420p,setsar=1,settb=AVTB,setpts='({pts_expr})/TB',"
+            f"fps={self.fps},trim=end={format_seconds(elapsed)}{video_label}"
+        )
+
+    @staticmethod
+    def _scene_audio_chains(durations: list[float], first_input: int) -> list[str]:
+        """장면별 음성을 장면 길이에 맞춰 이어붙이는 필터 체인 ([aout] 출력)"""
+        chains = []
+        audio_inputs = []
+        for i, duration in enumerate(durations):
+            # 음성 길이를 장면 길이에 정확히 맞춤 (짧으면 무음으로 채움)
+            chains.append(
+                f"[{first_input + i}:a]aresample=44100,"
+                f"aformat=sample_fmts=fltp:channel_layouts=stereo,"
+                f"apad,atrim=0:{format_seconds(duration)}[a{i}]"
+            )
+            audio_inputs.append(f"[a{i}]")
+        chains.append(f"{''.join(audio_inputs)}concat=n={len(durations)}:v=0:a=1[aout]")
+        return chains
+
+    @staticmethod
+    def _subtitle_filter(subtitles_path: str | Path, subtitle_style: str, offset: float = 0.0) -> str:
+        """자막 번인 필터 (offset만큼 자막 시간을 옮겨 세그먼트 구간에 맞춤)"""
+        subtitles = (
+            f"subtitles={escape_filter_value(subtitles_path)}"
+            f":force_style='{subtitle_style}'"
+        )
+        if not offset:
+            return subtitles
+        return f"setpts=PTS+{format_seconds(offset)}/TB,{subtitles},setpts=PTS-STARTPTS"
@@ -0,0 +1,297 @@
+"""
+오디오 트랙 조립
+
+장면별 내레이션을 PCM으로 한 번씩 디코딩한 뒤 샘플 단위로 정확히 이어붙여 하나의
+WAV 트랙으로 만듭니다. 최종 AAC 인코딩은 영상 하나당 한 번만 일어나므로 조각마다
+생기던 AAC 프라이밍 무음과 경계 누적 오차가 없습니다.
+
+문장 단위로 나눠 합성한 긴 내레이션은 stitch_audio()로 앞뒤 무음을 정리하고 음량을
+맞춘 뒤 일정한 간격으로 이어붙입니다.
+"""
+
+import logging
+import math
+import uuid
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.exceptions import VideoRenderError
+from src.utils.ffmpeg_pool import get_ffmpeg_pool
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SAMPLE_WIDTH = 2  # s16le
+
+# 문장 이어붙이기: 무음 판정 기준, 목표 음량(RMS), 최대 피크 (dBFS)
+SILENCE_THRESHOLD_DB = -45.0
+TARGET_RMS_DB = -20.0
+PEAK_LIMIT_DB = -1.0
+
+
+@dataclass
+class AudioTrack:
+    """이어붙인 내레이션 트랙"""
+
+    path: Path
+    offsets: list[float]    # 조각별 시작 시각 (초)
+    durations: list[float]  # 조각별 길이 (초, 무음 채움 포함)
+    sample_rate: int = SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        """전체 길이 (초)"""
+        return self.offsets[-1] + self.durations[-1] if self.offsets else 0.0
+
+
+def decode_pcm(path: str | Path, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS) -> bytes:
+    """
+    오디오 파일을 s16le PCM으로 디코딩합니다.
+
+    MP3 인코더 지연/패딩(LAME 태그)은 ffmpeg 디코더가 잘라 냅니다.
+
+    Args:
+        path: 오디오 파일 경로
+        sample_rate: 샘플레이트
+        channels: 채널 수
+
+    Returns:
+        PCM 바이트
+
+    Raises:
+        VideoRenderError: 디코딩 실패 시
+    """
+    settings.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    pcm_path = settings.TEMP_DIR / f"pcm_{uuid.uuid4().hex[:8]}.raw"
+
+    cmd = [
+        'ffmpeg', '-y', '-i', str(path),
+        '-vn', '-f', 's16le', '-acodec', 'pcm_s16le',
+        '-ar', str(sample_rate), '-ac', str(channels),
+        str(pcm_path),
+    ]
+
+    try:
+        get_ffmpeg_pool().run(cmd, threads=1)
+        return pcm_path.read_bytes()
+    finally:
+        pcm_path.unlink(missing_ok=True)
+
+
+def assemble_audio_track(
+    paths: list[str | Path | None],
+    output_path: str | Path,
+    durations: list[float] | None = None,
+    frame_rate: int | None = None,
+    fallback_duration: float | None = None
+) -> AudioTrack:
+    """
+    내레이션 조각들을 하나의 WAV 트랙으로 이어붙입니다.
+
+    조각 경계는 전체 타임라인 기준 누적 시각으로 계산하므로 조각이 많아도 오차가
+    쌓이지 않습니다.
+
+    Args:
+        paths: 조각 오디오 파일 경로 리스트 (순서대로, None은 생성 실패한 조각)
+        output_path: 출력 WAV 경로
+        durations: 조각별 길이 (지정하면 짧은 조각은 무음으로 채우고 긴 조각은 자름)
+        frame_rate: 지정하면 조각 길이를 영상 프레임 단위로 올림 (durations 미지정 시)
+        fallback_duration: 디코딩에 실패했거나 경로가 None인 조각을 이 길이의 무음으로 대체
+            (None이면 예외)
+
+    Returns:
+        AudioTrack (조각별 시작 시각/길이 포함)
+
+    Raises:
+        VideoRenderError: 디코딩 실패 시 (fallback_duration 미지정)
+    """
+    frame_bytes = SAMPLE_WIDTH * CHANNELS
+
+    def decode(path: str | Path | None) -> bytes | None:
+        try:
+            if path is None:
+                raise VideoRenderError("음성 파일 없음")
+            return decode_pcm(path)
+        except VideoRenderError as e:
+            if fallback_duration is None:
+                raise
+            logger.warning("음성 디코딩 실패, %.1f초 무음으로 대체: %s (%s)", fallback_duration, path, e)
+            return None
+
+    # 디코딩은 파일별로 독립적이므로 풀 크기만큼 동시에 실행
+    with ThreadPoolExecutor(max_workers=get_ffmpeg_pool().max_workers) as executor:
+        pieces = list(executor.map(decode, paths))
+
+    sample_counts = [
+        len(pcm) // frame_bytes if pcm is not None else round(fallback_duration * SAMPLE_RATE)
+        for pcm in pieces
+    ]
+
+    return _write_track(pieces, sample_counts, output_path, durations, frame_rate)
+
+
+def split_audio_track(
+    path: str | Path,
+    starts: list[float],
+    output_path: str | Path,
+    frame_rate: int | None = None
+) -> AudioTrack:
+    """
+    음성 파일 하나를 지정한 시각에서 잘라 조각별 길이를 가진 WAV 트랙으로 만듭니다.
+
+    덱 전체를 한 번에 합성한 내레이션을 카드별로 나눌 때 사용합니다. 첫 조각은
+    항상 0초부터 시작하고, 마지막 조각은 파일 끝까지입니다.
+
+    Args:
+        path: 음성 파일 경로
+        starts: 조각별 시작 시각 (초, 오름차순)
+        output_path: 출력 WAV 경로
+        frame_rate: 지정하면 조각 길이를 영상 프레임 단위로 올림 (모자란 부분은 무음)
+
+    Returns:
+        AudioTrack (조각별 시작 시각/길이 포함)
+
+    Raises:
+        VideoRenderError: 디코딩 실패 시
+    """
+    frame_bytes = SAMPLE_WIDTH * CHANNELS
+    pcm = decode_pcm(path)
+    total = len(pcm) // frame_bytes
+
+    cuts = [0] + [min(max(round(start * SAMPLE_RATE), 0), total) for start in starts[1:]] + [total]
+    pieces = [pcm[begin * frame_bytes:end * frame_bytes] for begin, end in zip(cuts, cuts[1:])]
+    sample_counts = [max(end - begin, 0) for begin, end in zip(cuts, cuts[1:])]
+
+    return _write_track(pieces, sample_counts, output_path, frame_rate=frame_rate)
+
+
+def stitch_audio(
+    paths: list[str | Path],
+    output_path: str | Path,
+    gap: float = 0.25,
+    edge_padding: float = 0.03
+) -> float:
+    """
+    문장 조각들을 같은 간격, 같은 음량으로 이어붙여 WAV로 저장합니다.
+
+    조각마다 앞뒤 무음을 잘라 낸 뒤(edge_padding만 남김) 사이에 gap만큼 무음을
+    넣으므로, 공급자가 조각마다 다르게 붙이는 무음과 상관없이 문장 간격이
+    일정합니다. 음량은 말소리 구간의 RMS를 TARGET_RMS_DB로 맞추되 피크가
+    PEAK_LIMIT_DB를 넘지 않게 합니다.
+
+    Args:
+        paths: 조각 오디오 파일 경로 리스트 (순서대로)
+        output_path: 출력 WAV 경로
+        gap: 조각 사이 무음 길이 (초)
+        edge_padding: 조각 앞뒤에 남길 무음 길이 (초)
+
+    Returns:
+        전체 길이 (초)
+
+    Raises:
+        VideoRenderError: 디코딩 실패 시
+    """
+    with ThreadPoolExecutor(max_workers=get_ffmpeg_pool().max_workers) as executor:
+        pieces = list(executor.map(decode_pcm, paths))
+
+    padding = round(edge_padding * SAMPLE_RATE)
+    gap_samples = np.zeros((round(gap * SAMPLE_RATE), CHANNELS), dtype=np.int16)
+
+    parts = []
+    for i, pcm in enumerate(pieces):
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, CHANNELS)
+        samples = _normalize_loudness(_trim_silence(samples, padding))
+        if i:
+            parts.append(gap_samples)
+        parts.append(samples)
+
+    audio = np.concatenate(parts) if parts else np.zeros((0, CHANNELS), dtype=np.int16)
+
+    with wave.open(str(output_path), 'wb') as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(audio.tobytes())
+
+    duration = len(audio) / SAMPLE_RATE
+    logger.info("문장 음성 이어붙이기 완료: %s (%d개, %.2f초)", output_path, len(paths), duration)
+
+    return duration
+
+
+def _trim_silence(samples: np.ndarray, padding: int) -> np.ndarray:
+    """앞뒤 무음 제거 (padding 샘플만 남김)"""
+    threshold = 32768 * 10 ** (SILENCE_THRESHOLD_DB / 20)
+    loud = np.flatnonzero(np.abs(samples.astype(np.int32)).max(axis=1) > threshold)
+    if not len(loud):
+        return samples[:0]
+
+    start = max(loud[0] - padding, 0)
+    end = min(loud[-1] + 1 + padding, len(samples))
+    return samples[start:end]
+
+
+def _normalize_loudness(samples: np.ndarray) -> np.ndarray:
+    """말소리 구간 RMS를 목표 음량으로 (피크 제한)"""
+    if not len(samples):
+        return samples
+
+    values = samples.astype(np.float32)
+    threshold = 32768 * 10 ** (SILENCE_THRESHOLD_DB / 20)
+    voiced = values[np.abs(values).max(axis=1) > threshold]
+    rms = float(np.sqrt(np.mean(voiced ** 2))) if len(voiced) else 0.0
+    if not rms:
+        return samples
+
+    gain = 32768 * 10 ** (TARGET_RMS_DB / 20) / rms
+    peak = float(np.abs(values).max())
+    gain = min(gain, 32768 * 10 ** (PEAK_LIMIT_DB / 20) / peak)
+
+    return np.clip(np.rint(values * gain), -32768, 32767).astype(np.int16)
+
+
+def _write_track(
+    pieces: list[bytes | None],
+    sample_counts: list[int],
+    output_path: str | Path,
+    durations: list[float] | None = None,
+    frame_rate: int | None = None
+) -> AudioTrack:
+    """조각 PCM들을 누적 시각 기준 샘플 경계에 맞춰 WAV로 기록"""
+    frame_bytes = SAMPLE_WIDTH * CHANNELS
+
+    # 조각별 목표 길이 (초)
+    if durations is None:
+        durations = [samples / SAMPLE_RATE for samples in sample_counts]
+        if frame_rate:
+            durations = [math.ceil(d * frame_rate - 1e-9) / frame_rate for d in durations]
+
+    # 누적 시각 → 샘플 경계
+    boundaries = [0]
+    elapsed = 0.0
+    for duration in durations:
+        elapsed += duration
+        boundaries.append(round(elapsed * SAMPLE_RATE))
+
+    with wave.open(str(output_path), 'wb') as wav:
+        wav.setnchannels(CHANNELS)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+
+        for i, pcm in enumerate(pieces):
+            target = (boundaries[i + 1] - boundaries[i]) * frame_bytes
+            data = (pcm or b"")[:target]
+            wav.writeframesraw(data + bytes(target - len(data)))
+
+    offsets = [boundary / SAMPLE_RATE for boundary in boundaries[:-1]]
+    lengths = [(end - start) / SAMPLE_RATE for start, end in zip(boundaries, boundaries[1:])]
+
+    logger.info("오디오 트랙 조립 완료: %s (%d개 조각, %.2f초)", output_path, len(pieces), elapsed)
+
+    return AudioTrack(path=Path(output_path), offsets=offsets, durations=lengths)
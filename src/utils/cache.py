@@ -0,0 +1,253 @@
+"""
+캐시 유틸리티
+
+콘텐츠 해시를 키로 하는 파일 캐시와 용량 기반 LRU 정리를 제공합니다.
+노드 간에 공유할 캐시는 Redis를 함께 사용합니다 (redis 패키지가 없거나 연결할 수
+없으면 디스크 캐시만 사용).
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def content_key(*parts: bytes | str) -> str:
+    """
+    여러 입력을 하나의 SHA-256 캐시 키로 만듭니다.
+
+    각 조각의 길이를 함께 넣어 경계가 달라지면 다른 키가 되도록 합니다.
+
+    Args:
+        parts: 바이트 또는 문자열 조각
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def file_digest(path: str | Path) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskLRUCache:
+    """
+    용량 기반 LRU 디스크 캐시
+
+    키 하나에 파일 하나를 저장합니다. 조회할 때마다 수정 시각을 갱신하고,
+    전체 크기가 예산을 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다.
+    쓰기는 임시 파일 → os.replace로 원자적으로 처리하므로 같은 디렉토리를
+    여러 워커가 공유해도 됩니다.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int, suffix: str = ""):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+
+        self._lock = threading.Lock()
+        self._size_estimate: int | None = None
+
+    def path_for(self, key: str) -> Path:
+        """키에 해당하는 캐시 파일 경로"""
+        return self.root / key[:2] / f"{key}{self.suffix}"
+
+    def get(self, key: str) -> Path | None:
+        """
+        캐시 파일을 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시 파일 경로 (없으면 None)
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # LRU 순서 갱신
+        except FileNotFoundError:
+            return None
+        return path
+
+    def link_to(self, key: str, dest: str | Path) -> Path | None:
+        """
+        캐시 파일을 dest에 하드 링크합니다 (링크할 수 없으면 복사).
+
+        조회한 파일을 잠시 뒤에 읽는 경우에 씁니다. 그 사이 캐시 정리(다른 워커
+        포함)가 캐시 파일을 지워도 dest는 그대로 남습니다.
+
+        Args:
+            key: 캐시 키
+            dest: 만들 파일 경로 (없어야 함)
+
+        Returns:
+            dest (캐시에 없으면 None)
+        """
+        path = self.path_for(key)
+        try:
+            os.utime(path)  # LRU 순서 갱신
+            try:
+                os.link(path, dest)
+            except FileNotFoundError:
+                raise
+            except OSError:
+                shutil.copyfile(path, dest)  # 다른 파일 시스템 등
+        except FileNotFoundError:
+            return None  # 조회 직후 정리된 경우
+        return Path(dest)
+
+    def put_file(self, key: str, source: str | Path, move: bool = False) -> Path:
+        """
+        파일을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            source: 저장할 파일
+            move: True면 복사 대신 이동
+
+        Returns:
+            캐시 파일 경로
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        if move:
+            shutil.move(str(source), tmp_path)
+        else:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+
+        self._added(path.stat().st_size)
+        return path
+
+    def put_bytes(self, key: str, data: bytes) -> Path:
+        """
+        바이트 데이터를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            data: 저장할 데이터
+
+        Returns:
+            캐시 파일 경로
+        """
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        self._added(len(data))
+        return path
+
+    def evict(self) -> int:
+        """
+        용량 예산을 넘는 만큼 오래된 파일부터 삭제합니다.
+
+        Returns:
+            삭제한 파일 수
+        """
+        entries = []
+        total = 0
+        for path in self.root.glob(f"*/*{self.suffix}"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+                if total <= self.max_bytes:
+                    break
+
+        with self._lock:
+            self._size_estimate = total
+
+        if removed:
+            logger.info("캐시 정리: %s (%d개 삭제)", self.root, removed)
+
+        return removed
+
+    def _added(self, size: int) -> None:
+        """저장 후 추정 용량을 갱신하고 예산 초과 시 정리"""
+        with self._lock:
+            if self._size_estimate is not None:
+                self._size_estimate += size
+            over_budget = self._size_estimate is None or self._size_estimate > self.max_bytes
+
+        if over_budget:
+            self.evict()
+
+
+_redis_client = None
+_redis_unavailable = False
+
+
+def get_redis_client():
+    """
+    프로세스 전역 Redis 클라이언트를 반환합니다 (REDIS_URL).
+
+    Returns:
+        redis.Redis 인스턴스 (redis 패키지가 없거나 연결 실패 시 None)
+    """
+    global _redis_client, _redis_unavailable
+
+    if _redis_client is not None or _redis_unavailable:
+        return _redis_client
+
+    try:
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=2.0,
+            socket_connect_timeout=2.0,
+        )
+        client.ping()
+    except Exception as e:
+        logger.warning("Redis 사용 불가, 디스크 캐시만 사용: %s", e)
+        _redis_unavailable = True
+        return None
+
+    _redis_client = client
+    return _redis_client
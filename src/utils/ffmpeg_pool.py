@@ -0,0 +1,160 @@
+"""
+ffmpeg 실행 풀
+
+동시에 실행되는 ffmpeg 프로세스 수를 제한하고, 프로세스마다 `-threads` 값을
+나눠 주어 전체 스레드 사용량이 CPU 예산을 넘지 않도록 합니다.
+"""
+
+import logging
+import os
+import subprocess
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.core.config import settings
+from src.utils.video_utils import run_ffmpeg
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FFmpegJob:
+    """풀에서 실행할 ffmpeg 작업"""
+
+    cmd: list[str]
+    stdin_chunks: Iterable[bytes] | None = None
+
+
+class FFmpegPool:
+    """
+    코어 수를 고려한 ffmpeg 프로세스 풀
+
+    - 동시에 실행되는 프로세스는 최대 max_workers개
+    - 실행 중인 프로세스들의 `-threads` 합계는 threads_budget 이하
+    """
+
+    def __init__(self, max_workers: int, threads_budget: int):
+        self.max_workers = max(1, max_workers)
+        self.threads_budget = max(1, threads_budget)
+
+        self._cond = threading.Condition()
+        self._running = 0
+        self._threads_in_use = 0
+
+    def run(
+        self,
+        cmd: list[str],
+        stdin_chunks: Iterable[bytes] | None = None,
+        threads: int | None = None
+    ) -> subprocess.CompletedProcess:
+        """
+        슬롯을 확보한 뒤 ffmpeg 명령 하나를 실행합니다.
+
+        Args:
+            cmd: ffmpeg 명령 (마지막 요소는 출력 경로)
+            stdin_chunks: 표준입력으로 보낼 데이터
+            threads: 희망 스레드 수 (미지정 시 남은 예산을 실행 중 프로세스와 나눔)
+
+        Returns:
+            실행 결과
+
+        Raises:
+            VideoRenderError: ffmpeg 실행 실패 시
+        """
+        allotted = self._acquire(threads)
+        try:
+            return run_ffmpeg(self._with_threads(cmd, allotted), stdin_chunks=stdin_chunks)
+        finally:
+            self._release(allotted)
+
+    def run_many(self, jobs: list[FFmpegJob]) -> list[subprocess.CompletedProcess]:
+        """
+        여러 ffmpeg 작업을 병렬로 실행합니다.
+
+        Args:
+            jobs: 작업 리스트
+
+        Returns:
+            작업 순서대로 정렬된 실행 결과
+
+        Raises:
+            VideoRenderError: 하나라도 실패한 경우 (첫 번째 실패)
+        """
+        if not jobs:
+            return []
+
+        concurrency = min(len(jobs), self.max_workers)
+        threads = max(1, self.threads_budget // concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self.run, job.cmd, job.stdin_chunks, threads)
+                for job in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def _acquire(self, threads: int | None) -> int:
+        """실행 슬롯과 스레드 예산 확보"""
+        with self._cond:
+            while (
+                self._running >= self.max_workers
+                or self._threads_in_use >= self.threads_budget
+            ):
+                self._cond.wait()
+
+            free = self.threads_budget - self._threads_in_use
+            desired = threads or max(1, self.threads_budget // (self._running + 1))
+            allotted = max(1, min(desired, free))
+
+            self._running += 1
+            self._threads_in_use += allotted
+            return allotted
+
+    def _release(self, allotted: int) -> None:
+        """실행 슬롯과 스레드 예산 반환"""
+        with self._cond:
+            self._running -= 1
+            self._threads_in_use -= allotted
+            self._cond.notify_all()
+
+    @staticmethod
+    def _with_threads(cmd: list[str], threads: int) -> list[str]:
+        """필터/인코더 스레드 수 옵션 추가"""
+        return (
+            cmd[:1]
+            + ['-filter_threads', str(threads)]
+            + cmd[1:-1]
+            + ['-threads', str(threads), cmd[-1]]
+        )
+
+
+_pool: FFmpegPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_ffmpeg_pool() -> FFmpegPool:
+    """
+    프로세스 전역 ffmpeg 풀을 반환합니다.
+
+    같은 워커에서 동시에 도는 작업들이 하나의 스레드 예산을 공유합니다.
+
+    Returns:
+        FFmpegPool 인스턴스
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            cpu_count = os.cpu_count() or 1
+            threads_budget = settings.FFMPEG_THREADS or cpu_count
+            max_workers = settings.FFMPEG_POOL_SIZE or max(1, threads_budget // 4)
+
+            _pool = FFmpegPool(max_workers, threads_budget)
+            logger.info(
+                "ffmpeg 풀 생성: 최대 %d개 프로세스, 스레드 예산 %d",
+                max_workers, threads_budget
+            )
+
+        return _pool
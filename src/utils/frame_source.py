@@ -0,0 +1,116 @@
+"""
+프레임 소스
+
+Pillow로 디코딩/생성한 이미지를 중간 파일 없이 ffmpeg 표준입력(rawvideo)으로
+넘기기 위한 헬퍼입니다. JPEG 저장 → ffmpeg 재디코딩 과정을 없앱니다.
+"""
+
+from pathlib import Path
+
+from PIL import Image
+
+# ffmpeg rawvideo 픽셀 포맷 (Pillow RGB 모드와 동일한 메모리 배치)
+PIXEL_FORMAT = "rgb24"
+
+# 프레임을 모두 보내는 경우(움직임 장면)의 픽셀 포맷 (인코더 입력과 같아 변환 없음)
+MOTION_PIXEL_FORMAT = "yuv420p"
+
+
+def fit_frame(image: Image.Image, width: int, height: int) -> Image.Image:
+    """
+    이미지를 출력 해상도에 맞춥니다.
+
+    세로 길이를 맞춘 뒤 가로가 넓으면 중앙 크롭, 좁으면 검은 패딩을 넣습니다.
+    이미 출력 해상도인 이미지는 리사이즈 없이 그대로 사용합니다.
+
+    Args:
+        image: 원본 이미지
+        width: 출력 너비
+        height: 출력 높이
+
+    Returns:
+        출력 해상도의 RGB 이미지
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    if image.size == (width, height):
+        return image
+
+    # 세로 길이를 출력 높이로 조정
+    aspect_ratio = image.width / image.height
+    new_width = max(1, int(height * aspect_ratio))
+    resized = image.resize((new_width, height), Image.Resampling.LANCZOS)
+
+    if new_width > width:
+        # 중앙 크롭
+        left = (new_width - width) // 2
+        return resized.crop((left, 0, left + width, height))
+
+    if new_width < width:
+        # 패딩 추가
+        canvas = Image.new("RGB", (width, height), (0, 0, 0))
+        canvas.paste(resized, ((width - new_width) // 2, 0))
+        return canvas
+
+    return resized
+
+
+def load_frame(path: str | Path, width: int, height: int) -> Image.Image:
+    """
+    이미지 파일을 디코딩해 출력 해상도 프레임으로 만듭니다.
+
+    Args:
+        path: 이미지 파일 경로
+        width: 출력 너비
+        height: 출력 높이
+
+    Returns:
+        출력 해상도의 RGB 이미지
+    """
+    with Image.open(path) as image:
+        image.draft("RGB", (width, height))  # JPEG는 필요한 크기 근처로만 디코딩
+        image.load()  # 파일을 닫기 전에 디코딩 (이미 출력 해상도면 그대로 반환되므로)
+        return fit_frame(image, width, height)
+
+
+def frame_bytes(image: Image.Image) -> bytes:
+    """
+    프레임을 rawvideo 바이트로 변환합니다.
+
+    Args:
+        image: RGB 이미지
+
+    Returns:
+        rgb24 픽셀 바이트
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image.tobytes()
+
+
+def rawvideo_input_args(
+    width: int,
+    height: int,
+    framerate: str | int,
+    pixel_format: str = PIXEL_FORMAT
+) -> list[str]:
+    """
+    표준입력 rawvideo 입력 인자를 만듭니다.
+
+    Args:
+        width: 프레임 너비
+        height: 프레임 높이
+        framerate: 입력 프레임레이트
+        pixel_format: 입력 픽셀 포맷
+
+    Returns:
+        ffmpeg 입력 인자 리스트
+    """
+    return [
+        '-f', 'rawvideo',
+        '-pix_fmt', pixel_format,
+        '-s', f'{width}x{height}',
+        '-framerate', str(framerate),
+        '-i', 'pipe:0',
+    ]
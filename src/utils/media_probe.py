@@ -0,0 +1,346 @@
+"""
+미디어 정보 조회
+
+우리가 생성/사용하는 포맷(MP3, WAV, MP4/M4A, JPEG, PNG)의 헤더만 읽어 길이와
+해상도를 구합니다. 디코딩하지 않으며 ffprobe 프로세스도 띄우지 않습니다.
+지원하지 않거나 손상된 파일은 ffprobe로 다시 시도합니다.
+"""
+
+import logging
+import struct
+import subprocess
+from pathlib import Path
+from typing import BinaryIO
+
+from src.core.exceptions import MediaProbeError
+
+logger = logging.getLogger(__name__)
+
+# MP3 비트레이트 표 (kbps): [MPEG1 L1, L2, L3, MPEG2/2.5 L1, L2/L3]
+_MP3_BITRATES = {
+    (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+    (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+    (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+    (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+
+# 샘플레이트 표 (Hz): MPEG 버전별
+_MP3_SAMPLE_RATES = {
+    1: [44100, 48000, 32000],
+    2: [22050, 24000, 16000],
+    2.5: [11025, 12000, 8000],
+}
+
+
+def probe_duration(path: str | Path) -> float:
+    """
+    오디오/영상 파일의 길이를 구합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        길이 (초)
+
+    Raises:
+        MediaProbeError: 헤더 파싱과 ffprobe 모두 실패한 경우
+    """
+    path = Path(path)
+
+    try:
+        with open(path, "rb") as f:
+            head = f.read(12)
+            f.seek(0)
+
+            if head[4:8] == b"ftyp":
+                return _mp4_duration(f)
+            if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+                return _wav_duration(f, path.stat().st_size)
+            if head[:3] == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+                return _mp3_duration(f, path.stat().st_size)
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug("헤더 파싱 실패, ffprobe 사용: %s (%s)", path, e)
+
+    return _ffprobe_duration(path)
+
+
+def probe_image_size(path: str | Path) -> tuple[int, int]:
+    """
+    이미지 파일의 해상도를 구합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        (너비, 높이)
+
+    Raises:
+        MediaProbeError: 해상도를 알 수 없는 경우
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(24)
+            f.seek(0)
+
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", head[16:24])
+                return width, height
+            if head[:2] == b"\xff\xd8":
+                return _jpeg_size(f)
+    except (OSError, ValueError, struct.error) as e:
+        logger.debug("이미지 헤더 파싱 실패: %s (%s)", path, e)
+
+    # 그 외 포맷은 Pillow로 헤더만 읽음 (픽셀 디코딩 없음)
+    try:
+        from PIL import Image
+
+        with Image.open(path) as image:
+            return image.size
+    except Exception as e:
+        raise MediaProbeError(f"이미지 해상도 확인 실패: {path} ({e})") from e
+
+
+def _wav_duration(f: BinaryIO, file_size: int) -> float:
+    """WAV 길이 (fmt 청크의 초당 바이트 수, data 청크 크기)"""
+    f.seek(12)
+    byte_rate = None
+
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("data 청크가 없습니다")
+
+        chunk_id, size = struct.unpack("<4sI", header)
+        if chunk_id == b"fmt ":
+            byte_rate = struct.unpack("<8xI", f.read(12))[0]
+            f.seek(size - 12, 1)
+        elif chunk_id == b"data":
+            if not byte_rate:
+                raise ValueError("fmt 청크가 없습니다")
+            # 스트리밍으로 쓴 파일은 크기가 비어 있거나(0/0xFFFFFFFF) 실제보다 클 수 있음
+            size = min(size or file_size, file_size - f.tell())
+            return size / byte_rate
+        else:
+            f.seek(size + (size & 1), 1)  # 청크는 2바이트 단위로 정렬
+
+
+def _mp3_duration(f: BinaryIO, file_size: int) -> float:
+    """MP3 길이 (Xing/Info/VBRI 헤더 → 없으면 프레임 헤더 순회)"""
+    offset = _skip_id3v2(f)
+
+    header = _find_mp3_frame(f, offset)
+    if header is None:
+        raise ValueError("MP3 프레임을 찾을 수 없습니다")
+    offset, frame = header
+
+    samples_per_frame = frame["samples_per_frame"]
+    sample_rate = frame["sample_rate"]
+
+    # VBR 헤더 (Xing/Info: 사이드 정보 뒤, VBRI: 헤더 뒤 32바이트)
+    f.seek(offset)
+    first_frame = f.read(frame["length"] + 4)
+    xing_offset = 4 + frame["side_info_size"]
+    tag = first_frame[xing_offset:xing_offset + 4]
+    if tag in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", first_frame[xing_offset + 4:xing_offset + 8])[0]
+        if flags & 0x1:
+            frames = struct.unpack(">I", first_frame[xing_offset + 8:xing_offset + 12])[0]
+            return frames * samples_per_frame / sample_rate
+    if first_frame[36:40] == b"VBRI":
+        frames = struct.unpack(">I", first_frame[50:54])[0]
+        return frames * samples_per_frame / sample_rate
+
+    # CBR: 프레임 헤더만 따라가며 개수 세기
+    frames = 0
+    position = offset
+    while position + 4 <= file_size:
+        f.seek(position)
+        parsed = _parse_mp3_header(f.read(4))
+        if parsed is None:
+            break
+        frames += 1
+        position += parsed["length"]
+
+    duration = frames * samples_per_frame / sample_rate
+
+    # 중간에 손상된 프레임이 있으면 나머지는 비트레이트로 추정
+    if position + 4 < file_size and frame["bitrate"]:
+        duration += (file_size - position) * 8 / frame["bitrate"]
+
+    return duration
+
+
+def _skip_id3v2(f: BinaryIO) -> int:
+    """ID3v2 태그를 건너뛴 오프셋"""
+    f.seek(0)
+    header = f.read(10)
+    if header[:3] != b"ID3":
+        return 0
+
+    # 싱크세이프 정수 (바이트당 7비트)
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _find_mp3_frame(f: BinaryIO, offset: int, limit: int = 64 * 1024) -> tuple[int, dict] | None:
+    """offset 이후 처음 나오는 유효한 MP3 프레임 헤더"""
+    f.seek(offset)
+    data = f.read(limit)
+
+    for i in range(len(data) - 3):
+        if data[i] != 0xFF or data[i + 1] & 0xE0 != 0xE0:
+            continue
+        parsed = _parse_mp3_header(data[i:i + 4])
+        if parsed is not None:
+            return offset + i, parsed
+
+    return None
+
+
+def _parse_mp3_header(header: bytes) -> dict | None:
+    """MP3 프레임 헤더 4바이트 해석 (유효하지 않으면 None)"""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+
+    version_bits = (header[1] >> 3) & 0x3
+    layer_bits = (header[1] >> 1) & 0x3
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x3
+    padding = (header[2] >> 1) & 0x1
+    channel_mode = header[3] >> 6
+
+    if version_bits == 1 or layer_bits == 0 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version = {0: 2.5, 2: 2, 3: 1}[version_bits]
+    layer = 4 - layer_bits
+    table_version = 1 if version == 1 else 2
+
+    bitrate = _MP3_BITRATES[(table_version, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][sample_rate_index]
+
+    if layer == 1:
+        samples_per_frame = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or version == 1:
+        samples_per_frame = 1152
+        length = 144 * bitrate // sample_rate + padding
+    else:
+        samples_per_frame = 576
+        length = 72 * bitrate // sample_rate + padding
+
+    mono = channel_mode == 3
+    if version == 1:
+        side_info_size = 17 if mono else 32
+    else:
+        side_info_size = 9 if mono else 17
+
+    return {
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "samples_per_frame": samples_per_frame,
+        "length": length,
+        "side_info_size": side_info_size,
+    }
+
+
+def _mp4_duration(f: BinaryIO) -> float:
+    """MP4/M4A 길이 (moov/mvhd 박스)"""
+    moov = _find_box(f, b"moov", 0, None)
+    if moov is None:
+        raise ValueError("moov 박스가 없습니다")
+
+    mvhd = _find_box(f, b"mvhd", moov[0], moov[1])
+    if mvhd is None:
+        raise ValueError("mvhd 박스가 없습니다")
+
+    f.seek(mvhd[0])
+    version = f.read(4)[0]
+    if version == 1:
+        f.seek(16, 1)  # 생성/수정 시각 (64비트)
+        timescale, duration = struct.unpack(">IQ", f.read(12))
+    else:
+        f.seek(8, 1)   # 생성/수정 시각 (32비트)
+        timescale, duration = struct.unpack(">II", f.read(8))
+
+    if not timescale:
+        raise ValueError("timescale이 0입니다")
+
+    return duration / timescale
+
+
+def _find_box(f: BinaryIO, box_type: bytes, start: int, end: int | None) -> tuple[int, int] | None:
+    """[start, end) 구간에서 box_type 박스를 찾아 (내용 시작, 내용 끝) 반환"""
+    position = start
+    while end is None or position + 8 <= end:
+        f.seek(position)
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+
+        size, current_type = struct.unpack(">I4s", header)
+        header_size = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header_size = 16
+        elif size == 0:
+            # 파일 끝까지
+            f.seek(0, 2)
+            size = f.tell() - position
+
+        if size < header_size:
+            raise ValueError("잘못된 박스 크기")
+
+        if current_type == box_type:
+            return position + header_size, position + size
+
+        position += size
+
+    return None
+
+
+def _jpeg_size(f: BinaryIO) -> tuple[int, int]:
+    """JPEG SOF 마커에서 해상도 읽기"""
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise ValueError("JPEG 마커를 찾을 수 없습니다")
+
+        # 채움 바이트(0xFF) 건너뛰기
+        while marker[1] == 0xFF:
+            marker = marker[1:] + f.read(1)
+
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+
+        length = struct.unpack(">H", f.read(2))[0]
+
+        # SOF0~SOF15 (DHT=C4, JPG=C8, DAC=CC 제외)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+
+        f.seek(length - 2, 1)
+
+
+def _ffprobe_duration(path: Path) -> float:
+    """ffprobe로 길이 확인 (헤더 파싱이 안 되는 경우의 대체 경로)"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries',
+             'format=duration', '-of',
+             'default=noprint_wrappers=1:nokey=1', str(path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        return float(result.stdout)
+    except (OSError, ValueError) as e:
+        raise MediaProbeError(f"미디어 길이 확인 실패: {path} ({e})") from e
@@ -0,0 +1,231 @@
+"""
+장면 카메라 움직임 (Ken Burns)
+
+ffmpeg zoompan 대신 장면별 크롭 궤적(위치/배율)을 NumPy로 한 번에 계산하고,
+출력보다 큰 원본 프레임에서 OpenCV 아핀 변환 한 번으로 프레임을 잘라 냅니다.
+서브픽셀 단위로 잘라 내므로 느린 움직임에서도 떨림이 없고, 인코더 입력과 같은
+yuv420p로 바로 만들어 ffmpeg 쪽 변환도 없습니다.
+"""
+
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from src.utils.frame_source import fit_frame
+
+
+@dataclass(frozen=True)
+class Motion:
+    """
+    장면 카메라 움직임
+
+    zoom은 출력 화면을 꽉 채운 상태(1.0) 대비 확대 배율이고, center는 확대된
+    원본에서 화면 중심이 놓일 위치(0~1 비율)입니다.
+    """
+
+    start_zoom: float = 1.0
+    end_zoom: float = 1.15
+    start_center: tuple[float, float] = (0.5, 0.5)
+    end_center: tuple[float, float] = (0.5, 0.5)
+
+    @property
+    def max_zoom(self) -> float:
+        """원본 프레임을 준비할 배율"""
+        return max(self.start_zoom, self.end_zoom, 1.0)
+
+
+MOTION_PRESETS = {
+    "zoom_in": Motion(1.0, 1.15),
+    "zoom_out": Motion(1.15, 1.0),
+    "pan_left": Motion(1.12, 1.12, (0.6, 0.5), (0.4, 0.5)),
+    "pan_right": Motion(1.12, 1.12, (0.4, 0.5), (0.6, 0.5)),
+    "pan_up": Motion(1.12, 1.12, (0.5, 0.6), (0.5, 0.4)),
+    "pan_down": Motion(1.12, 1.12, (0.5, 0.4), (0.5, 0.6)),
+}
+
+# 프리셋 중 가장 큰 확대 배율 (원본 이미지를 미리 이 크기로 받아 두면 어떤 움직임이든 리사이즈 불필요)
+MAX_PRESET_ZOOM = max(motion.max_zoom for motion in MOTION_PRESETS.values())
+
+# 장면마다 돌아가며 적용할 순서 (같은 움직임이 연속되지 않도록)
+KEN_BURNS_SEQUENCE = ["zoom_in", "pan_right", "zoom_out", "pan_left", "pan_up", "pan_down"]
+
+
+def ken_burns(index: int) -> Motion:
+    """
+    장면 순서에 따라 Ken Burns 움직임을 고릅니다.
+
+    Args:
+        index: 장면 번호 (0부터)
+
+    Returns:
+        Motion 인스턴스
+    """
+    return MOTION_PRESETS[KEN_BURNS_SEQUENCE[index % len(KEN_BURNS_SEQUENCE)]]
+
+
+def source_size(width: int, height: int, zoom: float) -> tuple[int, int]:
+    """
+    확대 배율에 필요한 원본 프레임 크기를 계산합니다.
+
+    Args:
+        width: 출력 너비
+        height: 출력 높이
+        zoom: 확대 배율
+
+    Returns:
+        (너비, 높이) - 출력 해상도 × zoom, 짝수 크기
+    """
+    zoom = max(zoom, 1.0)
+    return math.ceil(width * zoom / 2) * 2, math.ceil(height * zoom / 2) * 2
+
+
+def prepare_source(image: Image.Image, width: int, height: int, motion: Motion) -> np.ndarray:
+    """
+    움직임에 필요한 만큼 큰 원본 프레임을 만듭니다.
+
+    이미 출력과 같은 비율이고 필요한 크기 이상인 이미지(공급자가 리사이즈해
+    준 이미지)는 리사이즈 없이 그대로 씁니다. 크롭 궤적은 원본 크기에 맞춰
+    계산되므로 결과 화면은 같습니다.
+
+    Args:
+        image: 원본 이미지
+        width: 출력 너비
+        height: 출력 높이
+        motion: 장면 움직임
+
+    Returns:
+        (높이, 너비, 3) uint8 RGB 배열 (출력 해상도 × max_zoom 이상, 짝수 크기)
+    """
+    source_width, source_height = source_size(width, height, motion.max_zoom)
+
+    if (
+        image.width >= source_width
+        and image.height >= source_height
+        and image.width % 2 == 0
+        and image.height % 2 == 0
+        and image.width * height == image.height * width
+    ):
+        return np.asarray(image if image.mode == "RGB" else image.convert("RGB"))
+
+    return np.asarray(fit_frame(image, source_width, source_height))
+
+
+def to_yuv420(frame: np.ndarray) -> bytes:
+    """
+    RGB 프레임을 yuv420p(I420) rawvideo 바이트로 변환합니다.
+
+    Args:
+        frame: (높이, 너비, 3) uint8 RGB 배열 (짝수 크기)
+
+    Returns:
+        yuv420p 프레임 바이트
+    """
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2YUV_I420).tobytes()
+
+
+def crop_trajectory(
+    motion: Motion,
+    source_size: tuple[int, int],
+    width: int,
+    height: int,
+    frame_count: int,
+    indices: Sequence[int] | np.ndarray
+) -> np.ndarray:
+    """
+    프레임별 크롭 영역을 한 번에 계산합니다.
+
+    배율은 로그 공간에서 보간해 확대 속도가 일정하게 느껴지도록 하고, 시작과
+    끝은 부드럽게 가감속합니다. 장면 범위를 벗어난 프레임 번호는 처음/끝
+    위치에 고정됩니다 (장면 전환 구간용).
+
+    Args:
+        motion: 장면 움직임
+        source_size: 원본 프레임 (너비, 높이)
+        width: 출력 너비
+        height: 출력 높이
+        frame_count: 장면 전체 프레임 수
+        indices: 계산할 장면 내 프레임 번호들
+
+    Returns:
+        (프레임 수, 3) float 배열 - 크롭 왼쪽 x, 위쪽 y, 출력/크롭 배율
+    """
+    source_width, source_height = source_size
+    frames = np.asarray(indices, dtype=np.float64)
+
+    progress = np.clip(frames / max(frame_count - 1, 1), 0.0, 1.0)
+    eased = progress * progress * (3.0 - 2.0 * progress)  # smoothstep
+
+    zoom = motion.start_zoom * (motion.end_zoom / motion.start_zoom) ** eased
+
+    # 배율 1.0이면 원본 전체, max_zoom이면 출력과 같은 크기(1:1)를 잘라 냄
+    crop_width = source_width / zoom
+    crop_height = crop_width * height / width
+
+    center_x = motion.start_center[0] + (motion.end_center[0] - motion.start_center[0]) * eased
+    center_y = motion.start_center[1] + (motion.end_center[1] - motion.start_center[1]) * eased
+
+    left = np.clip(center_x * source_width - crop_width / 2, 0.0, source_width - crop_width)
+    top = np.clip(center_y * source_height - crop_height / 2, 0.0, source_height - crop_height)
+
+    return np.stack([left, top, width / crop_width], axis=1)
+
+
+def motion_frames(
+    source: np.ndarray,
+    trajectory: np.ndarray,
+    width: int,
+    height: int
+) -> Iterator[bytes]:
+    """
+    크롭 궤적대로 프레임을 잘라 yuv420p rawvideo 바이트로 하나씩 생성합니다.
+
+    원본을 한 번만 YUV로 바꾼 뒤 Y/U/V 평면을 각각 잘라 내므로 프레임마다 색공간
+    변환이 없고, RGB보다 절반 크기의 데이터만 ffmpeg로 넘깁니다.
+
+    Args:
+        source: prepare_source()로 만든 원본 프레임
+        trajectory: crop_trajectory() 결과
+        width: 출력 너비 (짝수)
+        height: 출력 높이 (짝수)
+
+    Yields:
+        yuv420p 프레임 바이트
+    """
+    source_planes = _yuv_planes(cv2.cvtColor(source, cv2.COLOR_RGB2YUV_I420), *source.shape[1::-1])
+
+    output = np.empty(width * height * 3 // 2, dtype=np.uint8)
+    output_planes = _yuv_planes(output, width, height)
+
+    for left, top, scale in trajectory:
+        # 크롭 + 리사이즈를 아핀 변환 한 번으로 (서브픽셀 정확도)
+        for plane, (src, dst) in enumerate(zip(source_planes, output_planes)):
+            shift = 1.0 if plane == 0 else 0.5  # 색차 평면은 가로세로 절반 해상도
+            matrix = np.array([
+                [scale, 0.0, -left * scale * shift],
+                [0.0, scale, -top * scale * shift],
+            ])
+            cv2.warpAffine(
+                src,
+                matrix,
+                dst.shape[::-1],
+                dst=dst,
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_REPLICATE
+            )
+        yield output.tobytes()
+
+
+def _yuv_planes(buffer: np.ndarray, width: int, height: int) -> list[np.ndarray]:
+    """I420 버퍼를 Y, U, V 평면 뷰로 나눔"""
+    flat = buffer.reshape(-1)
+    luma = width * height
+    chroma = luma // 4
+    return [
+        flat[:luma].reshape(height, width),
+        flat[luma:luma + chroma].reshape(height // 2, width // 2),
+        flat[luma + chroma:luma + 2 * chroma].reshape(height // 2, width // 2),
+    ]
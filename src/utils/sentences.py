@@ -0,0 +1,105 @@
+"""
+한국어 문장 분할
+
+긴 내레이션을 TTS 요청 단위로 나눕니다. 문장부호(., !, ?, …) 뒤에서 문장을
+끊고, 짧은 문장은 이어 붙여 요청 수를 줄이며, 한 요청에 비해 너무 긴 문장은
+쉼표 → 연결 어미 → 공백 순으로 자연스러운 위치를 찾아 자릅니다.
+"""
+
+import re
+
+# 문장 끝: 문장부호(연속 가능) + 닫는 따옴표/괄호 뒤의 공백
+_SENTENCE_END = re.compile(r"[.!?…。！？]+[\"'”’」』)\]]*\s+")
+
+# 긴 문장을 자를 후보 위치 (앞쪽일수록 우선)
+_CLAUSE_BREAKS = [
+    re.compile(r"[,，、;:]\s+"),
+    re.compile(r"(?:고|며|면서|지만|는데|어서|아서|해서|니까|므로)\s+"),
+    re.compile(r"\s+"),
+]
+
+
+def split_sentences(text: str) -> list[str]:
+    """
+    텍스트를 문장 단위로 나눕니다.
+
+    Args:
+        text: 원본 텍스트 (줄바꿈도 문장 경계로 취급)
+
+    Returns:
+        공백을 정리한 문장 리스트
+    """
+    sentences = []
+    for paragraph in text.splitlines():
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+
+        start = 0
+        for match in _SENTENCE_END.finditer(paragraph + " "):
+            sentence = paragraph[start:match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+            start = match.end()
+
+        rest = paragraph[start:].strip()
+        if rest:
+            sentences.append(rest)
+
+    return sentences
+
+
+def sentence_chunks(text: str, max_chars: int = 120) -> list[str]:
+    """
+    TTS 요청 단위로 문장들을 묶습니다.
+
+    이어지는 문장을 max_chars 안에서 최대한 묶고, 혼자서 max_chars를 넘는
+    문장은 절 단위로 자릅니다.
+
+    Args:
+        text: 원본 텍스트
+        max_chars: 조각 하나의 최대 글자 수
+
+    Returns:
+        조각 리스트 (순서 유지)
+    """
+    chunks: list[str] = []
+    current = ""
+
+    for sentence in split_sentences(text):
+        for piece in _split_long(sentence, max_chars):
+            if current and len(current) + 1 + len(piece) <= max_chars:
+                current += " " + piece
+                continue
+            if current:
+                chunks.append(current)
+            current = piece
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _split_long(sentence: str, max_chars: int) -> list[str]:
+    """max_chars를 넘는 문장을 절 경계에서 자름"""
+    pieces = []
+
+    while len(sentence) > max_chars:
+        cut = 0
+        for pattern in _CLAUSE_BREAKS:
+            # max_chars 안에서 가장 뒤쪽 후보 (너무 앞이면 다음 후보 종류로)
+            ends = [m.end() for m in pattern.finditer(sentence, 0, max_chars + 1)]
+            if ends and ends[-1] >= max_chars // 3:
+                cut = ends[-1]
+                break
+        if not cut:
+            cut = max_chars
+
+        pieces.append(sentence[:cut].strip())
+        sentence = sentence[cut:].strip()
+
+    if sentence:
+        pieces.append(sentence)
+
+    return pieces
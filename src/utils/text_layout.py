@@ -0,0 +1,218 @@
+"""
+텍스트 레이아웃
+
+글자 수가 아닌 실제 픽셀 폭으로 줄바꿈하고, 줄별 위치를 한 번에 계산합니다.
+글자 폭은 폰트별로 캐시하며, 한글 음절(가-힣)은 폭이 거의 같으므로 한 번만
+측정해 재사용합니다.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import ImageFont
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ELLIPSIS = "…"
+
+
+@lru_cache(maxsize=None)
+def load_font(size: int, font_path: str | None = None) -> ImageFont.ImageFont:
+    """
+    폰트를 로드합니다 (경로/크기별로 프로세스당 한 번).
+
+    Args:
+        size: 폰트 크기
+        font_path: 폰트 파일 경로 (기본값: CARD_FONT_PATH 설정)
+
+    Returns:
+        폰트 객체 (로드 실패 시 기본 폰트)
+    """
+    path = font_path or settings.CARD_FONT_PATH
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        logger.warning("폰트 로드 실패, 기본 폰트 사용: %s", path)
+        return ImageFont.load_default()
+
+
+class GlyphAdvanceCache:
+    """폰트 하나의 글자별 가로 폭(advance) 캐시"""
+
+    def __init__(self, font: ImageFont.ImageFont):
+        self.font = font
+        self._advances: dict[str, float] = {}
+        self._hangul_advance: float | None = None
+
+    def advance(self, char: str) -> float:
+        """
+        글자 하나의 가로 폭을 반환합니다.
+
+        Args:
+            char: 글자
+
+        Returns:
+            픽셀 단위 폭
+        """
+        if '가' <= char <= '힣':
+            if self._hangul_advance is None:
+                self._hangul_advance = self.font.getlength('가')
+            return self._hangul_advance
+
+        advance = self._advances.get(char)
+        if advance is None:
+            advance = self.font.getlength(char)
+            self._advances[char] = advance
+        return advance
+
+    def width(self, text: str) -> float:
+        """
+        문자열의 가로 폭을 반환합니다 (커닝 무시).
+
+        Args:
+            text: 문자열
+
+        Returns:
+            픽셀 단위 폭
+        """
+        return sum(self.advance(char) for char in text)
+
+
+@lru_cache(maxsize=64)
+def get_advance_cache(font: ImageFont.ImageFont) -> GlyphAdvanceCache:
+    """
+    폰트별 글자 폭 캐시를 반환합니다.
+
+    Args:
+        font: 폰트 객체
+
+    Returns:
+        GlyphAdvanceCache 인스턴스
+    """
+    return GlyphAdvanceCache(font)
+
+
+@dataclass
+class LineBox:
+    """배치된 한 줄"""
+
+    text: str
+    x: int
+    y: int
+    width: float
+
+
+def wrap_text(
+    text: str,
+    font: ImageFont.ImageFont,
+    max_width: float,
+    max_lines: int | None = None,
+    ellipsis: bool = False
+) -> list[str]:
+    """
+    픽셀 폭 기준으로 텍스트를 줄바꿈합니다.
+
+    단어(공백) 단위로 채우고, 한 단어가 한 줄보다 길면 글자 단위로 나눕니다.
+    텍스트 안의 줄바꿈 문자는 그대로 유지합니다.
+
+    Args:
+        text: 원본 텍스트
+        font: 폰트
+        max_width: 한 줄 최대 폭 (픽셀)
+        max_lines: 최대 줄 수 (초과분은 잘라냄)
+        ellipsis: 잘라낸 경우 마지막 줄 끝에 말줄임표 추가
+
+    Returns:
+        줄 리스트
+    """
+    glyphs = get_advance_cache(font)
+    space = glyphs.advance(' ')
+    lines: list[str] = []
+
+    for paragraph in text.split('\n'):
+        current = ""
+        current_width = 0.0
+
+        for word in paragraph.split():
+            word_width = glyphs.width(word)
+
+            if current and current_width + space + word_width <= max_width:
+                current += ' ' + word
+                current_width += space + word_width
+                continue
+
+            if current:
+                lines.append(current)
+                current, current_width = "", 0.0
+
+            # 한 줄보다 긴 단어는 글자 단위로 나눔
+            while word_width > max_width and len(word) > 1:
+                cut, cut_width = _fit_prefix(word, glyphs, max_width)
+                lines.append(word[:cut])
+                word = word[cut:]
+                word_width -= cut_width
+
+            current, current_width = word, word_width
+
+        if current:
+            lines.append(current)
+
+    if max_lines is not None and len(lines) > max_lines:
+        lines = lines[:max_lines]
+        if ellipsis and lines:
+            last = lines[-1]
+            limit = max_width - glyphs.advance(ELLIPSIS)
+            while last and glyphs.width(last) > limit:
+                last = last[:-1]
+            lines[-1] = last.rstrip() + ELLIPSIS
+
+    return lines
+
+
+def layout_lines(
+    lines: list[str],
+    font: ImageFont.ImageFont,
+    box_width: int,
+    top: int,
+    line_height: int
+) -> list[LineBox]:
+    """
+    줄들을 가운데 정렬해 위치를 계산합니다.
+
+    Args:
+        lines: 줄 리스트
+        font: 폰트
+        box_width: 정렬 기준 폭 (보통 캔버스 폭)
+        top: 첫 줄 y 좌표
+        line_height: 줄 간격
+
+    Returns:
+        줄별 위치 리스트
+    """
+    glyphs = get_advance_cache(font)
+    boxes = []
+
+    for i, line in enumerate(lines):
+        width = glyphs.width(line)
+        boxes.append(LineBox(
+            text=line,
+            x=int((box_width - width) // 2),
+            y=top + i * line_height,
+            width=width
+        ))
+
+    return boxes
+
+
+def _fit_prefix(word: str, glyphs: GlyphAdvanceCache, max_width: float) -> tuple[int, float]:
+    """max_width 안에 들어가는 가장 긴 접두사 길이와 폭 (최소 1글자)"""
+    width = 0.0
+    for i, char in enumerate(word):
+        advance = glyphs.advance(char)
+        if width + advance > max_width and i > 0:
+            return i, width
+        width += advance
+    return len(word), width
@@ -0,0 +1,114 @@
+"""
+FFmpeg 영상 처리 헬퍼
+
+필터그래프 문자열 생성과 ffmpeg 프로세스 실행을 담당합니다.
+"""
+
+import logging
+import subprocess
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.core.exceptions import VideoRenderError
+
+logger = logging.getLogger(__name__)
+
+
+def run_ffmpeg(
+    cmd: list[str],
+    stdin_chunks: Iterable[bytes] | None = None
+) -> subprocess.CompletedProcess:
+    """
+    ffmpeg 명령을 실행합니다.
+
+    Args:
+        cmd: 실행할 명령 (첫 요소는 'ffmpeg')
+        stdin_chunks: 표준입력으로 흘려보낼 바이트 조각 (rawvideo 프레임 등)
+
+    Returns:
+        실행 결과
+
+    Raises:
+        VideoRenderError: ffmpeg가 0이 아닌 코드로 종료된 경우
+    """
+    logger.debug("ffmpeg 실행: %s", " ".join(cmd))
+
+    if stdin_chunks is None:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    else:
+        result = _run_with_stdin(cmd, stdin_chunks)
+
+    if result.returncode != 0:
+        raise VideoRenderError(f"ffmpeg 실행 실패: {result.stderr[-500:]}")
+
+    return result
+
+
+def _run_with_stdin(cmd: list[str], stdin_chunks: Iterable[bytes]) -> subprocess.CompletedProcess:
+    """표준입력으로 데이터를 스트리밍하며 ffmpeg 실행 (stderr는 별도 스레드에서 수집)"""
+    process = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+
+    stderr_chunks: list[bytes] = []
+    reader = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True
+    )
+    reader.start()
+
+    try:
+        for chunk in stdin_chunks:
+            process.stdin.write(chunk)
+    except BrokenPipeError:
+        # ffmpeg가 먼저 종료된 경우 (에러 메시지는 stderr에서 확인)
+        pass
+    except BaseException:
+        # 프레임 생성 실패 등: 잘린 입력으로 출력을 마무리하지 않도록 ffmpeg를 먼저 종료
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    returncode = process.wait()
+    reader.join()
+
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    return subprocess.CompletedProcess(cmd, returncode, "", stderr)
+
+
+def escape_filter_value(value: str | Path) -> str:
+    """
+    필터 옵션 값으로 쓰일 문자열(경로 등)을 이스케이프합니다.
+
+    Args:
+        value: 원본 값
+
+    Returns:
+        필터그래프에 넣을 수 있는 문자열
+    """
+    text = str(value)
+    for char in ("\\", ":", "'", ",", "[", "]", ";"):
+        text = text.replace(char, f"\\{char}")
+    return text
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    ffmpeg 인자로 쓸 초 단위 문자열을 만듭니다.
+
+    Args:
+        seconds: 초
+
+    Returns:
+        소수점 3자리 문자열
+    """
+    return f"{seconds:.3f}"
@@ -0,0 +1,16 @@
+"""
+공용 pytest fixture
+"""
+
+import pytest
+
+from src.core.config import settings
+
+
+@pytest.fixture
+def work_dirs(tmp_path, monkeypatch):
+    """임시 파일/미디어 캐시 경로를 테스트 전용 디렉토리로 바꿉니다."""
+    monkeypatch.setattr(settings, "TEMP_DIR", tmp_path / "temp")
+    monkeypatch.setattr(settings, "MEDIA_CACHE_DIR", tmp_path / "media_cache")
+    (tmp_path / "temp").mkdir()
+    return tmp_path
@@ -0,0 +1 @@
+"""외부 API 연동 테스트"""
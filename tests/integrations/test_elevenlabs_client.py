@@ -0,0 +1,52 @@
+"""
+ElevenLabsClient 동시 요청/속도 제한 테스트
+"""
+
+import asyncio
+
+from src.integrations.elevenlabs_client import ElevenLabsClient
+
+
+class TestProviderLimits:
+    """클라이언트 간 제한 공유"""
+
+    def test_clients_in_same_loop_share_limits(self):
+        async def main():
+            first = ElevenLabsClient(api_key="test", max_concurrency=2, requests_per_second=5)
+            second = ElevenLabsClient(api_key="test", max_concurrency=2, requests_per_second=5)
+            return first, second
+
+        first, second = asyncio.run(main())
+
+        assert first._semaphore is second._semaphore
+        assert first._rate_limiter is second._rate_limiter
+
+    def test_each_loop_gets_own_limits(self):
+        async def main():
+            return ElevenLabsClient(api_key="test", max_concurrency=2, requests_per_second=5)
+
+        first = asyncio.run(main())
+        second = asyncio.run(main())
+
+        assert first._semaphore is not second._semaphore
+
+    def test_concurrency_is_limited_across_clients(self):
+        """클라이언트를 따로 열어도 동시 요청 수는 합쳐서 제한"""
+        active = 0
+        peak = 0
+
+        async def request():
+            nonlocal active, peak
+            client = ElevenLabsClient(api_key="test", max_concurrency=2, requests_per_second=0)
+            async with client._semaphore:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def main():
+            await asyncio.gather(*(request() for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert peak == 2
@@ -0,0 +1,201 @@
+"""
+ElevenLabs 스트리밍 합성 테스트
+
+ELEVENLABS_BASE_URL을 로컬 대체 서버(청크 전송 HTTP)로 바꿔 실제 API 없이
+조각 단위 기록, 연결 끊김, 재시도, 캐시 적중을 확인합니다.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.config import settings
+from src.core.exceptions import TTSGenerationError
+from src.integrations import elevenlabs_client
+from src.integrations.elevenlabs_client import ElevenLabsClient, SynthesisRequest
+from src.services import tts_service
+from src.services.tts_service import TTSCache, TTSService
+from src.utils.cache import DiskLRUCache
+
+CHUNK = b"\xff" * 4096
+READY_BYTES = 3 * len(CHUNK)
+
+
+class StubTTSServer(ThreadingHTTPServer):
+    """
+    요청마다 scenarios에서 응답 방식을 하나씩 꺼내 처리하는 대체 서버
+
+    - ("stream", 청크 수): 청크를 보내되 READY_BYTES 이후에는 ready가 설정될 때까지
+      (최대 5초) 기다렸다가 나머지를 보냄
+    - ("disconnect", 청크 수): 청크 몇 개를 보낸 뒤 종료 청크 없이 연결을 끊음
+    - ("status", 코드): 본문 없이 상태 코드만 응답
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubTTSHandler)
+        self.scenarios: deque[tuple[str, int]] = deque()
+        self.paths: list[str] = []
+        self.ready = threading.Event()
+        self.ready_before_end: bool | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+
+class StubTTSHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.paths.append(self.path)
+        mode, value = self.server.scenarios.popleft()
+
+        if mode == "status":
+            self.send_response(value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        for i in range(value):
+            if mode == "stream" and i * len(CHUNK) >= READY_BYTES:
+                self.server.ready_before_end = self.server.ready.wait(5)
+            self._chunk(CHUNK)
+
+        if mode == "disconnect":
+            self.close_connection = True
+            return
+
+        self._chunk(b"")
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+@pytest.fixture
+def server(monkeypatch):
+    stub = StubTTSServer()
+    thread = threading.Thread(target=stub.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(settings, "ELEVENLABS_BASE_URL", stub.base_url)
+    monkeypatch.setattr(settings, "ELEVENLABS_REQUESTS_PER_SECOND", 0.0)
+    monkeypatch.setattr(elevenlabs_client, "_backoff", lambda attempt: 0.0)
+
+    yield stub
+
+    stub.shutdown()
+    stub.server_close()
+
+
+def stream(output_path, on_ready=None, max_retries=2):
+    """새 이벤트 루프에서 stream_to_file() 실행"""
+    async def main():
+        async with ElevenLabsClient(api_key="test", max_retries=max_retries) as client:
+            return await client.stream_to_file(
+                SynthesisRequest(text="안녕하세요"),
+                output_path,
+                on_ready=on_ready,
+                ready_bytes=READY_BYTES
+            )
+
+    return asyncio.run(main())
+
+
+class TestStreamToFile:
+    """조각 단위 파일 기록"""
+
+    def test_on_ready_fires_before_stream_ends(self, server, tmp_path):
+        server.scenarios.append(("stream", 8))
+        ready_sizes = []
+
+        def on_ready(path):
+            ready_sizes.append(path.stat().st_size)
+            server.ready.set()
+
+        path = stream(tmp_path / "voice.mp3", on_ready)
+
+        assert server.ready_before_end is True
+        assert len(ready_sizes) == 1
+        assert READY_BYTES <= ready_sizes[0] < 8 * len(CHUNK)
+        assert path.read_bytes() == CHUNK * 8
+        assert server.paths[0].endswith("/stream")
+
+    def test_short_audio_notifies_at_end(self, server, tmp_path):
+        server.scenarios.append(("stream", 1))
+        ready_sizes = []
+
+        stream(tmp_path / "voice.mp3", lambda path: ready_sizes.append(path.stat().st_size))
+
+        assert ready_sizes == [len(CHUNK)]
+
+    def test_disconnect_mid_stream_removes_partial_file(self, server, tmp_path):
+        server.scenarios.extend([("disconnect", 2), ("stream", 2)])
+        output_path = tmp_path / "voice.mp3"
+
+        with pytest.raises(TTSGenerationError):
+            stream(output_path)
+
+        assert not output_path.exists()
+        assert len(server.paths) == 1  # 쓰기 시작 후에는 재시도하지 않음
+
+    def test_server_error_before_first_byte_is_retried(self, server, tmp_path):
+        server.scenarios.extend([("status", 503), ("status", 502), ("stream", 2)])
+
+        path = stream(tmp_path / "voice.mp3")
+
+        assert path.read_bytes() == CHUNK * 2
+        assert len(server.paths) == 3
+
+    def test_gives_up_after_max_retries(self, server, tmp_path):
+        server.scenarios.extend([("status", 503)] * 2)
+
+        with pytest.raises(TTSGenerationError):
+            stream(tmp_path / "voice.mp3", max_retries=1)
+
+        assert len(server.paths) == 2
+
+    def test_client_error_is_not_retried(self, server, tmp_path):
+        server.scenarios.append(("status", 401))
+
+        with pytest.raises(TTSGenerationError):
+            stream(tmp_path / "voice.mp3")
+
+        assert len(server.paths) == 1
+
+
+class TestSynthesizeStreamCache:
+    """TTSService 스트리밍 합성 캐시"""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        cache = TTSCache(DiskLRUCache(tmp_path / "tts", max_bytes=1024 * 1024, suffix=".mp3"))
+        monkeypatch.setattr(tts_service, "get_tts_cache", lambda timestamps=False: cache)
+        return cache
+
+    def test_cache_hit_skips_network(self, server, cache, tmp_path):
+        server.scenarios.append(("stream", 2))
+        service = TTSService(api_key="test")
+
+        first = asyncio.run(service.asynthesize_stream("안녕하세요", tmp_path / "first.mp3"))
+
+        ready = []
+        second = asyncio.run(service.asynthesize_stream("안녕하세요", tmp_path / "second.mp3", ready.append))
+
+        assert len(server.paths) == 1
+        assert second.read_bytes() == first.read_bytes() == CHUNK * 2
+        assert ready == [second]
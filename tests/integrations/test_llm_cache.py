@@ -0,0 +1,158 @@
+"""
+LLM 응답 캐시 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.config import settings
+from src.integrations import llm_cache
+from src.integrations.llm_cache import REDIS_KEY_PREFIX, LLMCache, normalize_prompt, request_key
+
+
+def request(prompt: str = "키워드: 커피\n요구사항", **params) -> dict:
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "system", "content": "작가"}, {"role": "user", "content": prompt}],
+        "temperature": 0.7,
+        **params,
+    }
+
+
+class Clock:
+    """테스트용 시계 (llm_cache.time.time 대체)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, int]] = {}
+        self.fail = False
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("down")
+        return self.data.get(key, (None, 0))[0]
+
+    def ttl(self, key):
+        return self.data[key][1]
+
+    def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("down")
+        self.data[key] = (value, ex)
+
+
+class TestRequestKey:
+    """request_key() 정규화"""
+
+    def test_normalize_prompt(self):
+        assert normalize_prompt("\n  키워드:   커피 \n\n  요구사항\n") == "키워드: 커피\n요구사항"
+
+    def test_indentation_does_not_matter(self):
+        assert request_key(request("    키워드: 커피\n\n    요구사항  ")) == request_key(request())
+
+    def test_stream_flag_ignored(self):
+        assert request_key(request(stream=True)) == request_key(request())
+
+    @pytest.mark.parametrize("change", [
+        {"model": "gpt-4-turbo-preview"},
+        {"temperature": 0.2},
+        {"max_tokens": 100},
+        {"response_format": {"type": "json_object"}},
+    ])
+    def test_model_and_sampling_change_key(self, change):
+        assert request_key({**request(), **change}) != request_key(request())
+
+    def test_prompt_text_changes_key(self):
+        assert request_key(request("키워드: 차")) != request_key(request())
+
+
+class TestLLMCache:
+    """메모리 LRU + TTL + Redis"""
+
+    def test_put_get(self, clock):
+        cache = LLMCache(4, {"reel": 60})
+        cache.put("reel", "k", "응답")
+
+        assert cache.get("reel", "k") == "응답"
+
+    def test_expires_after_ttl(self, clock):
+        cache = LLMCache(4, {"reel": 60})
+        cache.put("reel", "k", "응답")
+
+        clock.now += 61
+        assert cache.get("reel", "k") is None
+
+    def test_task_without_ttl_not_cached(self, clock):
+        cache = LLMCache(4, {"reel": 60})
+        cache.put("card", "k", "응답")
+
+        assert cache.get("card", "k") is None
+
+    def test_creative_tasks_not_cached_by_default(self, clock):
+        # temperature 0.7 창작 생성은 TTL을 명시적으로 켜야 재사용
+        cache = LLMCache(4, settings.LLM_CACHE_TTL)
+        cache.put("reel_content", "k", "대본")
+        cache.put("card_news", "k", "카드")
+
+        assert cache.get("reel_content", "k") is None
+        assert cache.get("card_news", "k") is None
+
+    def test_tasks_are_separate(self, clock):
+        cache = LLMCache(4, {"reel": 60, "card": 60})
+        cache.put("reel", "k", "릴스")
+
+        assert cache.get("card", "k") is None
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = LLMCache(2, {"reel": 60})
+        cache.put("reel", "a", "A")
+        cache.put("reel", "b", "B")
+        cache.get("reel", "a")
+        cache.put("reel", "c", "C")
+
+        assert cache.get("reel", "a") == "A"
+        assert cache.get("reel", "b") is None
+        assert cache.get("reel", "c") == "C"
+
+    def test_shared_through_redis(self, clock):
+        redis = FakeRedis()
+        LLMCache(4, {"reel": 60}, redis).put("reel", "k", "응답")
+
+        other_worker = LLMCache(4, {"reel": 60}, redis)
+
+        assert redis.data[REDIS_KEY_PREFIX + "reel:k"] == ("응답".encode("utf-8"), 60)
+        assert other_worker.get("reel", "k") == "응답"
+
+    def test_redis_remaining_ttl_kept_in_memory(self, clock):
+        redis = FakeRedis()
+        redis.data[REDIS_KEY_PREFIX + "reel:k"] = (b"old", 10)
+        cache = LLMCache(4, {"reel": 60}, redis)
+
+        assert cache.get("reel", "k") == "old"
+        redis.data.clear()
+        clock.now += 11
+        assert cache.get("reel", "k") is None
+
+    def test_redis_errors_are_misses(self, clock):
+        redis = FakeRedis()
+        redis.fail = True
+        cache = LLMCache(4, {"reel": 60}, redis)
+
+        cache.put("reel", "k", "응답")  # 예외 없음, 메모리에는 저장
+        assert cache.get("reel", "k") == "응답"
+        assert cache.get("reel", "other") is None
@@ -0,0 +1,134 @@
+"""
+모델 등급 라우터 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations import model_router
+from src.integrations.model_router import ModelRoute, ModelRouter
+
+TIERS = {"standard": "big", "fast": "small", "tiny": "smallest"}
+
+
+class Clock:
+    """테스트용 시계 (model_router.time.monotonic 대체)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(model_router, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def make_router(fallbacks=None, **kwargs) -> ModelRouter:
+    return ModelRouter(
+        tiers=TIERS,
+        task_tiers={"card": "fast"},
+        budgets={"reel": 10.0, "card": 10.0},
+        fallbacks={"standard": "fast", "fast": "tiny"} if fallbacks is None else fallbacks,
+        window=300.0,
+        **kwargs
+    )
+
+
+def record(router: ModelRouter, task: str, tier: str, seconds: float, count: int = 5) -> None:
+    for _ in range(count):
+        router.record(ModelRoute(task, tier, TIERS[tier]), seconds)
+
+
+class TestRoute:
+    """route() 등급 선택"""
+
+    def test_default_and_task_tiers(self, clock):
+        router = make_router()
+
+        assert router.route("reel") == ModelRoute("reel", "standard", "big")
+        assert router.route("card") == ModelRoute("card", "fast", "small")
+
+    def test_falls_back_when_p95_over_budget(self, clock):
+        router = make_router()
+        record(router, "reel", "standard", 15.0)
+
+        assert router.route("reel").tier == "fast"
+
+    def test_chained_fallback(self, clock):
+        router = make_router()
+        record(router, "reel", "standard", 15.0)
+        record(router, "reel", "fast", 12.0)
+
+        assert router.route("reel") == ModelRoute("reel", "tiny", "smallest")
+
+    def test_needs_min_samples(self, clock):
+        router = make_router()
+        record(router, "reel", "standard", 15.0, count=4)
+
+        assert router.route("reel").tier == "standard"
+
+    def test_p95_ignores_single_outlier(self, clock):
+        router = make_router()
+        record(router, "reel", "standard", 2.0, count=19)
+        record(router, "reel", "standard", 60.0, count=1)
+
+        assert router.p95("reel", "standard") == 2.0
+        assert router.route("reel").tier == "standard"
+
+    def test_latency_is_per_task(self, clock):
+        router = make_router()
+        record(router, "card", "fast", 15.0)
+
+        assert router.route("reel").tier == "standard"
+
+    def test_cycle_guard(self, clock):
+        router = make_router(fallbacks={"standard": "fast", "fast": "standard"})
+        record(router, "reel", "standard", 15.0)
+        record(router, "reel", "fast", 15.0)
+
+        assert router.route("reel").tier == "fast"
+
+    def test_unknown_fallback_tier_ignored(self, clock):
+        router = make_router(fallbacks={"standard": "missing"})
+        record(router, "reel", "standard", 15.0)
+
+        assert router.route("reel").tier == "standard"
+
+    def test_recovers_after_window(self, clock):
+        router = make_router()
+        record(router, "reel", "standard", 15.0)
+        assert router.route("reel").tier == "fast"
+
+        clock.now += 301
+        assert router.route("reel").tier == "standard"
+
+
+class TestRecord:
+    """record()"""
+
+    def test_pinned_model_not_recorded(self, clock):
+        router = make_router()
+        for _ in range(5):
+            router.record(ModelRoute("reel", "", "pinned"), 15.0)
+
+        assert router.route("reel").tier == "standard"
+
+    def test_logs_only_on_transition(self, clock, caplog):
+        router = make_router()
+        record(router, "reel", "standard", 15.0)
+
+        with caplog.at_level("INFO", logger=model_router.__name__):
+            router.route("reel")
+            router.route("reel")
+            clock.now += 301
+            router.route("reel")
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert sum("대체 등급 사용" in m for m in messages) == 1
+        assert sum("지연 회복" in m for m in messages) == 1
@@ -0,0 +1 @@
+"""서비스 테스트"""
@@ -0,0 +1,185 @@
+"""
+콘텐츠 생성 서비스 테스트 (OpenAI 호출은 가짜 클라이언트로 대체)
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.exceptions import ContentGenerationError
+from src.integrations.llm_cache import LLMCache
+from src.integrations.model_router import ModelRouter
+from src.schemas.content import DEFAULT_VOICE, MAX_HASHTAGS, MAX_SUBTITLES
+from src.services import content_service
+from src.services.content_service import ContentService, SceneStreamParser, parse_content
+
+CONTENT = {
+    "title": "커피 이야기",
+    "search_keyword": "coffee",
+    "scenes": [
+        {"narration": "커피 좋아하세요? {진짜}", "image_query": "coffee cup"},
+        {"narration": "원두는 세 가지입니다.", "image_query": "coffee beans"},
+        {"narration": "팔로우하세요!", "image_query": "barista"},
+    ],
+    "voice": "rachel",
+    "voice_reason": "차분함",
+    "subtitles": ["커피 좋아하세요?"],
+    "hashtags": ["#커피", "원두", "#커피"],
+}
+CONTENT_JSON = json.dumps(CONTENT, ensure_ascii=False)
+
+
+class TestSceneStreamParser:
+    """스트리밍 응답에서 장면 꺼내기"""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, len(CONTENT_JSON)])
+    def test_split_chunks(self, size):
+        parser = SceneStreamParser()
+        scenes = []
+        for i in range(0, len(CONTENT_JSON), size):
+            scenes += parser.feed(CONTENT_JSON[i:i + size])
+
+        assert [index for index, _ in scenes] == [0, 1, 2]
+        assert [scene.narration for _, scene in scenes] == [s["narration"] for s in CONTENT["scenes"]]
+
+    def test_scene_reported_as_soon_as_closed(self):
+        parser = SceneStreamParser()
+        first_scene_end = CONTENT_JSON.index('"coffee cup"}') + len('"coffee cup"}')
+
+        assert parser.feed(CONTENT_JSON[:first_scene_end - 1]) == []
+        assert [index for index, _ in parser.feed(CONTENT_JSON[first_scene_end - 1:first_scene_end])] == [0]
+
+    def test_invalid_scene_skipped(self):
+        parser = SceneStreamParser()
+        scenes = parser.feed('{"scenes": [{"narration": ""}, {"narration": "둘째"}, ')
+
+        assert [(index, scene.narration) for index, scene in scenes] == [(0, "둘째")]
+
+    def test_no_scenes_key_yet(self):
+        assert SceneStreamParser().feed('{"title": "제목", "sce') == []
+
+
+class TestParseContent:
+    """parse_content()와 스키마 보정"""
+
+    def test_code_fence_and_prose(self):
+        content = parse_content(f"결과입니다:\n```json\n{CONTENT_JSON}\n```\n끝")
+        assert content.title == "커피 이야기"
+
+    def test_skips_braces_before_json(self):
+        content = parse_content("{잘못된} " + CONTENT_JSON)
+        assert len(content.scenes) == 3
+
+    def test_normalizes_fields(self):
+        content = parse_content(CONTENT_JSON)
+
+        assert content.voice == "Rachel"
+        assert content.hashtags == ["#커피", "#원두"]
+
+    def test_fills_missing_fields(self):
+        content = parse_content(json.dumps({
+            "scenes": [{"narration": "하나", "image_query": "sky"}, {"narration": "둘"}],
+            "voice": "Unknown",
+        }))
+
+        assert content.voice == DEFAULT_VOICE
+        assert content.search_keyword == "sky"
+        assert content.scenes[1].image_query == "sky"
+        assert content.subtitles == ["하나", "둘"]
+        assert content.narration == "하나\n둘"
+
+    def test_limits_lists(self):
+        content = parse_content(json.dumps({
+            "scenes": [{"narration": f"장면 {i}"} for i in range(8)],
+            "hashtags": " ".join(f"#태그{i}" for i in range(20)),
+        }))
+
+        assert len(content.subtitles) == MAX_SUBTITLES
+        assert len(content.hashtags) == MAX_HASHTAGS
+
+    @pytest.mark.parametrize("text", ["JSON이 없습니다", "[1, 2]", '{"scenes": []}', '{"title": "장면 없음"}'])
+    def test_invalid(self, text):
+        with pytest.raises(ContentGenerationError):
+            parse_content(text)
+
+
+class FakeOpenAI:
+    """응답 텍스트를 차례로 돌려주는 chat.completions 대역"""
+
+    def __init__(self, replies: list[str]):
+        self.replies = list(replies)
+        self.requests: list[dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **request):
+        self.requests.append({**request, "messages": list(request["messages"])})
+        message = SimpleNamespace(content=self.replies.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = ModelRouter({"standard": "big-model"}, {}, {}, {})
+    monkeypatch.setattr(content_service, "get_model_router", lambda: router)
+    return router
+
+
+def use_openai(monkeypatch, replies: list[str], cache: LLMCache | None = None) -> FakeOpenAI:
+    client = FakeOpenAI(replies)
+    monkeypatch.setattr(content_service, "get_openai_client", lambda api_key=None: client)
+    monkeypatch.setattr(content_service, "get_llm_cache", lambda: cache)
+    return client
+
+
+class TestGenerateReelContent:
+    """ContentService.generate_reel_content()"""
+
+    def test_single_request(self, monkeypatch, router):
+        client = use_openai(monkeypatch, [CONTENT_JSON])
+
+        content = ContentService().generate_reel_content("커피")
+
+        assert len(content.scenes) == 3
+        assert len(client.requests) == 1
+        assert client.requests[0]["model"] == "big-model"
+        assert client.requests[0]["response_format"] == {"type": "json_object"}
+
+    def test_repairs_once(self, monkeypatch, router):
+        client = use_openai(monkeypatch, ["형식이 틀린 응답", CONTENT_JSON])
+
+        content = ContentService().generate_reel_content("커피")
+
+        assert content.title == "커피 이야기"
+        assert len(client.requests) == 2
+        assert client.requests[1]["messages"][-2] == {"role": "assistant", "content": "형식이 틀린 응답"}
+
+    def test_gives_up_after_repair(self, monkeypatch, router):
+        use_openai(monkeypatch, ["틀림", "또 틀림"])
+
+        with pytest.raises(ContentGenerationError):
+            ContentService().generate_reel_content("커피")
+
+    def test_empty_keyword(self, monkeypatch, router):
+        use_openai(monkeypatch, [])
+
+        with pytest.raises(ValueError, match="키워드는 필수입니다"):
+            ContentService().generate_reel_content("  ")
+
+    def test_cache_hit_skips_api(self, monkeypatch, router):
+        cache = LLMCache(16, {content_service.TASK: 3600})
+        client = use_openai(monkeypatch, [CONTENT_JSON], cache)
+
+        first = ContentService().generate_reel_content("커피")
+        second = ContentService().generate_reel_content("커피")
+
+        assert second == first
+        assert len(client.requests) == 1
+
+    def test_explicit_model_bypasses_router(self, monkeypatch, router):
+        client = use_openai(monkeypatch, [CONTENT_JSON])
+
+        ContentService(model="pinned-model").generate_reel_content("커피")
+
+        assert client.requests[0]["model"] == "pinned-model"
+        assert router.p95(content_service.TASK, "standard") is None
@@ -0,0 +1,232 @@
+"""
+MediaService 테스트 (공급자 API 대신 가짜 클라이언트 + 로컬 이미지 서버)
+"""
+
+import asyncio
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.core.config import settings
+from src.services.media_service import ImageDownloader, MediaPlanner, query_key
+
+IMAGE_SIZE = (64, 64)
+
+
+def png_bytes() -> bytes:
+    """압축이 잘 안 되는 작은 PNG (크기가 일정)"""
+    pixels = np.random.default_rng(0).integers(0, 255, (*IMAGE_SIZE, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class ImageServer(ThreadingHTTPServer):
+    """모든 경로에 같은 PNG를 조금 늦게 응답하고 동시 요청 수를 기록하는 서버"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.image = png_bytes()
+        self.paths: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.paths.append(self.path)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+
+        time.sleep(0.05)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(server.image)))
+        self.end_headers()
+        self.wfile.write(server.image)
+
+        with server.lock:
+            server.active -= 1
+
+
+class FakePhotoClient:
+    """검색어마다 정해진 사진 목록을 돌려주는 공급자 클라이언트"""
+
+    provider = "fake"
+
+    def __init__(self, base_url: str, results: dict[str, list[str]]):
+        self.base_url = base_url
+        self.results = results
+        self.searches: list[str] = []
+        self.page_sizes: list[int] = []
+
+    async def asearch_photos(self, query, per_page=10, orientation=None):
+        self.searches.append(query)
+        self.page_sizes.append(per_page)
+        await asyncio.sleep(0)
+        return [{"id": photo_id} for photo_id in self.results.get(query, [])][:per_page]
+
+    def rendition_url(self, photo, width, height):
+        return f"{self.base_url}/{photo['id']}.png"
+
+
+@pytest.fixture
+def image_server(work_dirs, monkeypatch):
+    monkeypatch.setattr(settings, "IMAGE_SEARCH_CACHE_TTL", 0)
+    monkeypatch.setattr(settings, "IMAGE_CACHE_MAX_MB", 0)
+
+    server = ImageServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestMediaPlannerJobLimits:
+    """장면별 다운로드가 작업 하나의 제한을 함께 사용"""
+
+    def test_concurrency_limit_spans_scenes(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {
+            "coffee": ["c1", "c2"], "tea": ["t1", "t2"], "cake": ["k1", "k2"],
+        })
+        downloader = ImageDownloader(max_concurrency=1)
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE, downloader=downloader)
+
+        paths = asyncio.run(planner.plan(["coffee", "tea", "cake"]))
+
+        assert all(path is not None for path in paths)
+        assert image_server.peak == 1
+
+    def test_byte_budget_spans_scenes(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {
+            "coffee": ["c1"], "tea": ["t1"], "cake": ["k1"],
+        })
+        image_bytes = len(image_server.image)
+        downloader = ImageDownloader(max_concurrency=1, max_job_bytes=2 * image_bytes)
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE, downloader=downloader)
+
+        paths = asyncio.run(planner.plan(["coffee", "tea", "cake"]))
+
+        assert sum(path is not None for path in paths) == 2
+        assert planner.job.budget.used <= 2 * image_bytes
+
+    def test_job_is_shared_with_extra_downloads(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {"coffee": ["c1"]})
+        image_bytes = len(image_server.image)
+        downloader = ImageDownloader(max_concurrency=1, max_job_bytes=image_bytes)
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE, downloader=downloader)
+
+        async def main():
+            scene_paths = await planner.plan(["coffee"])
+            extra_paths = await downloader.adownload(
+                [f"{image_server.base_url}/extra.png"], tmp_path / "images", job=planner.job
+            )
+            return scene_paths, extra_paths
+
+        scene_paths, extra_paths = asyncio.run(main())
+
+        assert scene_paths[0] is not None
+        assert extra_paths == [None]  # 장면 다운로드가 예산을 다 씀
+
+
+class TestQueryKey:
+    """query_key() 검색어 묶기"""
+
+    def test_ignores_case_order_stopwords_and_plurals(self):
+        assert query_key("Cup of coffee") == query_key("coffee cups") == "coffee cup"
+
+    def test_keeps_short_words_and_double_s(self):
+        assert query_key("bus glass") == "bus glass"
+
+    def test_different_subjects_differ(self):
+        assert query_key("morning coffee") != query_key("evening tea")
+
+    def test_only_stopwords_falls_back(self):
+        assert query_key("The") == "the"
+
+
+class TestMediaPlannerAssignment:
+    """장면별 사진 배정"""
+
+    def test_similar_queries_share_one_search(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {"cup of coffee": ["c1", "c2", "c3", "c4"]})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        asyncio.run(planner.plan(["cup of coffee", "Coffee cups"]))
+
+        assert client.searches == ["cup of coffee"]
+
+    def test_scenes_get_distinct_photos(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {"coffee": ["c1", "c2", "c3", "c4", "c5", "c6"]})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        paths = asyncio.run(planner.plan(["coffee", "coffee", "coffee"]))
+
+        assert all(path is not None for path in paths)
+        assert len(set(image_server.paths)) == len(image_server.paths)  # 같은 사진을 두 번 받지 않음
+        # 장면마다 고른 사진 하나만 사용 중으로 남고, 함께 받았던 후보는 반납
+        assert len(planner._used) == 3
+
+    def test_runs_out_of_photos(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {"coffee": ["c1"]})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        paths = asyncio.run(planner.plan(["coffee", "coffee"]))
+
+        assert sum(path is not None for path in paths) == 1
+
+    def test_empty_query_gets_no_photo(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        assert asyncio.run(planner.plan([""])) == [None]
+        assert client.searches == []
+
+    def test_streamed_scenes_grow_shared_search(self, image_server, tmp_path):
+        photos = [f"c{i}" for i in range(12)]
+        client = FakePhotoClient(image_server.base_url, {"coffee": photos})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        async def main():
+            # 스트리밍 대본처럼 장면이 하나씩 도착 (묶음 크기를 미리 모름)
+            return await asyncio.gather(*(planner.schedule(i, "coffee") for i in range(4)))
+
+        paths = asyncio.run(main())
+
+        assert all(path is not None for path in paths)
+        assert client.page_sizes == [6, 12]  # 4번째 장면이 합류하면서 후보를 늘려 다시 검색
+        assert len(set(image_server.paths)) == len(image_server.paths)
+
+    def test_waits_for_released_candidates(self, image_server, tmp_path):
+        client = FakePhotoClient(image_server.base_url, {"coffee": [f"c{i}" for i in range(6)]})
+        planner = MediaPlanner(client, tmp_path / "images", IMAGE_SIZE)
+
+        paths = asyncio.run(planner.plan(["coffee"] * 4))
+
+        # 앞 세 장면이 후보 6장을 모두 잡아도 4번째 장면은 반납된 후보를 받음
+        assert all(path is not None for path in paths)
+        assert len(planner._used) == 4  # 장면마다 서로 다른 사진
+        assert client.searches == ["coffee"]
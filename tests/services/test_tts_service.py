@@ -0,0 +1,128 @@
+"""
+TTSService 테스트 (ElevenLabs 호출 없음)
+"""
+
+import asyncio
+import shutil
+import time
+
+import pytest
+
+from src.services import tts_service
+from src.services.tts_service import DECK_SEPARATOR, TTSCache, TTSService, deck_split_points
+from src.utils.cache import DiskLRUCache
+
+
+class SlowRedis:
+    """응답이 느린 Redis 대역"""
+
+    def __init__(self, data: bytes, delay: float):
+        self.data = data
+        self.delay = delay
+
+    def get(self, key):
+        time.sleep(self.delay)
+        return self.data
+
+    def set(self, key, value, ex=None):
+        time.sleep(self.delay)
+
+
+@pytest.fixture
+def slow_cache(tmp_path, monkeypatch):
+    disk = DiskLRUCache(tmp_path / "tts", max_bytes=1024 * 1024, suffix=".mp3")
+    cache = TTSCache(disk, SlowRedis(b"mp3", 0.2))
+    monkeypatch.setattr(tts_service, "get_tts_cache", lambda timestamps=False: cache)
+    return cache
+
+
+def run_with_ticker(coro) -> tuple:
+    """코루틴을 실행하는 동안 10ms마다 도는 태스크의 실행 횟수도 함께 반환"""
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        result = await coro
+        task.cancel()
+        return result
+
+    result = asyncio.run(main())
+    return result, ticks
+
+
+class TestCacheOffLoop:
+    """캐시 조회/복사가 이벤트 루프를 막지 않음"""
+
+    def test_slow_redis_does_not_block_loop(self, slow_cache, tmp_path):
+        path, ticks = run_with_ticker(TTSService().asynthesize_stream("안녕하세요", tmp_path / "out.mp3"))
+
+        assert path.read_bytes() == b"mp3"
+        assert ticks >= 10
+
+    def test_slow_copy_does_not_block_loop(self, tmp_path, monkeypatch):
+        service = TTSService()
+        cache = TTSCache(DiskLRUCache(tmp_path / "tts", max_bytes=1024 * 1024, suffix=".mp3"))
+        cache.put(TTSCache.key(service._request("안녕하세요")), b"mp3")
+        monkeypatch.setattr(tts_service, "get_tts_cache", lambda timestamps=False: cache)
+
+        copyfile = shutil.copyfile
+
+        def slow_copyfile(src, dst):
+            time.sleep(0.2)
+            return copyfile(src, dst)
+
+        monkeypatch.setattr(shutil, "copyfile", slow_copyfile)
+
+        path, ticks = run_with_ticker(service.asynthesize_stream("안녕하세요", tmp_path / "out.mp3"))
+
+        assert path.read_bytes() == b"mp3"
+        assert ticks >= 10
+
+
+def alignment(text: str, seconds_per_char: float = 0.1) -> dict:
+    """글자마다 seconds_per_char씩 걸리는 시각 정보 (구분자 구간도 포함)"""
+    starts = [i * seconds_per_char for i in range(len(text))]
+    return {
+        "characters": list(text),
+        "character_start_times_seconds": starts,
+        "character_end_times_seconds": [start + seconds_per_char for start in starts],
+    }
+
+
+class TestDeckSplitPoints:
+    """deck_split_points() 카드 경계 시각"""
+
+    def test_boundary_is_middle_of_pause(self):
+        texts = ["가나", "다라마", "바"]
+        points = deck_split_points(texts, alignment(DECK_SEPARATOR.join(texts)))
+
+        # "나"(1번) 끝 0.2초와 "다"(4번) 시작 0.4초의 중간, "마"(6번) 끝 0.7초와 "바"(9번) 시작 0.9초의 중간
+        assert points == pytest.approx([0.0, 0.3, 0.8])
+
+    def test_single_text(self):
+        assert deck_split_points(["가나다"], alignment("가나다")) == [0.0]
+
+    def test_length_mismatch_uses_ratio(self):
+        texts = ["가나", "다라"]
+        joined = DECK_SEPARATOR.join(texts)
+        # 공급자가 글자를 두 배로 쪼갠 경우
+        points = deck_split_points(texts, alignment(joined * 2, seconds_per_char=0.05))
+
+        assert len(points) == 2
+        assert 0.1 <= points[1] <= 0.4
+
+    def test_points_never_go_backwards(self):
+        texts = ["가", "나", "다"]
+        data = alignment(DECK_SEPARATOR.join(texts))
+        data["character_start_times_seconds"][6] = 0.0  # 잘못된 시각
+        data["character_end_times_seconds"][3] = 0.0
+
+        points = deck_split_points(texts, data)
+
+        assert points == sorted(points)
@@ -0,0 +1,180 @@
+"""
+VideoService 렌더링 테스트 (ffmpeg 필요)
+"""
+
+import re
+import shutil
+import subprocess
+
+import pytest
+from PIL import Image
+
+from src.core.config import settings
+from src.core.exceptions import VideoRenderError
+from src.services import video_service
+from src.services.video_service import STILL_IMAGE_X264_PARAMS, Scene, VideoService
+from src.utils.cache import DiskLRUCache
+from src.utils.motion import Motion
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg 필요")
+
+SPS_NAL_TYPE = 7
+
+
+def decode_info(path) -> str:
+    """영상을 끝까지 디코딩한 ffmpeg 로그 (스트림 정보 + 프레임 수)"""
+    return subprocess.run(
+        ["ffmpeg", "-i", str(path), "-map", "0:v", "-f", "null", "-"],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stderr
+
+
+def frame_count(log: str) -> int:
+    return int(re.findall(r"frame=\s*(\d+)", log)[-1])
+
+
+def sps_units(path) -> set[bytes]:
+    """영상의 H.264 스트림에 들어 있는 서로 다른 SPS NAL 유닛"""
+    annexb = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(path), "-map", "0:v", "-c:v", "copy",
+         "-bsf:v", "h264_mp4toannexb", "-f", "h264", "-"],
+        check=True,
+        capture_output=True
+    ).stdout
+
+    units = set()
+    for unit in annexb.split(b"\x00\x00\x01")[1:]:
+        unit = unit.rstrip(b"\x00")
+        if unit and unit[0] & 0x1F == SPS_NAL_TYPE:
+            units.add(unit)
+    return units
+
+
+@pytest.fixture
+def images(tmp_path):
+    """출력과 비율이 다른 단색 이미지 세 장"""
+    paths = []
+    for color in ("red", "green", "blue"):
+        path = tmp_path / f"{color}.png"
+        Image.new("RGB", (300, 200), color).save(path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def narration(tmp_path):
+    path = tmp_path / "voice.wav"
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "sine=frequency=440:duration=3", "-ac", "2", str(path)],
+        check=True
+    )
+    return str(path)
+
+
+@pytest.fixture
+def service(work_dirs, monkeypatch):
+    monkeypatch.setattr(settings, "SEGMENT_CACHE_MAX_MB", 0)
+    return VideoService(width=160, height=288, fps=10)
+
+
+@pytest.fixture
+def cards():
+    return [Image.new("RGB", (160, 288), color) for color in ("red", "green", "blue")]
+
+
+class TestSinglePassRender:
+    """장면/자막/음성을 한 번에 인코딩"""
+
+    def test_one_encoder_for_whole_reel(self, images, tmp_path):
+        service = VideoService(width=160, height=288, fps=10)
+        cmd = service.build_command(
+            [Scene(path, 1.0) for path in images], tmp_path / "reel.mp4", subtitles_path=tmp_path / "sub.srt"
+        )
+
+        assert cmd.count("-c:v") == 1
+        assert cmd.count("-filter_complex") == 1
+        assert "subtitles=" in cmd[cmd.index("-filter_complex") + 1]
+
+    def test_render_scenes_with_narration(self, images, narration, tmp_path):
+        service = VideoService(width=160, height=288, fps=10)
+        output = tmp_path / "reel.mp4"
+        scenes = [Scene(images[0], 0.5), Scene(images[1], 1.0), Scene(images[2], 0.5)]
+
+        service.render(scenes, output, audio_path=narration)
+
+        log = decode_info(output)
+        assert "160x288" in log
+        assert "Audio:" in log
+        assert frame_count(log) == 20  # 음성이 더 길어도 장면 길이 합(2초)에서 끝남
+
+    def test_scene_audio_must_cover_all_scenes(self, images, narration, tmp_path):
+        service = VideoService(width=160, height=288, fps=10)
+        scenes = [Scene(images[0], 1.0, narration), Scene(images[1], 1.0)]
+
+        with pytest.raises(VideoRenderError):
+            service.build_command(scenes, tmp_path / "reel.mp4")
+
+    def test_scene_audio_and_narration_are_exclusive(self, images, narration, tmp_path):
+        service = VideoService(width=160, height=288, fps=10)
+        scenes = [Scene(images[0], 1.0, narration)]
+
+        with pytest.raises(VideoRenderError):
+            service.build_command(scenes, tmp_path / "reel.mp4", audio_path=narration)
+
+    def test_no_scenes(self, tmp_path):
+        with pytest.raises(VideoRenderError):
+            VideoService().build_command([], tmp_path / "reel.mp4")
+
+
+class TestRenderSegments:
+    """세그먼트를 스트림 복사로 이어붙인 결과"""
+
+    def test_static_deck_with_transitions_has_single_sps(self, service, cards, tmp_path):
+        """정지 덱의 본문/전환 세그먼트가 같은 인코더 설정을 사용"""
+        output = tmp_path / "deck.mp4"
+        scenes = [Scene(image=card, duration=1.0) for card in cards]
+
+        service.render_segments(scenes, output, transition="fade")
+
+        assert len(sps_units(output)) == 1
+
+    def test_mixed_deck_with_transitions_has_single_sps(self, service, cards, tmp_path):
+        """움직임 장면이 섞이면 모든 세그먼트가 기본 설정을 사용"""
+        output = tmp_path / "mixed.mp4"
+        scenes = [
+            Scene(image=cards[0], duration=1.0),
+            Scene(image=cards[1], duration=1.0, motion=Motion()),
+            Scene(image=cards[2], duration=1.0),
+        ]
+
+        service.render_segments(scenes, output, transition="fade")
+
+        assert len(sps_units(output)) == 1
+
+
+    def test_cache_hits_survive_eviction_before_concat(self, service, cards, tmp_path, monkeypatch):
+        """캐시에서 가져온 세그먼트가 이어붙이기 전에 정리돼도 렌더링 성공"""
+        cache = DiskLRUCache(tmp_path / "segments", max_bytes=64 * 1024 * 1024, suffix=".mp4")
+        monkeypatch.setattr(settings, "SEGMENT_CACHE_MAX_MB", 64)
+        monkeypatch.setattr(video_service, "_segment_cache", cache)
+        scenes = [Scene(image=card, duration=1.0) for card in cards]
+
+        service.render_segments(scenes[:2], tmp_path / "first.mp4")
+        cache.max_bytes = 1  # 새 세그먼트를 저장할 때 앞서 적중한 세그먼트까지 모두 정리
+        service.render_segments(scenes, tmp_path / "second.mp4")
+
+        assert frame_count(decode_info(tmp_path / "second.mp4")) == 30
+        assert not list(cache.root.glob("*/*.mp4"))
+
+class TestBuildTransitionCommand:
+    """전환 세그먼트 인코더 설정"""
+
+    def test_static_transition_uses_still_profile(self, service):
+        cmd = service.build_transition_command("fade", 0.5, "out.mp4")
+        assert STILL_IMAGE_X264_PARAMS in cmd
+
+    def test_still_encode_overrides_profile(self, service):
+        cmd = service.build_transition_command("fade", 0.5, "out.mp4", still_encode=False)
+        assert STILL_IMAGE_X264_PARAMS not in cmd
@@ -0,0 +1 @@
+"""유틸리티 테스트"""
@@ -0,0 +1,146 @@
+"""
+오디오 트랙 조립 테스트 (디코딩은 가짜 PCM으로 대체)
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from src.core.exceptions import VideoRenderError
+from src.utils import audio_utils
+from src.utils.audio_utils import (
+    CHANNELS,
+    SAMPLE_RATE,
+    assemble_audio_track,
+    split_audio_track,
+)
+
+
+def pcm(values: np.ndarray) -> bytes:
+    """샘플 값 배열 → 스테레오 s16le PCM (두 채널 같은 값)"""
+    return np.repeat(values.astype(np.int16), CHANNELS).tobytes()
+
+
+def read_samples(path) -> np.ndarray:
+    """WAV의 첫 채널 샘플"""
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnchannels() == CHANNELS
+        data = wav.readframes(wav.getnframes())
+    return np.frombuffer(data, dtype=np.int16).reshape(-1, CHANNELS)[:, 0]
+
+
+@pytest.fixture
+def decoded(monkeypatch):
+    """파일 이름 → 디코딩 결과 PCM (없는 이름은 디코딩 실패)"""
+    pieces: dict[str, bytes] = {}
+
+    def decode_pcm(path):
+        if str(path) not in pieces:
+            raise VideoRenderError(f"디코딩 실패: {path}")
+        return pieces[str(path)]
+
+    monkeypatch.setattr(audio_utils, "decode_pcm", decode_pcm)
+    return pieces
+
+
+class TestAssembleAudioTrack:
+    """assemble_audio_track() 샘플 경계"""
+
+    def test_lengths_follow_pieces(self, decoded, tmp_path):
+        decoded.update({"a.mp3": pcm(np.full(1000, 1)), "b.mp3": pcm(np.full(500, 2))})
+        track = assemble_audio_track(["a.mp3", "b.mp3"], tmp_path / "track.wav")
+
+        samples = read_samples(track.path)
+        assert len(samples) == 1500
+        assert (samples[:1000] == 1).all() and (samples[1000:] == 2).all()
+        assert track.offsets == [0.0, 1000 / SAMPLE_RATE]
+        assert track.duration == pytest.approx(1500 / SAMPLE_RATE)
+
+    def test_durations_pad_and_trim(self, decoded, tmp_path):
+        decoded.update({"a.mp3": pcm(np.full(SAMPLE_RATE, 1)), "b.mp3": pcm(np.full(SAMPLE_RATE // 4, 2))})
+        track = assemble_audio_track(["a.mp3", "b.mp3"], tmp_path / "track.wav", durations=[0.5, 0.5])
+
+        samples = read_samples(track.path)
+        half = SAMPLE_RATE // 2
+        assert len(samples) == SAMPLE_RATE
+        assert (samples[:half] == 1).all()                           # 긴 조각은 잘림
+        assert (samples[half:half + SAMPLE_RATE // 4] == 2).all()
+        assert (samples[half + SAMPLE_RATE // 4:] == 0).all()        # 짧은 조각은 무음 채움
+        assert track.durations == [0.5, 0.5]
+
+    def test_frame_rate_rounds_up_to_frames(self, decoded, tmp_path):
+        # 0.5초 + 1샘플 → 30fps 16프레임 (0.5333초)
+        decoded.update({
+            "a.mp3": pcm(np.full(SAMPLE_RATE // 2 + 1, 1)),
+            "b.mp3": pcm(np.full(SAMPLE_RATE // 3, 2)),
+        })
+        track = assemble_audio_track(["a.mp3", "b.mp3"], tmp_path / "track.wav", frame_rate=30)
+
+        assert track.durations[0] == pytest.approx(16 / 30, abs=1 / SAMPLE_RATE)
+        assert track.durations[1] == pytest.approx(10 / 30, abs=1 / SAMPLE_RATE)
+
+    def test_boundaries_do_not_accumulate_error(self, decoded, tmp_path):
+        # 1/30초 조각 300개: 조각마다 반올림하면 어긋나지만 누적 시각 기준이면 정확히 10초
+        count = 300
+        decoded["empty.mp3"] = b""
+        track = assemble_audio_track(
+            ["empty.mp3"] * count, tmp_path / "track.wav", durations=[1 / 30] * count
+        )
+
+        assert len(read_samples(track.path)) == 10 * SAMPLE_RATE
+        assert track.offsets[150] == pytest.approx(5.0)
+
+    def test_failed_piece_becomes_silence(self, decoded, tmp_path):
+        decoded["b.mp3"] = pcm(np.full(100, 3))
+        track = assemble_audio_track(
+            ["broken.mp3", "b.mp3"], tmp_path / "track.wav", fallback_duration=200 / SAMPLE_RATE
+        )
+
+        samples = read_samples(track.path)
+        assert (samples[:200] == 0).all() and (samples[200:] == 3).all()
+
+    def test_failed_piece_raises_without_fallback(self, decoded, tmp_path):
+        with pytest.raises(VideoRenderError):
+            assemble_audio_track(["broken.mp3"], tmp_path / "track.wav")
+
+
+class TestSplitAudioTrack:
+    """split_audio_track() 자르기 위치"""
+
+    @pytest.fixture
+    def ramp(self, monkeypatch):
+        values = np.arange(SAMPLE_RATE) % 30000
+        monkeypatch.setattr(audio_utils, "decode_pcm", lambda path: pcm(values))
+        return values
+
+    def test_cuts_at_start_times(self, ramp, tmp_path):
+        track = split_audio_track("deck.mp3", [0.0, 0.25, 0.6], tmp_path / "track.wav")
+
+        cuts = [0, round(0.25 * SAMPLE_RATE), round(0.6 * SAMPLE_RATE), SAMPLE_RATE]
+        assert track.offsets == pytest.approx([cut / SAMPLE_RATE for cut in cuts[:-1]])
+        assert (read_samples(track.path) == ramp).all()
+
+    def test_first_start_is_always_zero(self, ramp, tmp_path):
+        track = split_audio_track("deck.mp3", [0.1, 0.5], tmp_path / "track.wav")
+
+        assert track.offsets[0] == 0.0
+        assert track.durations[0] == pytest.approx(0.5)
+
+    def test_starts_past_end_are_clamped(self, ramp, tmp_path):
+        track = split_audio_track("deck.mp3", [0.0, 0.5, 2.0], tmp_path / "track.wav")
+
+        assert track.durations == pytest.approx([0.5, 0.5, 0.0])
+
+    def test_frame_rate_pads_each_piece(self, ramp, tmp_path):
+        track = split_audio_track("deck.mp3", [0.0, 0.51], tmp_path / "track.wav", frame_rate=10)
+
+        # 0.51초 → 0.6초, 0.49초 → 0.5초 (뒤는 무음)
+        assert track.durations == pytest.approx([0.6, 0.5], abs=1 / SAMPLE_RATE)
+        samples = read_samples(track.path)
+        cut = round(0.51 * SAMPLE_RATE)
+        second = round(0.6 * SAMPLE_RATE)
+        assert (samples[:cut] == ramp[:cut]).all()
+        assert (samples[cut:second] == 0).all()
+        assert (samples[second:second + 10] == ramp[cut:cut + 10]).all()
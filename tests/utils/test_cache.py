@@ -0,0 +1,107 @@
+"""
+콘텐츠 해시 키와 디스크 LRU 캐시 테스트
+"""
+
+import os
+
+import pytest
+
+from src.utils.cache import DiskLRUCache, content_key, file_digest
+
+
+class TestContentKey:
+    """content_key()"""
+
+    def test_same_parts_same_key(self):
+        assert content_key("card", b"\x00\x01") == content_key("card", b"\x00\x01")
+
+    def test_str_and_bytes_are_equivalent(self):
+        assert content_key("카드") == content_key("카드".encode("utf-8"))
+
+    def test_part_boundaries_matter(self):
+        assert content_key("ab", "c") != content_key("a", "bc")
+
+    def test_file_digest_matches_content(self, tmp_path):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"x" * 3_000_000)
+        assert file_digest(path) == file_digest(path)
+        assert len(file_digest(path)) == 64
+
+
+class TestDiskLRUCache:
+    """DiskLRUCache 저장/조회/정리"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DiskLRUCache(tmp_path / "cache", max_bytes=250, suffix=".bin")
+
+    @staticmethod
+    def age(path, timestamp):
+        os.utime(path, (timestamp, timestamp))
+
+    def test_put_and_get(self, cache, tmp_path):
+        key = content_key("a")
+        stored = cache.put_bytes(key, b"hello")
+
+        assert cache.get(key) == stored
+        assert stored.read_bytes() == b"hello"
+        assert stored.suffix == ".bin"
+        assert cache.get(content_key("missing")) is None
+
+    def test_put_file_copy_and_move(self, cache, tmp_path):
+        source = tmp_path / "segment.mp4"
+        source.write_bytes(b"video")
+
+        copied = cache.put_file(content_key("copy"), source)
+        assert source.exists()
+
+        moved = cache.put_file(content_key("move"), source, move=True)
+        assert not source.exists()
+        assert copied.read_bytes() == moved.read_bytes() == b"video"
+
+    def test_link_survives_eviction(self, cache, tmp_path):
+        key = content_key("a")
+        cache.put_bytes(key, b"x" * 100)
+
+        linked = cache.link_to(key, tmp_path / "segment.bin")
+        cache.max_bytes = 0
+        cache.evict()
+
+        assert cache.get(key) is None
+        assert linked.read_bytes() == b"x" * 100
+
+    def test_link_missing_key(self, cache, tmp_path):
+        assert cache.link_to(content_key("missing"), tmp_path / "segment.bin") is None
+        assert not (tmp_path / "segment.bin").exists()
+
+    def test_evicts_least_recently_used(self, cache):
+        a, b, c = (content_key(name) for name in "abc")
+        self.age(cache.put_bytes(a, b"x" * 100), 1000)
+        self.age(cache.put_bytes(b, b"x" * 100), 2000)
+
+        cache.get(a)  # a를 최근 사용으로
+        cache.put_bytes(c, b"x" * 100)  # 300 > 250 → 가장 오래된 b 삭제
+
+        assert cache.get(a) is not None
+        assert cache.get(b) is None
+        assert cache.get(c) is not None
+
+    def test_evict_removes_only_what_is_needed(self, cache):
+        keys = [content_key(str(i)) for i in range(5)]
+        for i, key in enumerate(keys):
+            self.age(cache.put_bytes(key, b"x" * 50), 1000 + i)
+
+        cache.max_bytes = 120
+        removed = cache.evict()
+
+        assert removed == 3
+        assert [cache.path_for(key).exists() for key in keys] == [False, False, False, True, True]
+
+    def test_ignores_temporary_files(self, cache):
+        key = content_key("a")
+        path = cache.put_bytes(key, b"x" * 100)
+        tmp_file = path.with_name(f".{path.name}.1234.tmp")
+        tmp_file.write_bytes(b"x" * 1000)
+
+        assert cache.evict() == 0
+        assert path.exists()
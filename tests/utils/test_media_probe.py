@@ -0,0 +1,193 @@
+"""
+헤더 파싱 미디어 정보 조회 테스트 (ffprobe 없이)
+"""
+
+import struct
+import wave
+
+import pytest
+from PIL import Image
+
+from src.core.exceptions import MediaProbeError
+from src.utils import media_probe
+from src.utils.media_probe import probe_duration, probe_image_size
+
+# MPEG1 Layer III, 128kbps, 44.1kHz, 스테레오, 패딩 없음 → 프레임 417바이트
+MP3_HEADER = b"\xff\xfb\x90\x00"
+MP3_FRAME_LENGTH = 144 * 128000 // 44100
+MP3_FRAME_SECONDS = 1152 / 44100
+SIDE_INFO_SIZE = 32
+
+
+def mp3_frame(payload: bytes = b"") -> bytes:
+    body = payload.ljust(MP3_FRAME_LENGTH - 4, b"\x00")
+    return MP3_HEADER + body
+
+
+def id3_tag(size: int) -> bytes:
+    """ID3v2 헤더 + size바이트 태그 (크기는 싱크세이프 정수)"""
+    syncsafe = bytes([(size >> shift) & 0x7F for shift in (21, 14, 7, 0)])
+    return b"ID3\x04\x00\x00" + syncsafe + b"\x00" * size
+
+
+def box(box_type: bytes, payload: bytes) -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        payload = bytes([1, 0, 0, 0]) + b"\x00" * 16 + struct.pack(">IQ", timescale, duration)
+    else:
+        payload = bytes(4) + b"\x00" * 8 + struct.pack(">II", timescale, duration)
+    return box(b"mvhd", payload + b"\x00" * 80)
+
+
+@pytest.fixture(autouse=True)
+def no_ffprobe(monkeypatch):
+    """헤더 파싱이 실패하면 ffprobe 대신 바로 실패하도록"""
+    def fail(path):
+        raise MediaProbeError(f"ffprobe 사용됨: {path}")
+
+    monkeypatch.setattr(media_probe, "_ffprobe_duration", fail)
+
+
+class TestMp3Duration:
+    """MP3 길이 (CBR 프레임 순회, Xing/Info, VBRI)"""
+
+    def test_cbr_counts_frames(self, tmp_path):
+        path = tmp_path / "cbr.mp3"
+        path.write_bytes(mp3_frame() * 100)
+
+        assert probe_duration(path) == pytest.approx(100 * MP3_FRAME_SECONDS)
+
+    def test_cbr_after_id3_tag(self, tmp_path):
+        path = tmp_path / "tagged.mp3"
+        path.write_bytes(id3_tag(300) + mp3_frame() * 40)
+
+        assert probe_duration(path) == pytest.approx(40 * MP3_FRAME_SECONDS)
+
+    def test_cbr_estimates_after_broken_frame(self, tmp_path):
+        path = tmp_path / "broken.mp3"
+        path.write_bytes(mp3_frame() * 10 + b"\x00" * (MP3_FRAME_LENGTH * 10))
+
+        # 손상된 뒷부분은 비트레이트로 추정
+        assert probe_duration(path) == pytest.approx(
+            10 * MP3_FRAME_SECONDS + MP3_FRAME_LENGTH * 10 * 8 / 128000
+        )
+
+    @pytest.mark.parametrize("tag", [b"Xing", b"Info"])
+    def test_xing_header(self, tmp_path, tag):
+        xing = b"\x00" * SIDE_INFO_SIZE + tag + struct.pack(">II", 0x1, 5000)
+        path = tmp_path / "vbr.mp3"
+        path.write_bytes(mp3_frame(xing) + mp3_frame() * 3)
+
+        assert probe_duration(path) == pytest.approx(5000 * MP3_FRAME_SECONDS)
+
+    def test_vbri_header(self, tmp_path):
+        # VBRI: 헤더 뒤 32바이트, 버전/지연/품질(2바이트씩) + 바이트 수(4) 뒤에 프레임 수
+        vbri = b"\x00" * 32 + b"VBRI" + b"\x00" * 6 + struct.pack(">II", 123456, 2500)
+        path = tmp_path / "vbri.mp3"
+        path.write_bytes(mp3_frame(vbri) + mp3_frame() * 3)
+
+        assert probe_duration(path) == pytest.approx(2500 * MP3_FRAME_SECONDS)
+
+
+class TestMp4Duration:
+    """MP4 moov/mvhd"""
+
+    def test_mvhd_version_0(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(
+            box(b"ftyp", b"isom\x00\x00\x02\x00")
+            + box(b"mdat", b"\x00" * 1000)
+            + box(b"moov", box(b"udta", b"\x00" * 10) + mvhd(1000, 12345))
+        )
+
+        assert probe_duration(path) == pytest.approx(12.345)
+
+    def test_mvhd_version_1(self, tmp_path):
+        path = tmp_path / "video.mp4"
+        path.write_bytes(
+            box(b"ftyp", b"isom\x00\x00\x02\x00") + box(b"moov", mvhd(90000, 90000 * 3, version=1))
+        )
+
+        assert probe_duration(path) == pytest.approx(3.0)
+
+    def test_missing_moov_falls_back(self, tmp_path):
+        path = tmp_path / "partial.mp4"
+        path.write_bytes(box(b"ftyp", b"isom\x00\x00\x02\x00") + box(b"mdat", b"\x00" * 100))
+
+        with pytest.raises(MediaProbeError, match="ffprobe"):
+            probe_duration(path)
+
+
+class TestWavDuration:
+    """WAV fmt/data 청크"""
+
+    @staticmethod
+    def write_wav(path, frames: int, sample_rate: int = 44100, channels: int = 2):
+        with wave.open(str(path), "wb") as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(2)
+            wav.setframerate(sample_rate)
+            wav.writeframes(b"\x00" * frames * channels * 2)
+
+    def test_data_chunk(self, tmp_path):
+        path = tmp_path / "voice.wav"
+        self.write_wav(path, 22050)
+
+        assert probe_duration(path) == pytest.approx(0.5)
+
+    def test_streamed_size_uses_file_size(self, tmp_path):
+        path = tmp_path / "streamed.wav"
+        self.write_wav(path, 24000, sample_rate=24000, channels=1)
+
+        # 스트리밍으로 쓴 파일처럼 data 크기를 0xFFFFFFFF로
+        data = bytearray(path.read_bytes())
+        index = data.index(b"data")
+        data[index + 4:index + 8] = b"\xff\xff\xff\xff"
+        path.write_bytes(bytes(data))
+
+        assert probe_duration(path) == pytest.approx(1.0)
+
+    def test_skips_unknown_chunks(self, tmp_path):
+        path = tmp_path / "voice.wav"
+        self.write_wav(path, 44100)
+
+        # fmt 뒤에 홀수 크기 LIST 청크 삽입 (2바이트 정렬 패딩 포함)
+        data = path.read_bytes()
+        index = data.index(b"data")
+        extra = b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+        path.write_bytes(data[:index] + extra + data[index:])
+
+        assert probe_duration(path) == pytest.approx(1.0)
+
+
+class TestImageSize:
+    """PNG/JPEG 해상도"""
+
+    def test_png(self, tmp_path):
+        path = tmp_path / "image.png"
+        Image.new("RGB", (123, 45)).save(path)
+
+        assert probe_image_size(path) == (123, 45)
+
+    @pytest.mark.parametrize("progressive", [False, True])
+    def test_jpeg(self, tmp_path, progressive):
+        path = tmp_path / "image.jpg"
+        Image.new("RGB", (640, 360), "white").save(path, progressive=progressive)
+
+        assert probe_image_size(path) == (640, 360)
+
+    def test_other_format_uses_pillow(self, tmp_path):
+        path = tmp_path / "image.gif"
+        Image.new("RGB", (20, 10)).save(path)
+
+        assert probe_image_size(path) == (20, 10)
+
+    def test_not_an_image(self, tmp_path):
+        path = tmp_path / "image.jpg"
+        path.write_bytes(b"<html>not found</html>")
+
+        with pytest.raises(MediaProbeError):
+            probe_image_size(path)
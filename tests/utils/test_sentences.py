@@ -0,0 +1,65 @@
+"""
+한국어 문장 분할 테스트
+"""
+
+from src.utils.sentences import _split_long, sentence_chunks, split_sentences
+
+
+class TestSplitSentences:
+    """split_sentences()"""
+
+    def test_splits_on_punctuation(self):
+        assert split_sentences("안녕하세요. 반갑습니다! 잘 지내셨나요?") == [
+            "안녕하세요.", "반갑습니다!", "잘 지내셨나요?"
+        ]
+
+    def test_keeps_closing_quotes_and_repeated_marks(self):
+        assert split_sentences('그가 말했다 "정말요?" 네… 그래요!!') == [
+            '그가 말했다 "정말요?"', "네…", "그래요!!"
+        ]
+
+    def test_newlines_are_boundaries(self):
+        assert split_sentences("첫 줄\n\n  둘째   줄 ") == ["첫 줄", "둘째 줄"]
+
+    def test_decimal_point_is_not_boundary(self):
+        assert split_sentences("버전 3.5가 나왔습니다.") == ["버전 3.5가 나왔습니다."]
+
+
+class TestSentenceChunks:
+    """sentence_chunks()"""
+
+    def test_merges_short_sentences(self):
+        assert sentence_chunks("하나. 둘. 셋. 넷.", max_chars=8) == ["하나. 둘.", "셋. 넷."]
+
+    def test_never_exceeds_max_chars(self):
+        text = "오늘은 날씨가 정말 좋아서 공원에 산책을 갔고, 거기서 오랜만에 친구를 만났습니다. " * 5
+        chunks = sentence_chunks(text, max_chars=30)
+
+        assert all(len(chunk) <= 30 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_empty_text(self):
+        assert sentence_chunks("  \n ") == []
+
+
+class TestSplitLong:
+    """_split_long() 자르는 위치 우선순위"""
+
+    def test_short_sentence_unchanged(self):
+        assert _split_long("짧은 문장", 20) == ["짧은 문장"]
+
+    def test_prefers_comma(self):
+        sentence = "아침에는 커피를 마시고 빵을 먹었는데, 점심에는 국수를 먹었습니다"
+        assert _split_long(sentence, 30) == ["아침에는 커피를 마시고 빵을 먹었는데,", "점심에는 국수를 먹었습니다"]
+
+    def test_falls_back_to_connective_ending(self):
+        sentence = "아침에는 커피를 마시고 점심에는 국수를 먹었습니다"
+        assert _split_long(sentence, 20) == ["아침에는 커피를 마시고", "점심에는 국수를 먹었습니다"]
+
+    def test_comma_too_early_uses_later_break(self):
+        # 쉼표가 max_chars//3보다 앞이면 쉼표 대신 더 뒤쪽 위치에서 자름
+        sentence = "네, 아침에는 커피를 마시고 점심에는 국수를 먹었습니다"
+        assert _split_long(sentence, 24) == ["네, 아침에는 커피를 마시고", "점심에는 국수를 먹었습니다"]
+
+    def test_hard_cut_without_breaks(self):
+        assert _split_long("가" * 25, 10) == ["가" * 10, "가" * 10, "가" * 5]
@@ -0,0 +1,78 @@
+"""
+픽셀 폭 기준 텍스트 레이아웃 테스트
+"""
+
+from src.utils.text_layout import ELLIPSIS, GlyphAdvanceCache, layout_lines, wrap_text
+
+
+class FixedFont:
+    """모든 글자 폭이 10px인 가짜 폰트 (측정 횟수 기록)"""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def getlength(self, text: str) -> float:
+        self.calls.append(text)
+        return 10.0 * len(text)
+
+
+class TestGlyphAdvanceCache:
+    """글자 폭 캐시"""
+
+    def test_hangul_measured_once(self):
+        font = FixedFont()
+        glyphs = GlyphAdvanceCache(font)
+
+        assert glyphs.width("안녕하세요") == 50.0
+        assert font.calls == ["가"]
+
+    def test_other_chars_cached_per_char(self):
+        font = FixedFont()
+        glyphs = GlyphAdvanceCache(font)
+
+        glyphs.width("abca")
+        assert font.calls == ["a", "b", "c"]
+
+
+class TestWrapText:
+    """wrap_text()"""
+
+    def test_fills_lines_by_word(self):
+        assert wrap_text("aaa bbb ccc", FixedFont(), 75) == ["aaa bbb", "ccc"]
+
+    def test_exact_fit(self):
+        assert wrap_text("aaa bbb", FixedFont(), 70) == ["aaa bbb"]
+
+    def test_long_word_split_by_char(self):
+        assert wrap_text("abcdefghij", FixedFont(), 35) == ["abc", "def", "ghi", "j"]
+
+    def test_long_word_after_text(self):
+        assert wrap_text("ab abcdefgh", FixedFont(), 35) == ["ab", "abc", "def", "gh"]
+
+    def test_keeps_newlines(self):
+        assert wrap_text("가나\n다라 마바", FixedFont(), 100) == ["가나", "다라 마바"]
+
+    def test_hangul_width(self):
+        assert wrap_text("가나다 라마바 사아자", FixedFont(), 70) == ["가나다 라마바", "사아자"]
+
+    def test_max_lines_truncates(self):
+        assert wrap_text("aa bb cc dd", FixedFont(), 20, max_lines=2) == ["aa", "bb"]
+
+    def test_ellipsis_fits_width(self):
+        lines = wrap_text("aaa bbb ccc", FixedFont(), 30, max_lines=2, ellipsis=True)
+
+        assert lines == ["aaa", "bb" + ELLIPSIS]
+        assert all(len(line) * 10 <= 30 for line in lines)
+
+    def test_empty_text(self):
+        assert wrap_text("", FixedFont(), 100) == []
+
+
+class TestLayoutLines:
+    """layout_lines()"""
+
+    def test_centers_lines(self):
+        boxes = layout_lines(["ab", "abcd"], FixedFont(), 100, top=10, line_height=30)
+
+        assert [(box.x, box.y, box.width) for box in boxes] == [(40, 10, 20.0), (30, 40, 40.0)]
+        assert [box.text for box in boxes] == ["ab", "abcd"]
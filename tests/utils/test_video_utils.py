@@ -0,0 +1,62 @@
+"""
+ffmpeg 실행 헬퍼 테스트 (ffmpeg 필요)
+"""
+
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from src.core.exceptions import VideoRenderError
+from src.utils import video_utils
+from src.utils.video_utils import escape_filter_value, format_seconds, run_ffmpeg
+
+needs_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg 필요")
+
+NULL_OUTPUT = ["-f", "null", "-"]
+
+
+def rawvideo_cmd() -> list[str]:
+    return ["ffmpeg", "-v", "error", "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", "2x2", "-i", "-"] + NULL_OUTPUT
+
+
+@needs_ffmpeg
+class TestRunFFmpeg:
+    """표준입력 스트리밍 실행"""
+
+    def test_streams_frames(self):
+        result = run_ffmpeg(rawvideo_cmd(), stdin_chunks=[b"\x00" * 12] * 3)
+        assert result.returncode == 0
+
+    def test_failure_raises_render_error(self):
+        with pytest.raises(VideoRenderError):
+            run_ffmpeg(["ffmpeg", "-v", "error", "-f", "nonexistent_format", "-i", "-"] + NULL_OUTPUT, [b"x"])
+
+    def test_generator_error_kills_ffmpeg(self):
+        processes = []
+        popen = video_utils.subprocess.Popen
+
+        def tracking_popen(*args, **kwargs):
+            processes.append(popen(*args, **kwargs))
+            return processes[-1]
+
+        def frames():
+            yield b"\x00" * 12
+            raise OSError("이미지를 읽을 수 없음")
+
+        with patch.object(video_utils.subprocess, "Popen", tracking_popen):
+            with pytest.raises(OSError, match="이미지를 읽을 수 없음"):
+                run_ffmpeg(rawvideo_cmd(), stdin_chunks=frames())
+
+        assert processes[0].returncode is not None
+        assert processes[0].returncode != 0  # 정상 마무리가 아니라 종료됨
+
+
+class TestFilterHelpers:
+    """필터그래프 문자열 헬퍼"""
+
+    def test_escape_filter_value(self):
+        assert escape_filter_value("C:/a'b,c") == "C\\:/a\\'b\\,c"
+
+    def test_format_seconds(self):
+        assert format_seconds(1.23456) == "1.235"